@@ -6,66 +6,368 @@ merges them to main, force pushes, tags the commit, runs tests, and
 deploys to Firebase Hosting. It is intended to be run by an automation
 agent or CI job and assumes necessary credentials are already
 configured (Firebase CLI auth, SSH keys, etc.).
+
+Instead of sleeping a fixed interval, the loop waits on a watcher for the
+refs it cares about and backs off while the repository is quiescent.
+Use ``--poll`` on network filesystems where inotify events are unreliable.
 """
+import argparse
+import functools
 import os
+import re
 import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 REPO_DIR = os.path.dirname(os.path.abspath(__file__))
 REMOTE = os.environ.get("DEPLOY_REMOTE", "origin")
 BRANCH = os.environ.get("DEPLOY_BRANCH", "main")
 CHECK_INTERVAL = int(os.environ.get("DEPLOY_INTERVAL", "60"))  # seconds
+MAX_INTERVAL = int(os.environ.get("DEPLOY_MAX_INTERVAL", str(CHECK_INTERVAL * 8)))
+POLL_MIN_INTERVAL = 1.0  # seconds, floor for stat-based polling
+IMAGE = "wifite3:prod"
+BUILD_CACHE_DIR = os.environ.get(
+    "DEPLOY_BUILD_CACHE", os.path.expanduser("~/.cache/wifite3-buildx"))
+# The default 'docker' buildx driver cannot export a cache (--cache-to)
+BUILDER = os.environ.get("DEPLOY_BUILDER", "wifite3-builder")
+TEST_CONTAINER = "wifite3-testd"
+# Only changes to these paths require a new image; source is bind-mounted
+# into the long-lived test container.
+IMAGE_INPUTS_RE = re.compile(r"^(Dockerfile[^/]*|requirements[^/]*\.txt)$")
+
+# Serializes container create/remove (concurrent 'docker rm' is racy)
+_docker_lock = threading.Lock()
+
+GIT_DIR = os.path.join(REPO_DIR, ".git")
+WATCHED_REFS = [
+    os.path.join(GIT_DIR, "refs", "remotes", REMOTE, BRANCH),
+    os.path.join(GIT_DIR, "refs", "heads", BRANCH),
+    os.path.join(GIT_DIR, "packed-refs"),
+]
+SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+
+def run(cmd, mutates=False):
+    """Run command (list of args), streaming its output, and return it.
+
+    Pass ``mutates=True`` for commands that change refs or remotes so that
+    memoized repository state is invalidated.
+    """
+    print(f"[deploy_agent] $ {' '.join(cmd)}")
+    output = []
+    try:
+        with subprocess.Popen(cmd, cwd=REPO_DIR, text=True, bufsize=1,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                output.append(line)
+            returncode = proc.wait()
+    finally:
+        if mutates:
+            _RepoState.invalidate()
+    if returncode != 0:
+        raise RuntimeError(f"Command failed: {' '.join(cmd)}")
+    return "".join(output)
+
+
+class _RepoState:
+    """Memoized git queries, valid until a mutating run() bumps `version`."""
+
+    version = 0
+
+    @classmethod
+    def invalidate(cls):
+        cls.version += 1
+
+    @classmethod
+    def hash(cls):
+        return cls._hash(cls.version)
+
+    @classmethod
+    def remote_urls(cls):
+        return cls._remote_urls(cls.version)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _hash(version):
+        try:
+            return _read_head()
+        except (OSError, ValueError):
+            return run(["git", "rev-parse", "HEAD"]).strip()
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _remote_urls(version):
+        urls = {}
+        for line in run(["git", "remote", "-v"]).splitlines():
+            fields = line.split()
+            if len(fields) >= 2:
+                urls.setdefault(fields[0], fields[1])
+        return urls
 
-def run(cmd):
-    """Run command and return output."""
-    print(f"[deploy_agent] $ {cmd}")
-    result = subprocess.run(cmd, shell=True, cwd=REPO_DIR,
-                            text=True, stdout=subprocess.PIPE,
-                            stderr=subprocess.STDOUT)
-    print(result.stdout)
-    if result.returncode != 0:
-        raise RuntimeError(f"Command failed: {cmd}")
-    return result.stdout
+
+def _read_head():
+    """Resolves HEAD by reading .git directly instead of spawning git."""
+    with open(os.path.join(GIT_DIR, "HEAD")) as fid:
+        head = fid.read().strip()
+    if not head.startswith("ref: "):
+        if not SHA_RE.fullmatch(head):
+            raise ValueError(f"Unexpected HEAD contents: {head!r}")
+        return head
+
+    ref = head[len("ref: "):]
+    try:
+        with open(os.path.join(GIT_DIR, ref)) as fid:
+            return fid.read().strip()
+    except FileNotFoundError:
+        with open(os.path.join(GIT_DIR, "packed-refs")) as fid:
+            data = fid.read()
+        match = re.search(rf"^([0-9a-f]{{40}}) {re.escape(ref)}$", data, re.M)
+        if match is None:
+            raise ValueError(f"Ref {ref} not found in packed-refs")
+        return match.group(1)
 
 
 def current_hash():
-    return run("git rev-parse HEAD").strip()
+    return _RepoState.hash()
 
 
 def remote_exists(remote_name: str) -> bool:
-    try:
-        run(f"git remote get-url {remote_name}")
+    if remote_name in _RepoState.remote_urls():
         return True
+    print(f"[deploy_agent] Remote '{remote_name}' not configured; skipping fetch")
+    return False
+
+
+def _ref_mtimes(paths):
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+class RefWatcher:
+    """Sets an event whenever one of the watched ref files changes.
+
+    Uses watchdog (inotify) when available, otherwise a stat-polling thread.
+    Parent directories are watched rather than the files themselves, since
+    git updates refs via ``<ref>.lock`` -> ``<ref>`` renames which replace
+    the inode; the watch is re-armed after every event for the same reason.
+    """
+
+    def __init__(self, paths, poll=False, poll_interval=POLL_MIN_INTERVAL):
+        self.paths = set(paths)
+        self.changed = threading.Event()
+        self.poll_interval = max(POLL_MIN_INTERVAL, poll_interval)
+        self._observer = None
+        self._handler = None
+        self._last = {}
+        if not poll:
+            try:
+                from watchdog.events import FileSystemEventHandler
+                from watchdog.observers import Observer
+            except ImportError:
+                print("[deploy_agent] watchdog not installed; falling back to polling")
+            else:
+                watcher = self
+
+                class _Handler(FileSystemEventHandler):
+                    def on_any_event(self, event):
+                        touched = {getattr(event, "src_path", None),
+                                   getattr(event, "dest_path", None)}
+                        if touched & watcher.paths:
+                            watcher.changed.set()
+
+                self._handler = _Handler()
+                self._observer = Observer()
+
+    def start(self):
+        if self._observer is not None:
+            self._rearm()
+            self._observer.start()
+        else:
+            thread = threading.Thread(target=self._poll_loop, daemon=True)
+            thread.start()
+
+    def _rearm(self):
+        self._observer.unschedule_all()
+        for directory in {os.path.dirname(p) for p in self.paths}:
+            if os.path.isdir(directory):
+                self._observer.schedule(self._handler, directory, recursive=False)
+
+    def _poll_loop(self):
+        self._last = _ref_mtimes(self.paths)
+        while True:
+            time.sleep(self.poll_interval)
+            current = _ref_mtimes(self.paths)
+            if current != self._last:
+                self._last = current
+                self.changed.set()
+
+    def settle(self):
+        """Forgets ref changes seen so far, e.g. our own merge/tag/push."""
+        if self._observer is not None:
+            self._rearm()
+        else:
+            self._last = _ref_mtimes(self.paths)
+        self.changed.clear()
+
+    def wait(self, timeout):
+        """Blocks until a ref changes or `timeout` expires. Returns True on change."""
+        fired = self.changed.wait(timeout=timeout)
+        self.changed.clear()
+        if fired and self._observer is not None:
+            self._rearm()
+        return fired
+
+
+def publish(new_hash, has_remote):
+    """Force-pushes the branch and a prod-* tag for `new_hash`."""
+    if has_remote:
+        run(["git", "push", "--force", REMOTE, BRANCH], mutates=True)
+    tag = f"prod-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}-{new_hash[:7]}"
+    run(["git", "tag", tag], mutates=True)
+    if has_remote:
+        run(["git", "push", "--force", REMOTE, tag], mutates=True)
+
+
+def changed_files(old_hash, new_hash):
+    return run(["git", "diff", "--name-only", old_hash, new_hash]).split()
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_builder():
+    """Creates the docker-container buildx builder unless it already exists."""
+    try:
+        run(["docker", "buildx", "inspect", BUILDER])
+    except RuntimeError:
+        run(["docker", "buildx", "create", "--name", BUILDER,
+             "--driver", "docker-container"])
+
+
+def image_exists():
+    try:
+        run(["docker", "image", "inspect", "-f", "{{.Id}}", IMAGE])
+    except RuntimeError:
+        return False
+    return True
+
+
+def build_image(changed=None):
+    """Builds the image, reusing layers from the local buildx cache.
+
+    Skips the build if `changed` (list of paths) touches no Dockerfile or
+    requirements file and the image already exists. Returns True if the
+    image was rebuilt.
+    """
+    if changed is not None and not any(IMAGE_INPUTS_RE.search(f) for f in changed):
+        if image_exists():
+            print("[deploy_agent] Image inputs unchanged; reusing existing image")
+            return False
+        print(f"[deploy_agent] Image {IMAGE} not found; building it")
+    ensure_builder()
+    run(["docker", "buildx", "build", "--builder", BUILDER,
+         f"--cache-from=type=local,src={BUILD_CACHE_DIR}",
+         f"--cache-to=type=local,dest={BUILD_CACHE_DIR},mode=max",
+         "--tag", IMAGE, "--load", "."])
+    return True
+
+
+def start_test_container():
+    """(Re)creates the long-lived test container with the repo mounted at /src."""
+    with _docker_lock:
+        try:
+            run(["docker", "rm", "-f", TEST_CONTAINER])
+        except RuntimeError:
+            pass
+        run(["docker", "run", "-d", "--name", TEST_CONTAINER,
+             "-v", f"{REPO_DIR}:/src:ro", "-w", "/src",
+             IMAGE, "sleep", "infinity"])
+
+
+def test_container_running():
+    try:
+        state = run(["docker", "inspect", "-f", "{{.State.Running}}", TEST_CONTAINER])
     except RuntimeError:
-        print(f"[deploy_agent] Remote '{remote_name}' not configured; skipping fetch")
         return False
+    return state.strip() == "true"
+
+
+def run_tests():
+    """Runs the test suite in the test container, spread across all CPUs (pytest-xdist)."""
+    if not test_container_running():
+        start_test_container()
+    run(["docker", "exec", TEST_CONTAINER,
+         "python", "-m", "pytest", "-p", "no:cacheprovider",
+         # Each test has its own temp dir; loadfile also keeps a module's
+         # class-level fixtures (setUpClass temp dirs, Configuration) on one worker
+         "-n", "auto", "--dist", "loadfile", "tests/"])
 
 
-def main_loop():
+def main_loop(poll=False, cache_first=False):
+    os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+    watcher = RefWatcher(WATCHED_REFS, poll=poll)
+    watcher.start()
+    interval = CHECK_INTERVAL
+    refs_changed = True
+    last_fetch = float("-inf")
     last_deployed = current_hash()
+    built_once = False  # always build on the first deploy of this process
     while True:
         try:
-            if remote_exists(REMOTE):
-                run(f"git fetch {REMOTE}")
-                run(f"git merge --ff-only {REMOTE}/{BRANCH} || git merge {REMOTE}/{BRANCH}")
+            has_remote = remote_exists(REMOTE)
+            # The remote-tracking ref only moves when we fetch, so cache-first
+            # mode still fetches at least every MAX_INTERVAL seconds.
+            fetch_due = time.monotonic() - last_fetch >= MAX_INTERVAL
+            if has_remote and (refs_changed or fetch_due or not cache_first):
+                last_fetch = time.monotonic()
+                run(["git", "fetch", REMOTE], mutates=True)
+                try:
+                    run(["git", "merge", "--ff-only", f"{REMOTE}/{BRANCH}"], mutates=True)
+                except RuntimeError:
+                    run(["git", "merge", f"{REMOTE}/{BRANCH}"], mutates=True)
             new_hash = current_hash()
             if new_hash != last_deployed:
-                if remote_exists(REMOTE):
-                    run(f"git push --force {REMOTE} {BRANCH}")
-                tag = f"prod-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}-{new_hash[:7]}"
-                run(f"git tag {tag}")
-                if remote_exists(REMOTE):
-                    run(f"git push --force {REMOTE} {tag}")
-                run("docker buildx build --tag wifite3:prod .")
-                run("docker run --rm wifite3:prod python -m unittest discover -v tests")
-                run("firebase deploy --only hosting")
+                # The image build does not depend on the tag/push steps, so
+                # overlap them; deploy only once both have succeeded.
+                changed = changed_files(last_deployed, new_hash) if built_once else None
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    build = pool.submit(build_image, changed)
+                    published = pool.submit(publish, new_hash, has_remote)
+                    rebuilt = build.result()
+                    built_once = True
+                    published.result()
+                if rebuilt:
+                    start_test_container()
+                run_tests()
+                run(["firebase", "deploy", "--only", "hosting"])
                 last_deployed = new_hash
         except Exception as exc:
             print(f"[deploy_agent] Error: {exc}")
-        time.sleep(CHECK_INTERVAL)
+        # Ref updates made by this iteration are not news; don't wake on them
+        watcher.settle()
+        refs_changed = watcher.wait(interval)
+        if refs_changed:
+            _RepoState.invalidate()
+            interval = CHECK_INTERVAL
+        else:
+            # Nothing changed locally; back off until a ref moves.
+            interval = min(interval * 2, MAX_INTERVAL)
 
 
 if __name__ == "__main__":
-    main_loop()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--poll", action="store_true",
+                        help="use stat-based polling instead of inotify (NFS/CIFS)")
+    parser.add_argument("--cache-first", action="store_true",
+                        help="skip 'git fetch' while the watched refs are unchanged "
+                             "(still fetches every DEPLOY_MAX_INTERVAL seconds)")
+    args = parser.parse_args()
+    main_loop(poll=args.poll, cache_first=args.cache_first)
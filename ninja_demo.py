@@ -20,6 +20,12 @@ Usage: python3 ninja_demo.py
 """
 
 import sys
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Add wifite3 to path
 sys.path.insert(0, ".")
@@ -30,8 +36,9 @@ try:
 
     def demo_network_detection():
         """Demonstrate network type detection capabilities"""
-        Color.pl("\n{+} {R}🥷 NINJA NETWORK TYPE DETECTION{W}")
-        Color.pl("{+} {G}=" * 50 + "{W}")
+        buf = []
+        buf.append("\n{+} {R}🥷 NINJA NETWORK TYPE DETECTION{W}")
+        buf.append("{+} {G}=" * 50 + "{W}")
 
         test_networks = [
             ("WPA2", "CCMP", "PSK", "HomeNetwork", "Standard home router"),
@@ -48,15 +55,18 @@ try:
             net_type = OpenMPI._detect_network_type(
                 privacy, cipher, auth, essid
             )
-            Color.pl(
+            buf.append(
                 "  {C}%-12s{W} | {G}%-15s{W} | {D}%s{W}"
                 % (net_type, essid, description)
             )
 
+        Color.pl_many(buf)
+
     def demo_vendor_detection():
         """Demonstrate vendor identification from MAC addresses"""
-        Color.pl("\n{+} {R}🥷 NINJA VENDOR DETECTION{W}")
-        Color.pl("{+} {G}=" * 50 + "{W}")
+        buf = []
+        buf.append("\n{+} {R}🥷 NINJA VENDOR DETECTION{W}")
+        buf.append("{+} {G}=" * 50 + "{W}")
 
         test_devices = [
             ("00:1B:63:AA:BB:CC", "Apple iPhone/iPad"),
@@ -69,17 +79,21 @@ try:
             ("AC:DE:48:11:22:33", "Modern device (generic)"),
         ]
 
+        vendors = OpenMPI.precompute_vendors(mac for mac, _ in test_devices)
         for mac, description in test_devices:
-            vendor = OpenMPI._detect_vendor_from_mac(mac)
-            Color.pl(
+            vendor = vendors[mac]
+            buf.append(
                 "  {C}%-8s{W} | {G}%-17s{W} | {D}%s{W}"
                 % (vendor, mac, description)
             )
 
+        Color.pl_many(buf)
+
     def demo_device_classification():
         """Demonstrate device type classification"""
-        Color.pl("\n{+} {R}🥷 NINJA DEVICE CLASSIFICATION{W}")
-        Color.pl("{+} {G}=" * 50 + "{W}")
+        buf = []
+        buf.append("\n{+} {R}🥷 NINJA DEVICE CLASSIFICATION{W}")
+        buf.append("{+} {G}=" * 50 + "{W}")
 
         test_clients = [
             (
@@ -115,18 +129,38 @@ try:
             ),
         ]
 
+        vendors = OpenMPI.precompute_vendors(mac for mac, _, _ in test_clients)
         for mac, probed, description in test_clients:
             device_type = OpenMPI._detect_device_type(mac, probed)
-            vendor = OpenMPI._detect_vendor_from_mac(mac)
-            Color.pl(
+            vendor = vendors[mac]
+            buf.append(
                 "  {C}%-8s{W} | {G}%-8s{W} | {Y}%-17s{W} | {D}%s{W}"
                 % (device_type, vendor, mac, description)
             )
 
+        Color.pl_many(buf)
+
+    # Weight of each network class in the environment risk score
+    RISK_WEIGHTS = (
+        ("open_networks", 3),
+        ("wep_networks", 2),
+        ("wpa_networks", 1),
+        ("hidden_networks", 1),
+    )
+
+    def risk_weighted_sum(network_stats):
+        """Weighted count of risky networks (dot product of counts and weights)"""
+        counts = [network_stats[key] for key, _ in RISK_WEIGHTS]
+        weights = [weight for _, weight in RISK_WEIGHTS]
+        if np is not None:
+            return float(np.dot(counts, weights))
+        return float(sum(c * w for c, w in zip(counts, weights)))
+
     def demo_intelligence_report():
         """Demonstrate comprehensive intelligence reporting format"""
-        Color.pl("\n{+} {R}🥷 NINJA INTELLIGENCE REPORT PREVIEW{W}")
-        Color.pl("{+} {G}=" * 60 + "{W}")
+        buf = []
+        buf.append("\n{+} {R}🥷 NINJA INTELLIGENCE REPORT PREVIEW{W}")
+        buf.append("{+} {G}=" * 60 + "{W}")
 
         # Simulate network statistics
         network_stats = {
@@ -159,74 +193,67 @@ try:
         }
 
         # Network overview
-        Color.pl("{+} {C}📡 NETWORK OVERVIEW:{W}")
-        Color.pl(
+        buf.append("{+} {C}📡 NETWORK OVERVIEW:{W}")
+        buf.append(
             "  {G}Total Networks:{W} {C}%d{W}"
             % network_stats["total_networks"]
         )
-        Color.pl(
+        buf.append(
             "  {G}Total Clients:{W} {C}%d{W}"
             % network_stats["total_clients"]
         )
-        Color.pl(
+        buf.append(
             "  {G}Hidden Networks:{W} {C}%d{W}"
             % network_stats["hidden_networks"]
         )
-        Color.pl(
+        buf.append(
             "  {G}Unique Vendors:{W} {C}%d{W}"
             % len(network_stats["unique_vendors"])
         )
 
         # Security analysis
-        Color.pl("")
-        Color.pl("{+} {C}🔒 SECURITY ANALYSIS:{W}")
-        Color.pl(
+        buf.append("")
+        buf.append("{+} {C}🔒 SECURITY ANALYSIS:{W}")
+        buf.append(
             "  {R}Open Networks:{W} {C}%d{W}"
             % network_stats["open_networks"]
         )
-        Color.pl(
+        buf.append(
             "  {O}WEP Networks:{W} {C}%d{W}" % network_stats["wep_networks"]
         )
-        Color.pl(
+        buf.append(
             "  {Y}WPA Networks:{W} {C}%d{W}" % network_stats["wpa_networks"]
         )
-        Color.pl(
+        buf.append(
             "  {G}WPA2 Networks:{W} {C}%d{W}"
             % network_stats["wpa2_networks"]
         )
-        Color.pl(
+        buf.append(
             "  {G}WPA3 Networks:{W} {C}%d{W}"
             % network_stats["wpa3_networks"]
         )
-        Color.pl(
+        buf.append(
             "  {B}Enterprise:{W} {C}%d{W}"
             % network_stats["enterprise_networks"]
         )
 
         # Channel usage
-        Color.pl("")
-        Color.pl("{+} {C}📶 CHANNEL USAGE:{W}")
-        for channel, count in sorted(
-            network_stats["channel_usage"].items(),
-            key=lambda x: x[1],
-            reverse=True,
-        ):
+        buf.append("")
+        buf.append("{+} {C}📶 CHANNEL USAGE:{W}")
+        for channel, count in Counter(
+            network_stats["channel_usage"]
+        ).most_common():
             band = "2.4GHz" if channel <= 14 else "5GHz"
-            Color.pl(
+            buf.append(
                 "  {G}Ch %d (%s):{W} {C}%d networks{W}"
                 % (channel, band, count)
             )
 
         # Risk assessment
-        Color.pl("")
-        Color.pl("{+} {C}⚠️  RISK ASSESSMENT:{W}")
+        buf.append("")
+        buf.append("{+} {C}⚠️  RISK ASSESSMENT:{W}")
         total = network_stats["total_networks"]
-        risk_score = (
-            (network_stats["open_networks"] * 3)
-            + (network_stats["wep_networks"] * 2)
-            + (network_stats["wpa_networks"] * 1)
-            + (network_stats["hidden_networks"] * 1)
-        ) / total
+        risk_score = risk_weighted_sum(network_stats) / total
 
         if risk_score > 2.0:
             risk_level = "{R}HIGH{W}"
@@ -235,49 +262,56 @@ try:
         else:
             risk_level = "{G}LOW{W}"
 
-        Color.pl(
+        buf.append(
             "  {G}Environment Risk Level:{W} %s {C}(%.1f){W}"
             % (risk_level, risk_score)
         )
 
+        Color.pl_many(buf)
+
     def demo_mpi_capabilities():
         """Demonstrate MPI parallel scanning capabilities"""
-        Color.pl("\n{+} {R}🥷 NINJA MPI PARALLEL CAPABILITIES{W}")
-        Color.pl("{+} {G}=" * 50 + "{W}")
+        buf = []
+        buf.append("\n{+} {R}🥷 NINJA MPI PARALLEL CAPABILITIES{W}")
+        buf.append("{+} {G}=" * 50 + "{W}")
 
         if OpenMPI.exists():
             cpu_count = OpenMPI.get_cpu_count()
-            Color.pl(
+            buf.append(
                 "  {G}✅ OpenMPI Available:{W} {C}Ready for parallel scanning{W}"
             )
-            Color.pl(
+            buf.append(
                 "  {G}CPU Cores:{W} {C}%d processes available{W}" % cpu_count
             )
-            Color.pl(
+            buf.append(
                 "  {G}Channel Coverage:{W} {C}39 channels (2.4GHz + 5GHz){W}"
             )
-            Color.pl(
+            buf.append(
                 "  {G}Scan Duration:{W} {C}137 seconds comprehensive{W}"
             )
-            Color.pl(
+            buf.append(
                 "  {G}Analysis Features:{W} {C}Real-time intelligence{W}"
             )
         else:
-            Color.pl(
+            buf.append(
                 "  {O}⚠️  OpenMPI Not Available:{W} {C}Sequential mode only{W}"
             )
-            Color.pl(
+            buf.append(
                 "  {G}Install with:{W} {C}apt-get install openmpi-bin{W}"
             )
 
+        Color.pl_many(buf)
+
     def main():
         """Main demonstration function"""
-        Color.pl("{+} {R}🥷 WIFITE3 NINJA INTELLIGENCE SYSTEM DEMO{W}")
-        Color.pl(
+        buf = []
+        buf.append("{+} {R}🥷 WIFITE3 NINJA INTELLIGENCE SYSTEM DEMO{W}")
+        buf.append(
             "{+} {G}================================================{W}"
         )
-        Color.pl("{+} {C}Comprehensive wireless network reconnaissance{W}")
-        Color.pl("{+} {C}and intelligence analysis platform{W}")
+        buf.append("{+} {C}Comprehensive wireless network reconnaissance{W}")
+        buf.append("{+} {C}and intelligence analysis platform{W}")
+        Color.pl_many(buf)
 
         demo_network_detection()
         demo_vendor_detection()
@@ -285,39 +319,42 @@ try:
         demo_intelligence_report()
         demo_mpi_capabilities()
 
-        Color.pl("")
-        Color.pl("{+} {G}🥷 NINJA FEATURES SUMMARY:{W}")
-        Color.pl(
+        buf = []
+        buf.append("")
+        buf.append("{+} {G}🥷 NINJA FEATURES SUMMARY:{W}")
+        buf.append(
             "  {C}• Network Type Classification:{W} Open/WEP/WPA/WPA2/WPA3/Enterprise/Guest/IoT"
         )
-        Color.pl(
+        buf.append(
             "  {C}• Vendor Identification:{W} Apple/Samsung/Intel/Cisco/Huawei/Google/Microsoft"
         )
-        Color.pl(
+        buf.append(
             "  {C}• Device Classification:{W} Mobile/Computer/IoT/Printer/Gaming"
         )
-        Color.pl(
+        buf.append(
             "  {C}• Client Analysis:{W} MAC/Vendor/Type/Probed Networks/Activity"
         )
-        Color.pl(
+        buf.append(
             "  {C}• Risk Assessment:{W} Environment security scoring (High/Medium/Low)"
         )
-        Color.pl(
+        buf.append(
             "  {C}• Channel Analysis:{W} 2.4GHz/5GHz usage mapping and congestion"
         )
-        Color.pl(
+        buf.append(
             "  {C}• MPI Parallelization:{W} Multi-core scanning for maximum coverage"
         )
-        Color.pl(
+        buf.append(
             "  {C}• Intelligence Reporting:{W} Comprehensive statistics and insights"
         )
 
-        Color.pl("")
-        Color.pl("{+} {G}✅ WIFITE3 NINJA INTELLIGENCE SYSTEM READY!{W}")
-        Color.pl(
+        buf.append("")
+        buf.append("{+} {G}✅ WIFITE3 NINJA INTELLIGENCE SYSTEM READY!{W}")
+        buf.append(
             "{+} {C}Use: python3 wifite --ninja-scan for full reconnaissance{W}"
         )
 
+        Color.pl_many(buf)
+
     # Run the demonstration
     if __name__ == "__main__":
         main()
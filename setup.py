@@ -85,6 +85,9 @@ setup(
             "pytest-cov>=4.1.0",
             "coverage>=7.4.0",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+        ],
     },
     license="GNU GPLv2",
     scripts=["bin/wifite"] if os.path.exists("bin/wifite") else [],
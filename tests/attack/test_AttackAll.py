@@ -1,18 +1,33 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+import shutil
+import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 
 from wifite.attack.all import AttackAll
 from wifite.model.target import Target
 from wifite.config import Configuration
+from wifite.realtime_crack_manager import RealtimeCrackManager
+from tests.fixtures import initialize_configuration, make_target_fields
 
 
 class TestAttackAll(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls._rt_mock = create_autospec(RealtimeCrackManager, instance=True)
+
     def setUp(self):
-        Configuration.initialize(load_yaml=False)
+        initialize_configuration()
+        # One autospec'd manager per class; reset instead of rebuilding it
+        self._rt_mock.reset_mock(return_value=True, side_effect=True)
+        self._rt_mock.is_actively_cracking.return_value = False
+        self._rt_mock.get_cracked_password.return_value = None
+        self._rt_mock.update_status.return_value = None
+        self._rt_mock.cracked_bssids.return_value = set()
         # Prevent actual attacks or lengthy operations
         Configuration.no_deauth = True
         Configuration.wps_pixie = False
@@ -22,15 +37,12 @@ class TestAttackAll(unittest.TestCase):
         )
         Configuration.wordlist = None  # Prevent local cracking attempts
         Configuration.hashcat_realtime = True  # Enable for these tests
-        Configuration.temp_dir = "/tmp/wifite_test_temp_all"
-        if not os.path.exists(Configuration.temp_dir):
-            os.makedirs(Configuration.temp_dir)
+        # Per test, so parallel workers never remove each other's directory
+        self.temp_dir = tempfile.mkdtemp(prefix="wifite_test_temp_all")
+        Configuration.temp_dir = self.temp_dir
 
     def tearDown(self):
-        if os.path.exists(Configuration.temp_dir):
-            import shutil
-
-            shutil.rmtree(Configuration.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     @patch("wifite.attack.all.AttackWPA")  # Mock the AttackWPA class
     @patch("wifite.attack.all.AttackPMKID")  # Mock the AttackPMKID class
@@ -43,26 +55,15 @@ class TestAttackAll(unittest.TestCase):
     ):
         """Test that attack_single skips other attacks if RealtimeCrackManager reports password."""
 
-        mock_target_fields = [
-            "RT:CR:AC:KE:D0:00",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "1",
-            "300",
-            "WPA2",
-            "CCMP",
-            "PSK",
-            "-40",
-            "10",
-            "0",
-            "0.0.0.0",
-            "10",
-            "CrackedNet",
-            "",
-        ]
+        mock_target_fields = make_target_fields(
+            bssid="RT:CR:AC:KE:D0:00",
+            power="-40",
+            idlen="10",
+            essid="CrackedNet",
+        )
         target = Target(mock_target_fields)
 
-        mock_rt_manager = MagicMock()
+        mock_rt_manager = self._rt_mock
         # Simulate that update_status finds a password for this target
         mock_rt_manager.update_status.return_value = (
             target.bssid,
@@ -95,6 +96,40 @@ class TestAttackAll(unittest.TestCase):
             "Should print message that target was already cracked by real-time manager.",
         )
 
+    @patch("wifite.attack.all.AttackAll.attack_single")
+    @patch("wifite.attack.all.AttackWPS.can_attack_wps", return_value=False)
+    def test_attack_multiple_skips_targets_already_cracked(
+        self, mock_can_wps, mock_attack_single
+    ):
+        """Targets cracked before the loop are reported once and never attacked."""
+        cracked = Target(
+            make_target_fields(bssid="RT:CR:AC:KE:D0:01", essid="Cracked")
+        )
+        pending = Target(
+            make_target_fields(bssid="RT:PE:ND:IN:G0:02", essid="Pending")
+        )
+        mock_rt_manager = self._rt_mock
+        mock_rt_manager.cracked_bssids.return_value = {cracked.bssid}
+        mock_rt_manager.get_cracked_password.side_effect = lambda bssid: (
+            "password123" if bssid == cracked.bssid else None
+        )
+        mock_attack_single.return_value = True
+
+        with patch("wifite.util.color.Color.pl_many") as mock_pl_many, patch(
+            "wifite.util.color.Color.pl"
+        ):
+            attacked = AttackAll.attack_multiple(
+                [cracked, pending], realtime_crack_manager=mock_rt_manager
+            )
+
+        self.assertEqual(attacked, 2)
+        mock_attack_single.assert_called_once_with(
+            pending, 0, mock_rt_manager, can_wps=False
+        )
+        (lines,), _ = mock_pl_many.call_args
+        self.assertEqual(len(lines), 1)
+        self.assertIn("already cracked by real-time manager", lines[0])
+
     @patch(
         "wifite.attack.wpa.AttackWPA.run", return_value=True
     )  # Mock AttackWPA's run to succeed
@@ -102,7 +137,7 @@ class TestAttackAll(unittest.TestCase):
         "wifite.attack.wpa.AttackWPA.__init__", return_value=None
     )  # Mock init to avoid issues
     @patch(
-        "wifite.attack.pmkid.AttackPMKID"
+        "wifite.attack.all.AttackPMKID"
     )  # Mock PMKID to prevent its run
     @patch("wifite.attack.all.AttackWPS.can_attack_wps", return_value=False)
     def test_attack_single_stops_realtime_if_other_attack_succeeds(
@@ -110,27 +145,19 @@ class TestAttackAll(unittest.TestCase):
     ):
         """Test that attack_single stops real-time cracking if a standard attack succeeds."""
         Configuration.use_pmkid_only = False  # Ensure WPA attack is in queue
-
-        mock_target_fields = [
-            "RT:ST:OP:ME:XX:00",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "6",
-            "144",
-            "WPA2",
-            "CCMP",
-            "PSK",
-            "-50",
-            "10",
-            "0",
-            "0.0.0.0",
-            "12",
-            "StopRealTime",
-            "",
-        ]
+        # PMKID is queued first; it must fail for the WPA attack to run
+        MockAttackPMKID.return_value.run.return_value = False
+
+        mock_target_fields = make_target_fields(
+            bssid="RT:ST:OP:ME:XX:00",
+            ch="6",
+            speed="144",
+            idlen="12",
+            essid="StopRealTime",
+        )
         target = Target(mock_target_fields)
 
-        mock_rt_manager = MagicMock()
+        mock_rt_manager = self._rt_mock
         mock_rt_manager.update_status.return_value = (
             None  # Real-time does not find password initially
         )
@@ -167,6 +194,8 @@ class TestAttackAll(unittest.TestCase):
 
         # Assert that run was called on the WPA attack instance
         mock_wpa_instance.run.assert_called_once()
+        # Status checks between queued attacks bypass the poll rate limit
+        mock_rt_manager.update_status.assert_called_with(force=True)
 
         # Assert that stop_current_crack_attempt was called on the manager
         mock_rt_manager.stop_current_crack_attempt.assert_called_once_with(
@@ -176,7 +205,7 @@ class TestAttackAll(unittest.TestCase):
 
 if __name__ == "__main__":
     if not hasattr(Configuration, "temp_dir"):
-        Configuration.initialize(load_yaml=False)
+        initialize_configuration()
         Configuration.temp_dir = "/tmp/wifite_test_temp_all_main"
         if not os.path.exists(Configuration.temp_dir):
             os.makedirs(Configuration.temp_dir)
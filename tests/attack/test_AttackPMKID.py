@@ -1,22 +1,87 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+import shutil
+import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import create_autospec, patch
 
 from wifite.attack.pmkid import AttackPMKID
 from wifite.model.target import (
     Target,
 )  # Assuming Target can be instantiated for testing
 from wifite.config import Configuration
+from wifite.realtime_crack_manager import RealtimeCrackManager
+from tests.fixtures import initialize_configuration, make_target_fields
 
 # from wifite.realtime_crack_manager import RealtimeCrackManager # Not strictly needed if mocking the instance
 
 
+class FakeDumpTool(object):
+    """Stands in for HcxDumpTool: runs for five polls, then exits"""
+
+    dependency_name = "sh"  # Present on any test host
+
+    def __init__(self, target, pcapng_file):
+        self.polls = iter([None] * 5 + [True])
+
+    def poll(self):
+        return next(self.polls, True)
+
+    def interrupt(self):
+        pass
+
+
+class FakePcapTool(object):
+    """Stands in for HcxPcapTool: always finds the same PMKID hash"""
+
+    dependency_name = "sh"
+    pmkid_hash = "testpmkid*pmkidbssid*pmkidstation*pmkidessid"
+
+    def __init__(self, target):
+        pass
+
+    def get_pmkid_hash(self, pcapng_file):
+        return self.pmkid_hash
+
+
+class FakeHashcat(object):
+    dependency_name = "sh"
+
+    @staticmethod
+    def crack_pmkid(pmkid_file):
+        return None
+
+
+FAKE_TOOLS = SimpleNamespace(
+    HcxDumpTool=FakeDumpTool, HcxPcapTool=FakePcapTool, Hashcat=FakeHashcat
+)
+
+
 class TestAttackPMKID(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        initialize_configuration()
+        cls._tmp = tempfile.mkdtemp(prefix="wifite_test_temp_pmkid")
+        cls._rt_mock = create_autospec(RealtimeCrackManager, instance=True)
+        Configuration.temp_dir = cls._tmp
+        # Restored before each test instead of re-initializing Configuration
+        cls._cfg_snapshot = {
+            k: v
+            for k, v in vars(Configuration).items()
+            if not k.startswith("_")
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._tmp, ignore_errors=True)
+
     def setUp(self):
-        Configuration.initialize(load_yaml=False)
+        for k, v in self._cfg_snapshot.items():
+            setattr(Configuration, k, v)
         Configuration.hashcat_realtime = (
             False  # Default to off unless specified in test
         )
@@ -27,75 +92,33 @@ class TestAttackPMKID(unittest.TestCase):
             True  # Focus on capture part for some tests
         )
         Configuration.pmkid_timeout = 10  # Short timeout for tests
-        Configuration.temp_dir = "/tmp/wifite_test_temp_pmkid"
-        if not os.path.exists(Configuration.temp_dir):
-            os.makedirs(Configuration.temp_dir)
+        # One autospec'd manager per class; reset instead of rebuilding it
+        self._rt_mock.reset_mock(return_value=True, side_effect=True)
+        self._rt_mock.is_actively_cracking.return_value = False
+        self._rt_mock.get_cracked_password.return_value = None
+        self._rt_mock.update_status.return_value = None
 
-    def tearDown(self):
-        if os.path.exists(Configuration.temp_dir):
-            import shutil
-
-            shutil.rmtree(Configuration.temp_dir)
-
-    @patch("wifite.tools.hashcat.HcxDumpTool")  # Mocks the entire class
-    @patch("wifite.tools.hashcat.HcxPcapTool")  # Mocks the entire class
-    @patch(
-        "wifite.tools.hashcat.Hashcat.crack_pmkid"
-    )  # Mock the actual cracking call
     @patch(
         "os.path.exists", return_value=True
     )  # Assume files exist generally
-    def test_run_starts_realtime_crack_if_enabled(
-        self,
-        mock_path_exists,
-        mock_crack_pmkid,
-        MockHcxPcapTool,
-        MockHcxDumpTool,
-    ):
+    def test_run_starts_realtime_crack_if_enabled(self, mock_path_exists):
         Configuration.hashcat_realtime = True
         Configuration.wordlist = (
             None  # Don't proceed to local cracking for this test
         )
 
         # Mock target
-        mock_target_fields = [
-            "PM:KI:DB:SS:ID:00",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "1",
-            "300",
-            "WPA2",
-            "CCMP",
-            "PSK",
-            "-40",
-            "10",
-            "0",
-            "0.0.0.0",
-            "8",
-            "PMKIDNet",
-            "",
-        ]
-        target = Target(mock_target_fields)
-
-        # Mock HcxPcapTool instance and its get_pmkid_hash method
-        mock_pcaptool_instance = MockHcxPcapTool.return_value
-        # Simulate a captured PMKID hash string being returned and then saved to a file
-        test_pmkid_hash_string = (
-            "testpmkid*pmkidbssid*pmkidstation*pmkidessid"
-        )
-        mock_pcaptool_instance.get_pmkid_hash.return_value = (
-            test_pmkid_hash_string
+        mock_target_fields = make_target_fields(
+            bssid="PM:KI:DB:SS:ID:00",
+            power="-40",
+            essid="PMKIDNet",
         )
+        target = Target(mock_target_fields)
 
-        # Mock HcxDumpTool instance
-        mock_dumptool_instance = MockHcxDumpTool.return_value
-        # Allow poll to be called, make it indicate process is running then stopped
-        mock_dumptool_instance.poll.side_effect = [None, None, True]
+        test_pmkid_hash_string = FakePcapTool.pmkid_hash
 
         # Mock RealtimeCrackManager
-        mock_rt_manager = MagicMock()
-        mock_rt_manager.is_actively_cracking.return_value = False
-        mock_rt_manager.get_cracked_password.return_value = None
+        mock_rt_manager = self._rt_mock
 
         # Mock save_pmkid to return a predictable file path
         expected_pmkid_filepath = os.path.join(
@@ -103,17 +126,25 @@ class TestAttackPMKID(unittest.TestCase):
             "pmkid_PMKIDNet_PM-KI-DB-SS-ID-00_YYYY-MM-DDTHH-MM-SS.16800",
         )
 
-        attack = AttackPMKID(target, realtime_crack_manager=mock_rt_manager)
+        attack = AttackPMKID(
+            target,
+            realtime_crack_manager=mock_rt_manager,
+            cfg=Configuration.snapshot(),
+            tools=FAKE_TOOLS,
+        )
+
+        # Replace save_pmkid on the instance for this test to control the
+        # returned filename and avoid actual file system operations for saving.
+        saved_hashes = []
+
+        def fake_save_pmkid(pmkid_hash):
+            saved_hashes.append(pmkid_hash)
+            return expected_pmkid_filepath
 
-        # Patch the save_pmkid method within the instance for this test
-        # to control the returned filename and avoid actual file system operations for saving.
-        with patch.object(
-            attack, "save_pmkid", return_value=expected_pmkid_filepath
-        ) as mock_save:
-            with patch("time.sleep"):  # Patch time.sleep to speed up loops
-                attack.run()
+        attack.save_pmkid = fake_save_pmkid
+        attack.run()
 
-            mock_save.assert_called_once_with(test_pmkid_hash_string)
+        self.assertEqual(saved_hashes, [test_pmkid_hash_string])
 
         # Assert that start_target_crack_session was called on the manager
         mock_rt_manager.start_target_crack_session.assert_called_once_with(
@@ -134,7 +165,7 @@ if __name__ == "__main__":
     # For simplicity, this is often handled by running tests via `python -m unittest discover`
     # or specific test runner configurations.
     if not hasattr(Configuration, "temp_dir"):  # Basic check
-        Configuration.initialize(load_yaml=False)
+        initialize_configuration()
         Configuration.temp_dir = "/tmp/wifite_test_temp_pmkid_main"
         if not os.path.exists(Configuration.temp_dir):
             os.makedirs(Configuration.temp_dir)
@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import io
 import unittest
-from unittest.mock import patch
+from unittest.mock import create_autospec, patch
 
 # Adjust import paths based on Wifite's structure
 # This assumes Wifite can be imported if tests are run from the project root
@@ -10,49 +11,58 @@ from wifite.attack.wpa import AttackWPA
 from wifite.model.target import Target
 from wifite.util.color import Color
 from wifite.config import Configuration
+from wifite.realtime_crack_manager import RealtimeCrackManager
+from tests.fixtures import initialize_configuration, make_target_fields
 
 
 class TestAttackWPA(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        initialize_configuration()
+        cls._rt_mock = create_autospec(RealtimeCrackManager, instance=True)
+        # Restored before each test instead of re-initializing Configuration
+        cls._cfg_snapshot = {
+            k: v
+            for k, v in vars(Configuration).items()
+            if not k.startswith("_")
+        }
+
     def setUp(self):
         # Basic configuration mock needed for some functions called within AttackWPA
         # We might not need all of these, but it's good to have a base.
-        Configuration.initialize(
-            load_yaml=False
-        )  # Avoid loading external config
+        for k, v in self._cfg_snapshot.items():
+            setattr(Configuration, k, v)
         Configuration.wordlist = None  # Ensure no cracking is attempted
         Configuration.wps_only = False
         Configuration.use_pmkid_only = False
         Configuration.no_deauth = True  # Avoid actual deauth calls
+        # One autospec'd manager per class; reset instead of rebuilding it
+        self._rt_mock.reset_mock(return_value=True, side_effect=True)
+        self._rt_mock.is_actively_cracking.return_value = False
+        self._rt_mock.get_cracked_password.return_value = None
+        self._rt_mock.update_status.return_value = None
 
     @patch(
-        "sys.stdout", new_callable=unittest.mock.StringIO
+        "sys.stdout", new_callable=io.StringIO
     )  # Capture stdout
     def test_run_on_wpa3_target(self, mock_stdout):
         """Test AttackWPA.run() with a WPA3 target."""
         # Mock a Target object that identifies as WPA3
-        mock_target_wpa3_fields = [
-            "W3:MA:CA:DD:RE:SS",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "1",
-            "1201",
-            "WPA3 PSK",
-            "GCMP",
-            "SAE",
-            "-40",
-            "10",
-            "0",
-            "0.0.0.0",
-            "8",
-            "WPA3Test",
-            "",
-        ]
+        mock_target_wpa3_fields = make_target_fields(
+            bssid="W3:MA:CA:DD:RE:SS",
+            speed="1201",
+            privacy="WPA3 PSK",
+            cipher="GCMP",
+            auth="SAE",
+            power="-40",
+            essid="WPA3Test",
+        )
         target_wpa3 = Target(mock_target_wpa3_fields)
         # Ensure is_wpa3 is explicitly True as per Target class logic
         self.assertTrue(target_wpa3.is_wpa3)
 
-        attack = AttackWPA(target_wpa3)
+        attack = AttackWPA(target_wpa3, cfg=Configuration.snapshot())
 
         # Since AttackWPA.run() involves complex interactions (airodump, aireplay),
         # we focus on the initial WPA3 check.
@@ -83,27 +93,15 @@ class TestAttackWPA(unittest.TestCase):
         self, mock_color_pl, mock_capture_handshake
     ):
         """Test AttackWPA.run() with a WPA2 target to ensure it proceeds (superficially)."""
-        mock_target_wpa2_fields = [
-            "W2:MA:CA:DD:RE:SS",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "6",
-            "300",
-            "WPA2",
-            "CCMP",
-            "PSK",
-            "-50",
-            "10",
-            "0",
-            "0.0.0.0",
-            "8",
-            "WPA2Test",
-            "",
-        ]
+        mock_target_wpa2_fields = make_target_fields(
+            bssid="W2:MA:CA:DD:RE:SS",
+            ch="6",
+            essid="WPA2Test",
+        )
         target_wpa2 = Target(mock_target_wpa2_fields)
         self.assertFalse(target_wpa2.is_wpa3)
 
-        attack = AttackWPA(target_wpa2)
+        attack = AttackWPA(target_wpa2, cfg=Configuration.snapshot())
 
         # We've mocked capture_handshake to return None, so it should fail there.
         # The key is that it didn't exit due to WPA3 check.
@@ -145,33 +143,22 @@ class TestAttackWPA(unittest.TestCase):
         Configuration.wordlist = None  # Don't proceed to local aircrack cracking for this specific test focus
 
         # Mock target
-        mock_target_wpa2_fields = [
-            "W2:RT:CA:DD:RE:SS",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "6",
-            "300",
-            "WPA2",
-            "CCMP",
-            "PSK",
-            "-50",
-            "10",
-            "0",
-            "0.0.0.0",
-            "10",
-            "WPA2RealTm",
-            "",
-        ]
+        mock_target_wpa2_fields = make_target_fields(
+            bssid="W2:RT:CA:DD:RE:SS",
+            ch="6",
+            idlen="10",
+            essid="WPA2RealTm",
+        )
         target_wpa2 = Target(mock_target_wpa2_fields)
         self.assertFalse(target_wpa2.is_wpa3)
 
         # Mock RealtimeCrackManager
-        mock_rt_manager = MagicMock()
-        mock_rt_manager.is_actively_cracking.return_value = False
-        mock_rt_manager.get_cracked_password.return_value = None
+        mock_rt_manager = self._rt_mock
 
         attack = AttackWPA(
-            target_wpa2, realtime_crack_manager=mock_rt_manager
+            target_wpa2,
+            realtime_crack_manager=mock_rt_manager,
+            cfg=Configuration.snapshot(),
         )
 
         # Mock capture_handshake to return a mock Handshake object
@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from wifite.config import Configuration
+
+
+@pytest.fixture(scope="function")
+def isolated_cfg():
+    """Restores Configuration's class attributes after the test."""
+    saved = dict(vars(Configuration))
+    yield Configuration
+    for key in list(vars(Configuration)):
+        if key not in saved:
+            delattr(Configuration, key)
+    for key, val in saved.items():
+        if not key.startswith("__"):
+            setattr(Configuration, key, val)
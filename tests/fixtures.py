@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Shared helpers for building test data."""
+
+import sys
+from unittest.mock import patch
+
+from wifite.config import Configuration
+
+TARGET_FIELD_DEFAULTS = (
+    ("bssid", "AA:BB:CC:DD:EE:FF"),
+    ("first", "2023-01-01 10:00:00"),
+    ("last", "2023-01-01 10:00:00"),
+    ("ch", "1"),
+    ("speed", "300"),
+    ("privacy", "WPA2"),
+    ("cipher", "CCMP"),
+    ("auth", "PSK"),
+    ("power", "-50"),
+    ("beacons", "10"),
+    ("iv", "0"),
+    ("ip", "0.0.0.0"),
+    ("idlen", "8"),
+    ("essid", "Test"),
+    ("key", ""),
+)
+
+
+def make_target_fields(**kw):
+    """
+    Returns an airodump CSV row (as a tuple) suitable for Target(fields).
+    Any column can be overridden by name, see TARGET_FIELD_DEFAULTS.
+    """
+    fields = dict(TARGET_FIELD_DEFAULTS)
+    unknown = set(kw) - set(fields)
+    if unknown:
+        raise TypeError("Unknown target field(s): %s" % ", ".join(sorted(unknown)))
+    fields.update(kw)
+    return tuple(fields.values())
+
+
+def initialize_configuration():
+    """
+    Runs Configuration.initialize() without wifite's command line (pytest's
+    own argv would be parsed instead) and without selecting an interface.
+    """
+    with patch.object(sys, "argv", ["wifite"]):
+        Configuration.initialize(load_interface=False)
@@ -5,9 +5,16 @@ import sys
 
 sys.path.insert(0, "..")
 
+from wifite.config import Configuration
+from wifite.model.target import Target
 from wifite.tools.airodump import Airodump
+from tests.fixtures import make_target_fields
 
+import inspect
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
 
 class TestAirodump(unittest.TestCase):
@@ -54,11 +61,55 @@ class TestAirodump(unittest.TestCase):
             "ESSID length shold be 19, but got %s" % target.essid_len
         )
 
+    def test_filter_targets_by_bssid_and_essid(self):
+        targets = [
+            Target(make_target_fields(bssid="AA:BB:CC:DD:EE:01", essid="Home")),
+            Target(make_target_fields(bssid="AA:BB:CC:DD:EE:02", essid="Guest")),
+            Target(make_target_fields(bssid="AA:BB:CC:DD:EE:03", essid="Office")),
+        ]
+        config = dict(
+            clients_only=False,
+            encryption_filter=["WEP", "WPA", "WPS"],
+            target_bssid=None,
+            target_essid=None,
+            ignore_essid=None,
+        )
+        with patch.multiple(Configuration, create=True, **config):
+            self.assertEqual(len(Airodump.filter_targets(targets)), 3)
+
+            Configuration.ignore_essid = "GUEST"
+            result = Airodump.filter_targets(targets)
+            self.assertEqual([t.essid for t in result], ["Home", "Office"])
+
+            Configuration.ignore_essid = None
+            Configuration.target_bssid = "aa:bb:cc:dd:ee:03"
+            result = Airodump.filter_targets(targets)
+            self.assertEqual([t.essid for t in result], ["Office"])
+
+            Configuration.target_bssid = None
+            Configuration.target_essid = "home"
+            result = Airodump.filter_targets(targets)
+            self.assertEqual([t.essid for t in result], ["Home"])
+
+    def test_csv_rewritten_within_same_mtime_is_reread(self):
+        with open(self.getFile("airodump-weird-ssids.csv"), "rb") as fid:
+            lines = fid.read().splitlines(keepends=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_filename = os.path.join(tmp, "scan-01.csv")
+            # Same capture minus its last access point
+            with open(csv_filename, "wb") as fid:
+                fid.writelines(lines[:6] + lines[7:])
+            st = os.stat(csv_filename)
+            self.assertEqual(len(Airodump.get_targets_from_csv(csv_filename)), 4)
+
+            # Coarse timestamps: the rewrite lands in the same mtime tick
+            with open(csv_filename, "wb") as fid:
+                fid.writelines(lines)
+            os.utime(csv_filename, ns=(st.st_atime_ns, st.st_mtime_ns))
+            self.assertEqual(len(Airodump.get_targets_from_csv(csv_filename)), 5)
+
     def getFile(self, filename):
         """Helper method to parse targets from filename"""
-        import os
-        import inspect
-
         this_file = os.path.abspath(inspect.getsourcefile(self.getFile))
         this_dir = os.path.dirname(this_file)
         return os.path.join(this_dir, "files", filename)
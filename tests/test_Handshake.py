@@ -8,6 +8,8 @@ sys.path.insert(0, "..")
 from wifite.model.handshake import Handshake
 from wifite.util.process import Process
 
+import inspect
+import os
 import unittest
 
 
@@ -16,9 +18,6 @@ class TestHandshake(unittest.TestCase):
 
     def getFile(self, filename):
         """Helper method to parse targets from filename"""
-        import os
-        import inspect
-
         this_file = os.path.abspath(inspect.getsourcefile(self.getFile))
         this_dir = os.path.dirname(this_file)
         return os.path.join(this_dir, "files", filename)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from wifite.tools.hashcat import HcxPcapTool, RealtimeHashcatSession
+
+
+class TestHashcat(unittest.TestCase):
+    """Test suite for stopping real-time Hashcat sessions"""
+
+    def make_session(self, returncode):
+        proc = MagicMock()
+        proc.pid = 4242
+        proc.poll.return_value = returncode
+        return RealtimeHashcatSession(
+            proc, "AA:BB:CC:DD:EE:FF", 16800, "/fake/hash", "/fake/wl", None, None
+        )
+
+    @patch("wifite.util.color.Color.pl")
+    @patch("os.getpgid", return_value=4242)
+    @patch("os.killpg", side_effect=PermissionError("Operation not permitted"))
+    def test_stop_leaves_pipes_open_if_kill_fails(
+        self, mock_killpg, mock_getpgid, mock_pl
+    ):
+        session = self.make_session(returncode=None)  # Never exits
+
+        HcxPcapTool.stop_realtime_crack(session)
+
+        mock_killpg.assert_called_once()
+        # Closing would block on the reader threads while hashcat runs
+        session.popen_object.stdout.close.assert_not_called()
+        session.popen_object.stderr.close.assert_not_called()
+
+    @patch("wifite.util.color.Color.pl")
+    @patch("os.killpg")
+    def test_stop_closes_pipes_once_exited(self, mock_killpg, mock_pl):
+        session = self.make_session(returncode=0)
+
+        HcxPcapTool.stop_realtime_crack(session)
+
+        mock_killpg.assert_not_called()
+        session.popen_object.stdout.close.assert_called_once()
+        session.popen_object.stderr.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
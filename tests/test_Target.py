@@ -4,7 +4,10 @@
 from wifite.tools.airodump import Airodump
 from wifite.model.target import Target  # Import Target class directly
 from wifite.util.color import Color  # For testing to_str() output
+from tests.fixtures import make_target_fields
 
+import inspect
+import os
 import unittest
 
 
@@ -15,9 +18,6 @@ class TestTarget(unittest.TestCase):
 
     def getTargets(self, filename):
         """Helper method to parse targets from filename"""
-        import os
-        import inspect
-
         this_file = os.path.abspath(
             inspect.getsourcefile(TestTarget.getTargets)
         )
@@ -41,23 +41,14 @@ class TestTarget(unittest.TestCase):
     def test_wpa3_parsing(self):
         """Tests parsing of WPA3 networks"""
         # BSSID, First time seen, Last time seen, channel, Speed, Privacy, Cipher, Authentication, Power, beacons, # IV, LAN IP, ID-length, ESSID, Key
-        row_wpa3 = [
-            "AA:BB:CC:DD:EE:FF",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "6",
-            "300",
-            "WPA3 OWE",
-            "GCMP",
-            "SAE",
-            "-50",
-            "10",
-            "0",
-            "0.0.0.0",
-            "4",
-            "WPA3NET",
-            "",
-        ]
+        row_wpa3 = make_target_fields(
+            ch="6",
+            privacy="WPA3 OWE",
+            cipher="GCMP",
+            auth="SAE",
+            idlen="4",
+            essid="WPA3NET",
+        )
         target = Target(row_wpa3)
         self.assertTrue(target.is_wpa3)
         self.assertFalse(
@@ -65,315 +56,221 @@ class TestTarget(unittest.TestCase):
         )  # OWE is in privacy but WPA3 takes precedence for is_wpa3, encryption should be WPA3
         self.assertEqual(target.encryption, "WPA3")
 
-        row_wpa2_wpa3 = [
-            "AA:BB:CC:DD:EE:FE",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "1",
-            "300",
-            "WPA3 WPA2",
-            "GCMP CCMP",
-            "PSK SAE",
-            "-55",
-            "10",
-            "0",
-            "0.0.0.0",
-            "9",
-            "MIXEDMODE",
-            "",
-        ]
+        row_wpa2_wpa3 = make_target_fields(
+            bssid="AA:BB:CC:DD:EE:FE",
+            privacy="WPA3 WPA2",
+            cipher="GCMP CCMP",
+            auth="PSK SAE",
+            power="-55",
+            idlen="9",
+            essid="MIXEDMODE",
+        )
         target_mixed = Target(row_wpa2_wpa3)
         self.assertTrue(target_mixed.is_wpa3)
         self.assertEqual(
             target_mixed.encryption, "WPA3"
         )  # WPA3 should be preferred
+        self.assertEqual(target_mixed.encryption_family, {"WPA", "WPA3"})
 
     def test_owe_parsing(self):
         """Tests parsing of OWE networks"""
-        row_owe = [
-            "AA:BB:CC:DD:EE:FD",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "11",
-            "300",
-            "OWE",
-            "GCMP",
-            "OWE",
-            "-60",
-            "10",
-            "0",
-            "0.0.0.0",
-            "7",
-            "OWENET",
-            "",
-        ]
+        row_owe = make_target_fields(
+            bssid="AA:BB:CC:DD:EE:FD",
+            ch="11",
+            privacy="OWE",
+            cipher="GCMP",
+            auth="OWE",
+            power="-60",
+            idlen="7",
+            essid="OWENET",
+        )
         target = Target(row_owe)
         self.assertFalse(target.is_wpa3)
         self.assertTrue(target.is_owe)
         self.assertEqual(target.encryption, "OWE")
+        self.assertNotIn("WPA", target.encryption_family)
+
+    def test_broadcast_and_multicast_bssids_rejected(self):
+        """Tests that broadcast/multicast BSSIDs are filtered, in any case"""
+        for bssid in (
+            "FF:FF:FF:FF:FF:FF",
+            "00:00:00:00:00:00",
+            "01:00:5E:00:00:FB",
+            "01:80:c2:00:00:00",
+            "33:33:00:00:00:01",
+        ):
+            with self.assertRaises(Exception):
+                Target(make_target_fields(bssid=bssid))
+        Target(make_target_fields(bssid="33:34:00:00:00:01"))
 
     def test_wifi_standard_parsing(self):
         """Tests inference of Wi-Fi standards (ax, be, ac, n, g, b)"""
         # Test BE (Wi-Fi 7)
-        row_be = [
-            "BE:BE:BE:BE:BE:BE",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "36",
-            "6000",
-            "WPA3",
-            "GCMP",
-            "SAE",
-            "-40",
-            "10",
-            "0",
-            "0.0.0.0",
-            "3",
-            "BE",
-            "",
-        ]
+        row_be = make_target_fields(
+            bssid="BE:BE:BE:BE:BE:BE",
+            ch="36",
+            speed="6000",
+            privacy="WPA3",
+            cipher="GCMP",
+            auth="SAE",
+            power="-40",
+            idlen="3",
+            essid="BE",
+        )
         target = Target(row_be)
         self.assertEqual(target.wifi_standard, "be")
 
         # Test AX (Wi-Fi 6)
-        row_ax = [
-            "AX:AX:AX:AX:AX:AX",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "1",
-            "1201",
-            "WPA3",
-            "GCMP",
-            "SAE",
-            "-45",
-            "10",
-            "0",
-            "0.0.0.0",
-            "3",
-            "AX",
-            "",
-        ]
+        row_ax = make_target_fields(
+            bssid="AX:AX:AX:AX:AX:AX",
+            speed="1201",
+            privacy="WPA3",
+            cipher="GCMP",
+            auth="SAE",
+            power="-45",
+            idlen="3",
+            essid="AX",
+        )
         target = Target(row_ax)
         self.assertEqual(target.wifi_standard, "ax")
 
-        row_ax_high = [
-            "AX:AX:AX:AX:AX:A1",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "1",
-            "2402",
-            "WPA3",
-            "GCMP",
-            "SAE",
-            "-45",
-            "10",
-            "0",
-            "0.0.0.0",
-            "3",
-            "AX2",
-            "",
-        ]
+        row_ax_high = make_target_fields(
+            bssid="AX:AX:AX:AX:AX:A1",
+            speed="2402",
+            privacy="WPA3",
+            cipher="GCMP",
+            auth="SAE",
+            power="-45",
+            idlen="3",
+            essid="AX2",
+        )
         target = Target(row_ax_high)
         self.assertEqual(target.wifi_standard, "ax")
 
         # Test AC (Wi-Fi 5)
-        row_ac = [
-            "AC:AC:AC:AC:AC:AC",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "40",
-            "866",
-            "WPA2",
-            "CCMP",
-            "PSK",
-            "-50",
-            "10",
-            "0",
-            "0.0.0.0",
-            "3",
-            "AC",
-            "",
-        ]
+        row_ac = make_target_fields(
+            bssid="AC:AC:AC:AC:AC:AC",
+            ch="40",
+            speed="866",
+            idlen="3",
+            essid="AC",
+        )
         target = Target(row_ac)
         self.assertEqual(target.wifi_standard, "ac")
 
         # Test N (high speed)
-        row_n_high = [
-            "N0:N0:N0:N0:N0:N0",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "11",
-            "300",
-            "WPA2",
-            "CCMP",
-            "PSK",
-            "-55",
-            "10",
-            "0",
-            "0.0.0.0",
-            "4",
-            "N300",
-            "",
-        ]
+        row_n_high = make_target_fields(
+            bssid="N0:N0:N0:N0:N0:N0",
+            ch="11",
+            power="-55",
+            idlen="4",
+            essid="N300",
+        )
         target = Target(row_n_high)
         self.assertEqual(
             target.wifi_standard, "ac"
         )  # Current logic pushes >=300 to 'ac'
 
-        row_n_low = [
-            "N1:N1:N1:N1:N1:N1",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "6",
-            "144",
-            "WPA2",
-            "CCMP",
-            "PSK",
-            "-58",
-            "10",
-            "0",
-            "0.0.0.0",
-            "3",
-            "N144",
-            "",
-        ]
+        row_n_low = make_target_fields(
+            bssid="N1:N1:N1:N1:N1:N1",
+            ch="6",
+            speed="144",
+            power="-58",
+            idlen="3",
+            essid="N144",
+        )
         target = Target(row_n_low)
         self.assertEqual(target.wifi_standard, "n")
 
         # Test G
-        row_g = [
-            "GG:GG:GG:GG:GG:GG",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "1",
-            "54",
-            "WPA2",
-            "TKIP",
-            "PSK",
-            "-60",
-            "10",
-            "0",
-            "0.0.0.0",
-            "1",
-            "G",
-            "",
-        ]
+        row_g = make_target_fields(
+            bssid="GG:GG:GG:GG:GG:GG",
+            speed="54",
+            cipher="TKIP",
+            power="-60",
+            idlen="1",
+            essid="G",
+        )
         target = Target(row_g)
         self.assertEqual(target.wifi_standard, "g")
 
         # Test G with QoS (should be upgraded to N by current logic)
-        row_g_qos = [
-            "GQ:GQ:GQ:GQ:GQ:GQ",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "1",
-            "54e",
-            "WPA2",
-            "TKIP",
-            "PSK",
-            "-60",
-            "10",
-            "0",
-            "0.0.0.0",
-            "3",
-            "GQE",
-            "",
-        ]
+        row_g_qos = make_target_fields(
+            bssid="GQ:GQ:GQ:GQ:GQ:GQ",
+            speed="54e",
+            cipher="TKIP",
+            power="-60",
+            idlen="3",
+            essid="GQE",
+        )
         target = Target(row_g_qos)
         self.assertEqual(target.wifi_standard, "n")
 
         # Test B
-        row_b = [
-            "BB:BB:BB:BB:BB:BB",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "11",
-            "11",
-            "WEP",
-            "WEP",
-            "",
-            "-70",
-            "10",
-            "0",
-            "0.0.0.0",
-            "1",
-            "B",
-            "",
-        ]
+        row_b = make_target_fields(
+            bssid="BB:BB:BB:BB:BB:BB",
+            ch="11",
+            speed="11",
+            privacy="WEP",
+            cipher="WEP",
+            auth="",
+            power="-70",
+            idlen="1",
+            essid="B",
+        )
         target = Target(row_b)
         self.assertEqual(target.wifi_standard, "b")
 
     def test_target_to_str_formatting(self):
         """Tests the to_str() method for new WPA3/OWE/Wi-Fi standard indicators"""
         # WPA3-SAE and AX
-        row_wpa3_ax = [
-            "AX:AX:AX:AX:AX:AX",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "1",
-            "1201",
-            "WPA3",
-            "GCMP",
-            "SAE",
-            "-45",
-            "10",
-            "0",
-            "0.0.0.0",
-            "6",
-            "WPA3AX",
-            "",
-        ]
+        row_wpa3_ax = make_target_fields(
+            bssid="AX:AX:AX:AX:AX:AX",
+            speed="1201",
+            privacy="WPA3",
+            cipher="GCMP",
+            auth="SAE",
+            power="-45",
+            idlen="6",
+            essid="WPA3AX",
+        )
         target_wpa3_ax = Target(row_wpa3_ax)
-        target_str = Color.strip(
-            target_wpa3_ax.to_str()
-        )  # Strip color codes for simple substring check
-        self.assertIn("[AX]", target_str)
-        self.assertIn("WPA3", target_str)  # Encryption field
+        # Color.contains() ignores color codes without stripping the string
+        target_str = target_wpa3_ax.to_str()
+        self.assertTrue(Color.contains(target_str, "[AX]"))
+        self.assertTrue(Color.contains(target_str, "WPA3"))  # Encryption field
 
         # OWE and AC
-        row_owe_ac = [
-            "AC:AC:AC:AC:AC:AC",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "40",
-            "866",
-            "OWE",
-            "GCMP",
-            "OWE",
-            "-50",
-            "10",
-            "0",
-            "0.0.0.0",
-            "6",
-            "OWE-AC",
-            "",
-        ]
+        row_owe_ac = make_target_fields(
+            bssid="AC:AC:AC:AC:AC:AC",
+            ch="40",
+            speed="866",
+            privacy="OWE",
+            cipher="GCMP",
+            auth="OWE",
+            idlen="6",
+            essid="OWE-AC",
+        )
         target_owe_ac = Target(row_owe_ac)
-        target_str_owe = Color.strip(target_owe_ac.to_str())
-        self.assertIn("[AC]", target_str_owe)
-        self.assertIn("OWE", target_str_owe)
+        target_str_owe = target_owe_ac.to_str()
+        self.assertTrue(Color.contains(target_str_owe, "[AC]"))
+        self.assertTrue(Color.contains(target_str_owe, "OWE"))
 
         # BE standard
-        row_be = [
-            "BE:BE:BE:BE:BE:BE",
-            "2023-01-01 10:00:00",
-            "2023-01-01 10:00:00",
-            "36",
-            "7000",
-            "WPA3",
-            "GCMP",
-            "SAE",
-            "-40",
-            "10",
-            "0",
-            "0.0.0.0",
-            "6",
-            "WIFI7",
-            "",
-        ]
+        row_be = make_target_fields(
+            bssid="BE:BE:BE:BE:BE:BE",
+            ch="36",
+            speed="7000",
+            privacy="WPA3",
+            cipher="GCMP",
+            auth="SAE",
+            power="-40",
+            idlen="6",
+            essid="WIFI7",
+        )
         target_be = Target(row_be)
-        target_str_be = Color.strip(target_be.to_str())
-        self.assertIn("[BE]", target_str_be)
+        target_str_be = target_be.to_str()
+        self.assertTrue(Color.contains(target_str_be, "[BE]"))
 
         # Check colors (more involved, might need specific color code checks if critical)
         # For now, we assume the color codes used in to_str() are correct if the substrings are present.
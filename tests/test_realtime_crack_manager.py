@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import json
 import unittest
 import os
+import shutil
+import tempfile
+from collections import deque
 from unittest.mock import patch, MagicMock, mock_open, call
 
 # Assuming wifite is in PYTHONPATH or tests are run from project root
@@ -20,10 +24,38 @@ mock_config.hashcat_realtime_wordlist_dir = "/fake/wordlist_dir"
 mock_config.hashcat_realtime_options = None
 mock_config.hashcat_realtime_force_cpu = False
 mock_config.hashcat_realtime_gpu_devices = None
-mock_config.temp = lambda x: os.path.join("/tmp/wifite_test_temp", x)  # Mock temp dir
 mock_config.verbose = 0  # Default verbosity
 
 
+class FakeDirEntry(object):
+    """Minimal os.DirEntry stand-in for patched os.scandir()"""
+
+    def __init__(self, directory, name, is_file=True, size=100):
+        self.name = name
+        self.path = os.path.join(directory, name)
+        self._is_file = is_file
+        self._size = size
+
+    def is_file(self):
+        return self._is_file
+
+    def stat(self):
+        return os.stat_result((0, 0, 0, 0, 0, 0, self._size, 0, 0, 0))
+
+
+class FakeScandir(object):
+    """Context-manager iterator over FakeDirEntry objects, like os.scandir()"""
+
+    def __init__(self, entries):
+        self.entries = entries
+
+    def __enter__(self):
+        return iter(self.entries)
+
+    def __exit__(self, *exc):
+        return False
+
+
 class TestRealtimeCrackManager(unittest.TestCase):
 
     def setUp(self):
@@ -34,9 +66,11 @@ class TestRealtimeCrackManager(unittest.TestCase):
         Configuration.hashcat_realtime_options = None
         Configuration.hashcat_realtime_force_cpu = False
         Configuration.hashcat_realtime_gpu_devices = None
-        Configuration.temp_dir = "/tmp/wifite_test_temp"  # Used by Configuration.temp()
-        if not os.path.exists(Configuration.temp_dir):
-            os.makedirs(Configuration.temp_dir)
+        # Used by Configuration.temp(); one per test, so parallel workers
+        # never remove each other's directory
+        self._saved_temp_dir = Configuration.temp_dir
+        self.temp_dir = tempfile.mkdtemp(prefix="wifite_test_temp")
+        Configuration.temp_dir = self.temp_dir
 
         # Patch os.path.exists globally for this test class for simplicity,
         # specific tests can override its side_effect if needed.
@@ -56,8 +90,18 @@ class TestRealtimeCrackManager(unittest.TestCase):
         self.mock_os_path_getsize = self.patcher_os_path_getsize.start()
         self.mock_os_path_getsize.return_value = 100  # Default to non-empty
 
-        self.patcher_os_listdir = patch("os.listdir")
-        self.mock_os_listdir = self.patcher_os_listdir.start()
+        self.patcher_os_scandir = patch("os.scandir")
+        self.mock_os_scandir = self.patcher_os_scandir.start()
+
+        # Keep the persistent wordlist metadata cache off the real disk
+        self.patcher_meta_cache = patch.object(
+            RealtimeCrackManager, "_meta_cache", {}
+        )
+        self.patcher_meta_cache.start()
+        self.patcher_save_meta = patch.object(
+            RealtimeCrackManager, "_save_meta_cache"
+        )
+        self.mock_save_meta = self.patcher_save_meta.start()
 
         self.patcher_color_pl = patch("wifite.util.color.Color.pl")
         self.mock_color_pl = self.patcher_color_pl.start()
@@ -69,13 +113,13 @@ class TestRealtimeCrackManager(unittest.TestCase):
         self.patcher_os_path_isfile.stop()
         self.patcher_os_path_isdir.stop()
         self.patcher_os_path_getsize.stop()
-        self.patcher_os_listdir.stop()
+        self.patcher_os_scandir.stop()
+        self.patcher_meta_cache.stop()
+        self.patcher_save_meta.stop()
         self.patcher_color_pl.stop()
-        # Clean up temp dir
-        if os.path.exists(Configuration.temp_dir):
-            import shutil
-
-            shutil.rmtree(Configuration.temp_dir)
+        # Clean up this test's temp dir only
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        Configuration.temp_dir = self._saved_temp_dir
 
     def test_load_wordlists_single_file_valid(self):
         Configuration.hashcat_realtime_wordlist_file = "/fake/wordlist.txt"
@@ -96,13 +140,13 @@ class TestRealtimeCrackManager(unittest.TestCase):
     def test_load_wordlists_directory_valid_multiple_files(self):
         Configuration.hashcat_realtime_wordlist_dir = "/fake/wordlist_dir"
         Configuration.hashcat_realtime_wordlist_file = None
-        self.mock_os_listdir.return_value = [
-            "wl1.txt",
-            "wl2.lst",
-            "some.potfile",
-        ]
-        # os.path.isfile needs to be True for these paths
-        self.mock_os_path_isfile.side_effect = lambda x: x.endswith((".txt", ".lst"))
+        self.mock_os_scandir.return_value = FakeScandir(
+            [
+                FakeDirEntry("/fake/wordlist_dir", "wl1.txt"),
+                FakeDirEntry("/fake/wordlist_dir", "wl2.lst"),
+                FakeDirEntry("/fake/wordlist_dir", "some.potfile"),
+            ]
+        )
 
         self.manager._load_wordlists()
         self.assertEqual(len(self.manager.wordlist_queue), 2)
@@ -119,10 +163,74 @@ class TestRealtimeCrackManager(unittest.TestCase):
             self.manager.wordlist_queue,
         )
 
+    def test_load_wordlists_directory_many_files_keeps_order(self):
+        Configuration.hashcat_realtime_wordlist_file = None
+        names = ["wl%02d.txt" % i for i in range(20)]
+        # Large enough to be probed by the thread pool
+        self.mock_os_scandir.return_value = FakeScandir(
+            [FakeDirEntry("/fake/wordlist_dir", n) for n in reversed(names)]
+            + [FakeDirEntry("/fake/wordlist_dir", "empty.txt", size=0)]
+        )
+
+        self.manager._load_wordlists()
+        self.assertEqual(
+            list(self.manager.wordlist_queue),
+            [os.path.join("/fake/wordlist_dir", n) for n in names],
+        )
+
+    def test_load_wordlists_directory_uses_meta_cache(self):
+        Configuration.hashcat_realtime_wordlist_file = None
+        bad = FakeDirEntry("/fake/wordlist_dir", "capture.bin")
+        st = bad.stat()
+        # Unchanged since it was last sniffed and found not to be a wordlist
+        RealtimeCrackManager._meta_cache[bad.path] = [
+            st.st_mtime_ns,
+            st.st_size,
+            False,
+        ]
+        self.mock_os_scandir.return_value = FakeScandir(
+            [
+                bad,
+                FakeDirEntry("/fake/wordlist_dir", "wl1.txt"),
+            ]
+        )
+
+        with patch.object(
+            RealtimeCrackManager, "_looks_like_wordlist", return_value=True
+        ) as mock_sniff:
+            self.manager._load_wordlists()
+
+        self.assertEqual(
+            list(self.manager.wordlist_queue),
+            [os.path.join("/fake/wordlist_dir", "wl1.txt")],
+        )
+        mock_sniff.assert_called_once_with(
+            os.path.join("/fake/wordlist_dir", "wl1.txt")
+        )
+        self.mock_save_meta.assert_called_once_with()
+
+    def test_save_meta_cache_prunes_missing_and_keeps_newest(self):
+        self.patcher_save_meta.stop()  # Exercise the real save
+        meta = RealtimeCrackManager._meta_cache
+        for name in ("old", "gone", "mid", "new1", "new2"):
+            meta["/wl/" + name] = [1, 100, True]
+        self.mock_os_path_exists.side_effect = lambda path: path != "/wl/gone"
+
+        # Under temp_dir, which tearDown removes (os.scandir is patched here)
+        meta_file = os.path.join(Configuration.temp_dir, "wordlist_meta.json")
+        with patch(
+            "wifite.realtime_crack_manager._META_CACHE_FILE", meta_file
+        ), patch("wifite.realtime_crack_manager._META_CACHE_MAX", 3):
+            RealtimeCrackManager._save_meta_cache()
+        with open(meta_file) as f:
+            saved = json.load(f)
+
+        self.assertEqual(list(saved), ["/wl/mid", "/wl/new1", "/wl/new2"])
+
     def test_load_wordlists_directory_empty(self):
         Configuration.hashcat_realtime_wordlist_dir = "/fake/empty_dir"
         Configuration.hashcat_realtime_wordlist_file = None
-        self.mock_os_listdir.return_value = []
+        self.mock_os_scandir.return_value = FakeScandir([])
         self.manager._load_wordlists()
         self.assertEqual(len(self.manager.wordlist_queue), 0)
         self.mock_color_pl.assert_any_call(f"{{R}}Real-time: No valid wordlists found. Real-time cracking disabled for this target.{{W}}")
@@ -158,7 +266,7 @@ class TestRealtimeCrackManager(unittest.TestCase):
     def test_try_next_wordlist_starts_session(
         self, mock_stop_current, mock_start_hashcat
     ):
-        self.manager.wordlist_queue = ["/fake/wl1.txt"]
+        self.manager.wordlist_queue = deque(["/fake/wl1.txt"])
         self.manager.current_target_bssid = "TARGET_BSSID"
         self.manager.current_hash_file_path = "/path/to/hash.txt"
         self.manager.current_hash_type = 2500
@@ -185,17 +293,23 @@ class TestRealtimeCrackManager(unittest.TestCase):
     def test_try_next_wordlist_no_wordlists(
         self, mock_stop_current, mock_start_hashcat
     ):
-        self.manager.wordlist_queue = []
+        self.manager.wordlist_queue = deque()
         self.manager.current_target_bssid = "TARGET_BSSID"
         self.manager.current_hash_file_path = (
             "/path/to/temp_hash.txt"  # Assume temp for cleanup check
         )
-        Configuration.temp_dir = "/tmp"  # ensure temp path check works
+
+        self.manager._try_next_wordlist()
+
+        mock_start_hashcat.assert_not_called()
+        mock_stop_current.assert_called_once_with(cleanup_hash_file=True)
+        self.mock_color_pl.assert_any_call(
+            "{G}Real-time: All wordlists exhausted for {C}TARGET_BSSID{W}"
+        )
 
     @patch('wifite.tools.hashcat.Hashcat.start_realtime_crack', return_value=None)
-    @patch.object(RealtimeCrackManager, '_try_next_wordlist', wraps=RealtimeCrackManager._try_next_wordlist, autospec=True)
-    def test_try_next_wordlist_hashcat_start_fails(self, mock_recursive_try_next, mock_start_hashcat):
-        self.manager.wordlist_queue = ['/fake/wl1.txt', '/fake/wl2.txt']
+    def test_try_next_wordlist_hashcat_start_fails(self, mock_start_hashcat):
+        self.manager.wordlist_queue = deque(['/fake/wl1.txt', '/fake/wl2.txt'])
         self.manager.current_target_bssid = 'TARGET_BSSID'
         self.manager.current_hash_file_path = '/path/to/hash.txt'
         self.manager.current_hash_type = 2500
@@ -203,9 +317,24 @@ class TestRealtimeCrackManager(unittest.TestCase):
 
         self.manager._try_next_wordlist()  # This will call mock_start_hashcat which returns None
 
-        self.assertEqual(self.manager.consecutive_hashcat_errors, initial_errors + 1)
+        # Both wordlists are tried in one (non-recursive) call
+        self.assertEqual(self.manager.consecutive_hashcat_errors, initial_errors + 2)
+        self.assertEqual(mock_start_hashcat.call_count, 2)
         self.mock_color_pl.assert_any_call(f"{{R}}Real-time: Failed to start Hashcat with wordlist {{O}}{os.path.basename('/fake/wl1.txt')}{{R}} for {{C}}TARGET_BSSID{{W}}")
-        mock_recursive_try_next.assert_called_once() # Checks if it tries the next list
+        self.mock_color_pl.assert_any_call(f"{{R}}Real-time: Failed to start Hashcat with wordlist {{O}}{os.path.basename('/fake/wl2.txt')}{{R}} for {{C}}TARGET_BSSID{{W}}")
+        self.assertEqual(len(self.manager.wordlist_queue), 0)
+        self.assertIsNone(self.manager.active_session)
+
+    @patch('wifite.tools.hashcat.Hashcat.start_realtime_crack', return_value=None)
+    def test_try_next_wordlist_stops_after_max_errors(self, mock_start_hashcat):
+        self.manager.wordlist_queue = deque(['/fake/wl%d.txt' % i for i in range(10)])
+        self.manager.current_target_bssid = 'TARGET_BSSID'
+        self.manager.current_hash_file_path = '/path/to/hash.txt'
+
+        self.manager._try_next_wordlist()
+
+        self.assertEqual(mock_start_hashcat.call_count, self.manager.max_hashcat_errors)
+        self.assertEqual(len(self.manager.wordlist_queue), 10 - self.manager.max_hashcat_errors)
 
     def test_update_status_no_active_session(self):
         self.manager.active_session = None
@@ -277,6 +406,24 @@ class TestRealtimeCrackManager(unittest.TestCase):
         self.assertIsNone(self.manager.active_session)  # Should be cleared
         mock_try_next.assert_called_once()
 
+    @patch("wifite.tools.hashcat.Hashcat.check_realtime_crack_status")
+    def test_update_status_rate_limited(self, mock_check_status):
+        self.manager.active_session = MagicMock(spec=RealtimeHashcatSession)
+        self.manager.current_target_bssid = "TARGET_BSSID"
+        mock_check_status.return_value = {
+            "status_lines": [],
+            "cracked_password": None,
+            "is_process_complete": False,
+            "error_lines": [],
+        }
+
+        with patch("time.monotonic", side_effect=[100.0, 100.1, 100.2, 101.0]):
+            self.manager.update_status()
+            self.manager.update_status()  # Within the interval: skipped
+            self.manager.update_status(force=True)
+            self.manager.update_status()  # Interval elapsed
+        self.assertEqual(mock_check_status.call_count, 3)
+
     @patch("wifite.tools.hashcat.Hashcat.stop_realtime_crack")
     def test_stop_current_crack_attempt(self, mock_hashcat_stop):
         mock_session = MagicMock(spec=RealtimeHashcatSession)
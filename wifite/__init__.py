@@ -1,12 +1,7 @@
 #!/usr/bin/env python3.13
 """Wifite3 - Wireless Network Auditor for Linux - Python 3.13.5 Edition."""
 
-from .config import Configuration, VERSION, APP_NAME
-from .__main__ import main
-
-__version__ = VERSION
 __author__ = "joseguzman1337"
-__title__ = APP_NAME
 __description__ = (
     "Wireless Network Auditor for Linux - Python 3.13.5 Edition"
 )
@@ -14,6 +9,32 @@ __url__ = "https://github.com/joseguzman1337/wifite3"
 __license__ = "GNU GPLv2"
 __copyright__ = f"Copyright © 2024 {__author__}"
 
+# Imported on first access (PEP 562), so `import wifite.<submodule>` doesn't
+# pay for loading the CLI entry point. Name -> (module, attribute).
+_LAZY_ATTRS = {
+    "main": (".__main__", "main"),
+    "Configuration": (".config", "Configuration"),
+    "VERSION": (".config", "VERSION"),
+    "APP_NAME": (".config", "APP_NAME"),
+    "__version__": (".config", "VERSION"),
+    "__title__": (".config", "APP_NAME"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        ) from None
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value  # Cache; __getattr__ is only hit once per name
+    return value
+
+
 __all__ = [
     "main",
     "Configuration",
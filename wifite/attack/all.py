@@ -8,6 +8,53 @@ from .pmkid import AttackPMKID
 from ..config import Configuration
 from ..util.color import Color
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def _attack_plan(
+    encryption_family,
+    wps_usable,
+    use_eviltwin,
+    use_pmkid_only,
+    wps_only,
+    wps_pixie,
+    wps_pin,
+):
+    """
+    Returns the kinds of attacks to queue, in order, for a target profile.
+    The targets of one scan share a handful of profiles, so this is memoized.
+    """
+    if use_eviltwin:
+        # TODO: EvilTwin attack
+        return ()
+
+    if "WEP" in encryption_family:
+        return ("wep",)
+
+    if "WPA" not in encryption_family:
+        return ()
+
+    # WPA (also WPA2, WPA3) can have multiple attack vectors:
+    plan = []
+    if wps_usable:
+        # Pixie-Dust
+        if wps_pixie:
+            plan.append("wps_pixie")
+        # PIN attack
+        if wps_pin:
+            plan.append("wps_pin")
+
+    if not wps_only:  # Allow PMKID and Handshake if not wps_only
+        # PMKID (Applicable to WPA/WPA2/WPA3)
+        plan.append("pmkid")
+
+        # Handshake capture (Skipped internally by AttackWPA for WPA3)
+        if not use_pmkid_only:
+            plan.append("wpa")
+
+    return tuple(plan)
+
 
 class AttackAll(object):
 
@@ -17,24 +64,60 @@ class AttackAll(object):
         Attacks all given `targets` (list[wifite.model.target]) until user interruption.
         Returns: Number of targets that were attacked (int)
         """
-        if any(t.wps for t in targets) and not AttackWPS.can_attack_wps():
-            # Warn that WPS attacks are not available.
-            Color.pl(
-                "{!} {O}Note: WPS attacks are not possible because you do not have {C}reaver{O} nor {C}bully{W}"
-            )
+        # Ask once for all targets, so the note below is printed only once
+        can_wps = None
+        if any(t.wps for t in targets):
+            can_wps = AttackWPS.can_attack_wps()
+            if not can_wps:
+                # Warn that WPS attacks are not available.
+                Color.pl(
+                    "{!} {O}Note: WPS attacks are not possible because you do not have {C}reaver{O} nor {C}bully{W}"
+                )
 
         attacked_targets = 0
-        targets_remaining = len(targets)
+        if realtime_crack_manager:
+            # Report targets the real-time cracker already solved up front,
+            # in one write, and only loop over the rest.
+            if realtime_crack_manager.active_session is not None:
+                realtime_crack_manager.update_status()
+            cracked = realtime_crack_manager.cracked_bssids(
+                {t.bssid for t in targets}
+            )
+            if cracked:
+                already_cracked = [t for t in targets if t.bssid in cracked]
+                Color.pl_many(
+                    [
+                        "{+} Target {C}%s{W} ({C}%s{W}) already cracked by real-time manager. Password: {G}%s{W}"
+                        % (
+                            t.bssid,
+                            t.essid if t.essid_known else "{O}ESSID unknown{W}",
+                            realtime_crack_manager.get_cracked_password(
+                                t.bssid
+                            ),
+                        )
+                        for t in already_cracked
+                    ]
+                )
+                attacked_targets += len(already_cracked)
+                targets = [t for t in targets if t.bssid not in cracked]
+
+        n_targets = len(targets)
+        targets_remaining = n_targets
         for index, target in enumerate(targets, start=1):
             # Before processing each new target, update real-time status if manager exists
             # This allows passwords found for *other* targets to be reported even if current target selection is manual.
-            if realtime_crack_manager:
+            # (update_status() is a no-op without an active Hashcat session)
+            if (
+                realtime_crack_manager
+                and realtime_crack_manager.active_session is not None
+            ):
                 realtime_crack_manager.update_status()
 
             attacked_targets += 1
             targets_remaining -= 1
 
-            # Check if this target was already cracked by the real-time manager
+            # Check if this target was cracked by the real-time manager while
+            # earlier targets were being attacked
             if (
                 realtime_crack_manager
                 and realtime_crack_manager.get_cracked_password(target.bssid)
@@ -65,23 +148,26 @@ class AttackAll(object):
             )
 
             Color.pl(
-                "\n{+} ({G}%d{W}/{G}%d{W})" % (index, len(targets))
+                "\n{+} ({G}%d{W}/{G}%d{W})" % (index, n_targets)
                 + " Starting attacks against {C}%s{W} ({C}%s{W})"
                 % (bssid, essid)
             )
 
             should_continue = cls.attack_single(
-                target, targets_remaining, realtime_crack_manager
+                target, targets_remaining, realtime_crack_manager, can_wps=can_wps
             )
             if not should_continue:
                 break
 
         # Final status update for any lingering sessions after all targets are processed
         if realtime_crack_manager:
-            Color.pl(
+            Color.debug(
                 "{+} Performing final real-time cracker status update..."
             )
-            realtime_crack_manager.update_status()  # Check for any last-minute cracks
+            if realtime_crack_manager.active_session is not None:
+                realtime_crack_manager.update_status(
+                    force=True
+                )  # Check for any last-minute cracks
             if (
                 realtime_crack_manager.is_actively_cracking()
             ):  # If any session is still running (e.g. for a target not in loop)
@@ -93,52 +179,36 @@ class AttackAll(object):
 
     @classmethod
     def attack_single(
-        cls, target, targets_remaining, realtime_crack_manager=None
+        cls, target, targets_remaining, realtime_crack_manager=None, can_wps=None
     ):
         """
         Attacks a single `target` (wifite.model.target).
+        `can_wps` is AttackWPS.can_attack_wps(), if the caller already knows it.
         Returns: True if attacks should continue, False otherwise.
         """
 
-        attacks = []
-
-        if Configuration.use_eviltwin:
-            # TODO: EvilTwin attack
-            pass
-
-        elif "WEP" in target.encryption:
-            attacks.append(AttackWEP(target))
-
-        elif (
-            "WPA" in target.encryption
-        ):  # Also handles WPA2, WPA3 due to Target.encryption logic
-            # WPA can have multiple attack vectors:
-
-            # WPS (Generally not applicable to WPA3-only, but APs can be mixed mode)
-            if (
-                not Configuration.use_pmkid_only and not target.is_wpa3
-            ):  # WPS is not part of WPA3-SAE
-                if (
-                    target.wps != False and AttackWPS.can_attack_wps()
-                ):  # target.wps should be WPSState.NONE or actual state
-                    # Pixie-Dust
-                    if Configuration.wps_pixie:
-                        attacks.append(AttackWPS(target, pixie_dust=True))
-                    # PIN attack
-                    if Configuration.wps_pin:
-                        attacks.append(AttackWPS(target, pixie_dust=False))
-
-            if (
-                not Configuration.wps_only
-            ):  # Allow PMKID and Handshake if not wps_only
-                # PMKID (Applicable to WPA/WPA2/WPA3)
-                # Pass realtime_crack_manager to AttackPMKID constructor
-                attacks.append(AttackPMKID(target, realtime_crack_manager))
-
-                # Handshake capture (Skipped internally by AttackWPA for WPA3)
-                if not Configuration.use_pmkid_only:
-                    # Pass realtime_crack_manager to AttackWPA constructor
-                    attacks.append(AttackWPA(target, realtime_crack_manager))
+        # WPS (Generally not applicable to WPA3-only, but APs can be mixed mode)
+        wps_usable = (
+            not Configuration.use_eviltwin
+            and "WPA" in target.encryption_family
+            and not Configuration.use_pmkid_only
+            and not target.is_wpa3  # WPS is not part of WPA3-SAE
+            and target.wps != False  # target.wps should be WPSState.NONE or actual state
+            and (can_wps if can_wps is not None else AttackWPS.can_attack_wps())
+        )
+        plan = _attack_plan(
+            target.encryption_family,
+            wps_usable,
+            Configuration.use_eviltwin,
+            Configuration.use_pmkid_only,
+            Configuration.wps_only,
+            Configuration.wps_pixie,
+            Configuration.wps_pin,
+        )
+        attacks = [
+            cls._build_attack(kind, target, realtime_crack_manager)
+            for kind in plan
+        ]
 
         if len(attacks) == 0:
             Color.pl(
@@ -149,13 +219,17 @@ class AttackAll(object):
 
         while len(attacks) > 0:
             # Before running next queued attack, check real-time status
-            if realtime_crack_manager:
-                cracked_info = realtime_crack_manager.update_status()
+            if (
+                realtime_crack_manager
+                and realtime_crack_manager.active_session is not None
+            ):
+                # Forced: a crack since the last poll must stop this target
+                cracked_info = realtime_crack_manager.update_status(force=True)
                 if cracked_info:
                     cracked_bssid, cracked_password = cracked_info
                     if cracked_bssid == target.bssid:
                         Color.pl(
-                            f"{{G}}Real-time cracker found password for current target {target.bssid}. Stopping other attacks on this target.{W}"
+                            f"{{G}}Real-time cracker found password for current target {target.bssid}. Stopping other attacks on this target.{{W}}"
                         )
                         # The password saving and session stop is handled by RealtimeCrackManager
                         return True  # Successfully "attacked", move to next target
@@ -173,8 +247,8 @@ class AttackAll(object):
                             target.bssid
                         )
                     ):
-                        Color.pl(
-                            f"{{G}}Stopping real-time cracking for {target.bssid} as {attack.__class__.__name__} succeeded.{W}"
+                        Color.debug(
+                            f"{{G}}Stopping real-time cracking for {target.bssid} as {attack.__class__.__name__} succeeded.{{W}}"
                         )
                         realtime_crack_manager.stop_current_crack_attempt(
                             cleanup_hash_file=False
@@ -200,6 +274,23 @@ class AttackAll(object):
 
         return True  # Keep attacking other targets
 
+    @staticmethod
+    def _build_attack(kind, target, realtime_crack_manager):
+        """Instantiates one attack named by _attack_plan() for `target`."""
+        if kind == "wep":
+            return AttackWEP(target)
+        if kind == "wps_pixie":
+            return AttackWPS(target, pixie_dust=True)
+        if kind == "wps_pin":
+            return AttackWPS(target, pixie_dust=False)
+        if kind == "pmkid":
+            # Pass realtime_crack_manager to AttackPMKID constructor
+            return AttackPMKID(target, realtime_crack_manager)
+        if kind == "wpa":
+            # Pass realtime_crack_manager to AttackWPA constructor
+            return AttackWPA(target, realtime_crack_manager)
+        raise ValueError("Unknown attack kind: %s" % kind)
+
     @classmethod
     def user_wants_to_continue(cls, targets_remaining, attacks_remaining=0):
         """
@@ -236,9 +327,7 @@ class AttackAll(object):
         options += "{R}e{W})"
         prompt += " or {R}exit{W} %s? {C}" % options
 
-        from ..util.input import raw_input
-
-        answer = raw_input(Color.s(prompt)).lower()
+        answer = input(Color.s(prompt)).lower()
 
         if answer.startswith("s"):
             return None  # Skip
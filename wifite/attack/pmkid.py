@@ -8,20 +8,31 @@ from ..util.color import Color
 from ..util.timer import Timer
 from ..model.pmkid_result import CrackResultPMKID
 
-from threading import Thread
+from threading import Event, Thread
+from types import SimpleNamespace
 import os
 import time
 import re
 
+PMKID_FILE_RE = re.compile(".*pmkid_.*\\.16800")
+
 
 class AttackPMKID(Attack):
 
-    def __init__(self, target, realtime_crack_manager=None):
+    def __init__(
+        self, target, realtime_crack_manager=None, cfg=None, tools=None
+    ):
         super(AttackPMKID, self).__init__(target)
+        # Read-only view of Configuration, taken when the attack is created
+        self.cfg = cfg if cfg is not None else Configuration.snapshot()
         self.realtime_crack_manager = realtime_crack_manager
         self.crack_result = None
         self.success = False
         self.pcapng_file = Configuration.temp("pmkid.pcapng")
+        # External tool wrappers; overridable so tests can inject fakes
+        self.tools = tools or SimpleNamespace(
+            HcxDumpTool=HcxDumpTool, HcxPcapTool=HcxPcapTool, Hashcat=Hashcat
+        )
 
     def get_existing_pmkid_file(self, bssid):
         """
@@ -30,30 +41,31 @@ class AttackPMKID(Attack):
             The hashcat hash (hash*bssid*station*essid) if found.
             None if not found.
         """
-        if not os.path.exists(Configuration.wpa_handshake_dir):
-            return None
-
         bssid = bssid.lower().replace(":", "")
 
-        file_re = re.compile(".*pmkid_.*\\.16800")
-        for filename in os.listdir(Configuration.wpa_handshake_dir):
-            pmkid_filename = os.path.join(
-                Configuration.wpa_handshake_dir, filename
-            )
-            if not os.path.isfile(pmkid_filename):
-                continue
-            if not re.match(file_re, pmkid_filename):
-                continue
-
-            with open(pmkid_filename, "r") as pmkid_handle:
-                pmkid_hash = pmkid_handle.read().strip()
-                if pmkid_hash.count("*") < 3:
+        try:
+            entries = os.scandir(self.cfg.wpa_handshake_dir)
+        except FileNotFoundError:
+            return None
+
+        with entries:
+            for entry in entries:
+                # DirEntry caches the file type from readdir; no stat per file
+                if not entry.is_file():
                     continue
-                existing_bssid = (
-                    pmkid_hash.split("*")[1].lower().replace(":", "")
-                )
-                if existing_bssid == bssid:
-                    return pmkid_filename
+                pmkid_filename = entry.path
+                if not PMKID_FILE_RE.match(pmkid_filename):
+                    continue
+
+                with open(pmkid_filename, "r") as pmkid_handle:
+                    pmkid_hash = pmkid_handle.read().strip()
+                    if pmkid_hash.count("*") < 3:
+                        continue
+                    existing_bssid = (
+                        pmkid_hash.split("*")[1].lower().replace(":", "")
+                    )
+                    if existing_bssid == bssid:
+                        return pmkid_filename
         return None
 
     def run(self):
@@ -69,9 +81,9 @@ class AttackPMKID(Attack):
 
         # Check that we have all hashcat programs
         dependencies = [
-            Hashcat.dependency_name,
-            HcxDumpTool.dependency_name,
-            HcxPcapTool.dependency_name,
+            self.tools.Hashcat.dependency_name,
+            self.tools.HcxDumpTool.dependency_name,
+            self.tools.HcxPcapTool.dependency_name,
         ]
         missing_deps = [
             dep for dep in dependencies if not Process.exists(dep)
@@ -85,7 +97,7 @@ class AttackPMKID(Attack):
 
         pmkid_file = None
 
-        if Configuration.ignore_old_handshakes == False:
+        if self.cfg.ignore_old_handshakes == False:
             # Load exisitng PMKID hash from filesystem
             pmkid_file = self.get_existing_pmkid_file(self.target.bssid)
             if pmkid_file is not None:
@@ -105,7 +117,7 @@ class AttackPMKID(Attack):
             return False  # No hash found.
 
         # If real-time cracking is enabled, start a session.
-        if self.realtime_crack_manager and Configuration.hashcat_realtime:
+        if self.realtime_crack_manager and self.cfg.hashcat_realtime:
             if not self.realtime_crack_manager.is_actively_cracking(
                 self.target.bssid
             ) and not self.realtime_crack_manager.get_cracked_password(
@@ -169,19 +181,31 @@ class AttackPMKID(Attack):
             The PMKID hash (str) if found, otherwise None.
         """
         self.keep_capturing = True
-        self.timer = Timer(Configuration.pmkid_timeout)
+        self.stop_capturing = Event()  # Wakes dumptool_thread immediately
+        self.dumptool_exited = Event()
+        self.timer = Timer(self.cfg.pmkid_timeout)
 
         # Start hcxdumptool
         t = Thread(target=self.dumptool_thread)
         t.start()
 
-        # Repeatedly run pcaptool & check output for hash for self.target.essid
+        # Run pcaptool & check output for hash for self.target.essid,
+        # but only when hcxdumptool has written something new.
         pmkid_hash = None
-        pcaptool = HcxPcapTool(self.target)
+        pcaptool = self.tools.HcxPcapTool(self.target)
+        last_signature = None
         while self.timer.remaining() > 0:
-            pmkid_hash = pcaptool.get_pmkid_hash(self.pcapng_file)
-            if pmkid_hash is not None:
-                break  # Got PMKID
+            signature = self._pcapng_signature()
+            if signature is None or signature != last_signature:
+                last_signature = signature
+                pmkid_hash = pcaptool.get_pmkid_hash(self.pcapng_file)
+                if pmkid_hash is not None:
+                    break  # Got PMKID
+
+            if self.dumptool_exited.is_set():
+                # Nothing more will be written; one last look, then give up.
+                pmkid_hash = pcaptool.get_pmkid_hash(self.pcapng_file)
+                break
 
             Color.pattack(
                 "PMKID",
@@ -189,9 +213,10 @@ class AttackPMKID(Attack):
                 "CAPTURE",
                 "Waiting for PMKID ({C}%s{W})" % str(self.timer),
             )
-            time.sleep(1)
+            self.dumptool_exited.wait(1)
 
         self.keep_capturing = False
+        self.stop_capturing.set()
 
         if pmkid_hash is None:
             Color.pattack(
@@ -219,7 +244,7 @@ class AttackPMKID(Attack):
         """
 
         # Check that wordlist exists before cracking.
-        if Configuration.wordlist is None:
+        if self.cfg.wordlist is None:
             Color.pl(
                 "\n{!} {O}Not cracking PMKID "
                 + "because there is no {R}wordlist{O} (re-run with {C}--dict{O})"
@@ -236,13 +261,13 @@ class AttackPMKID(Attack):
                 self.target,
                 "CRACK",
                 "Cracking PMKID using {C}%s{W} ...\n"
-                % Configuration.wordlist,
+                % self.cfg.wordlist,
             )
-            key = Hashcat.crack_pmkid(pmkid_file)
+            key = self.tools.Hashcat.crack_pmkid(pmkid_file)
 
         if key is None:
             # Failed to crack.
-            if Configuration.wordlist is not None:
+            if self.cfg.wordlist is not None:
                 Color.clear_entire_line()
                 Color.pattack(
                     "PMKID",
@@ -266,19 +291,30 @@ class AttackPMKID(Attack):
 
     def dumptool_thread(self):
         """Runs hashcat's hcxdumptool until it dies or `keep_capturing == False`"""
-        dumptool = HcxDumpTool(self.target, self.pcapng_file)
+        dumptool = self.tools.HcxDumpTool(self.target, self.pcapng_file)
 
-        # Let the dump tool run until we have the hash.
+        # Let the dump tool run until we have the hash. Back off between
+        # polls (50ms -> 2s); stop_capturing still wakes us immediately.
+        delay = 0.05
         while self.keep_capturing and dumptool.poll() is None:
-            time.sleep(0.5)
+            self.stop_capturing.wait(delay)
+            delay = min(delay * 1.5, 2.0)
 
         dumptool.interrupt()
+        self.dumptool_exited.set()
+
+    def _pcapng_signature(self):
+        """(size, mtime) of the capture file, or None if it doesn't exist yet"""
+        try:
+            st = os.stat(self.pcapng_file)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
 
     def save_pmkid(self, pmkid_hash):
         """Saves a copy of the pmkid (handshake) to hs/ directory."""
         # Create handshake dir
-        if not os.path.exists(Configuration.wpa_handshake_dir):
-            os.makedirs(Configuration.wpa_handshake_dir)
+        os.makedirs(self.cfg.wpa_handshake_dir, exist_ok=True)
 
         # Generate filesystem-safe filename from bssid, essid and date
         essid_safe = re.sub("[^a-zA-Z0-9]", "", self.target.essid)
@@ -286,7 +322,7 @@ class AttackPMKID(Attack):
         date = time.strftime("%Y-%m-%dT%H-%M-%S")
         pmkid_file = "pmkid_%s_%s_%s.16800" % (essid_safe, bssid_safe, date)
         pmkid_file = os.path.join(
-            Configuration.wpa_handshake_dir, pmkid_file
+            self.cfg.wpa_handshake_dir, pmkid_file
         )
 
         Color.p(
@@ -8,7 +8,6 @@ from ..tools.aircrack import Aircrack
 from ..tools.ifconfig import Ifconfig
 from ..config import Configuration
 from ..util.color import Color
-from ..util.input import raw_input
 from ..model.wep_result import CrackResultWEP
 
 import time
@@ -384,7 +383,7 @@ class AttackWEP(Attack):
             % attack_index
         )
         while True:
-            answer = raw_input(
+            answer = input(
                 Color.s("{?} Select an option ({G}1-%d{W}): " % attack_index)
             )
             if (
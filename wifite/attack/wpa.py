@@ -18,8 +18,10 @@ from shutil import copy
 
 
 class AttackWPA(Attack):
-    def __init__(self, target, realtime_crack_manager=None):
+    def __init__(self, target, realtime_crack_manager=None, cfg=None):
         super(AttackWPA, self).__init__(target)
+        # Read-only view of Configuration, taken when the attack is created
+        self.cfg = cfg if cfg is not None else Configuration.snapshot()
         self.realtime_crack_manager = realtime_crack_manager
         self.clients = []
         self.crack_result = None
@@ -30,7 +32,7 @@ class AttackWPA(Attack):
 
         # Skip if target is not WPS
         if (
-            Configuration.wps_only and self.target.wps == False
+            self.cfg.wps_only and self.target.wps == False
         ):  # Assuming self.target.wps is a boolean or similar
             Color.pl(
                 "\r{!} {O}Skipping WPA-Handshake attack on {R}%s{O} because {R}--wps-only{O} is set{W}"
@@ -40,7 +42,7 @@ class AttackWPA(Attack):
             return self.success
 
         # Skip if user only wants to run PMKID attack
-        if Configuration.use_pmkid_only:
+        if self.cfg.use_pmkid_only:
             self.success = False
             return False
 
@@ -69,7 +71,7 @@ class AttackWPA(Attack):
         if (
             handshake
             and self.realtime_crack_manager
-            and Configuration.hashcat_realtime
+            and self.cfg.hashcat_realtime
         ):
             # Convert .cap to .hccapx for Hashcat using HcxPcapTool
             from ..tools.hashcat import (
@@ -121,7 +123,7 @@ class AttackWPA(Attack):
                 )
 
         # Check wordlist for the traditional aircrack-ng attack
-        if Configuration.wordlist is None:
+        if self.cfg.wordlist is None:
             Color.pl(
                 "{!} {O}Not cracking handshake because"
                 + " wordlist ({R}--dict{O}) is not set"
@@ -129,10 +131,10 @@ class AttackWPA(Attack):
             self.success = False
             return False
 
-        elif not os.path.exists(Configuration.wordlist):
+        elif not os.path.exists(self.cfg.wordlist):
             Color.pl(
                 "{!} {O}Not cracking handshake because"
-                + " wordlist {R}%s{O} was not found" % Configuration.wordlist
+                + " wordlist {R}%s{O} was not found" % self.cfg.wordlist
             )
             self.success = False
             return False
@@ -140,7 +142,7 @@ class AttackWPA(Attack):
         Color.pl(
             "\n{+} {C}Cracking WPA Handshake:{W} Running {C}aircrack-ng{W} with"
             + " {C}%s{W} wordlist"
-            % os.path.split(Configuration.wordlist)[-1]
+            % os.path.split(self.cfg.wordlist)[-1]
         )
 
         # Crack it
@@ -148,7 +150,7 @@ class AttackWPA(Attack):
         if key is None:
             Color.pl(
                 "{!} {R}Failed to crack handshake: {O}%s{R} did not contain password{W}"
-                % Configuration.wordlist.split(os.sep)[-1]
+                % self.cfg.wordlist.split(os.sep)[-1]
             )
             self.success = False
         else:
@@ -184,7 +186,7 @@ class AttackWPA(Attack):
             self.clients = []
 
             # Try to load existing handshake
-            if Configuration.ignore_old_handshakes == False:
+            if self.cfg.ignore_old_handshakes == False:
                 bssid = airodump_target.bssid
                 essid = (
                     airodump_target.essid
@@ -206,8 +208,8 @@ class AttackWPA(Attack):
                     )
                     return handshake
 
-            timeout_timer = Timer(Configuration.wpa_attack_timeout)
-            deauth_timer = Timer(Configuration.wpa_deauth_timeout)
+            timeout_timer = Timer(self.cfg.wpa_attack_timeout)
+            deauth_timer = Timer(self.cfg.wpa_deauth_timeout)
 
             while handshake is None and not timeout_timer.ended():
                 step_timer = Timer(1)
@@ -276,7 +278,7 @@ class AttackWPA(Attack):
                 if deauth_timer.ended():
                     self.deauth(airodump_target)
                     # Restart timer
-                    deauth_timer = Timer(Configuration.wpa_deauth_timeout)
+                    deauth_timer = Timer(self.cfg.wpa_deauth_timeout)
 
                 # Sleep for at-most 1 second
                 time.sleep(step_timer.remaining())
@@ -286,7 +288,7 @@ class AttackWPA(Attack):
             # No handshake, attack failed.
             Color.pl(
                 "\n{!} {O}WPA handshake capture {R}FAILED:{O} Timed out after %d seconds"
-                % (Configuration.wpa_attack_timeout)
+                % (self.cfg.wpa_attack_timeout)
             )
             return handshake
         else:
@@ -295,7 +297,7 @@ class AttackWPA(Attack):
             return handshake
 
     def load_handshake(self, bssid, essid):
-        if not os.path.exists(Configuration.wpa_handshake_dir):
+        if not os.path.exists(self.cfg.wpa_handshake_dir):
             return None
 
         if essid:
@@ -308,9 +310,9 @@ class AttackWPA(Attack):
             "handshake_%s_%s_%s\\.cap" % (essid_safe, bssid_safe, date)
         )
 
-        for filename in os.listdir(Configuration.wpa_handshake_dir):
+        for filename in os.listdir(self.cfg.wpa_handshake_dir):
             cap_filename = os.path.join(
-                Configuration.wpa_handshake_dir, filename
+                self.cfg.wpa_handshake_dir, filename
             )
             if os.path.isfile(cap_filename) and re.match(
                 get_filename, filename
@@ -328,8 +330,8 @@ class AttackWPA(Attack):
             handshake - Instance of Handshake containing bssid, essid, capfile
         """
         # Create handshake dir
-        if not os.path.exists(Configuration.wpa_handshake_dir):
-            os.makedirs(Configuration.wpa_handshake_dir)
+        if not os.path.exists(self.cfg.wpa_handshake_dir):
+            os.makedirs(self.cfg.wpa_handshake_dir)
 
         # Generate filesystem-safe filename from bssid, essid and date
         if handshake.essid and type(handshake.essid) is str:
@@ -344,10 +346,10 @@ class AttackWPA(Attack):
             date,
         )
         cap_filename = os.path.join(
-            Configuration.wpa_handshake_dir, cap_filename
+            self.cfg.wpa_handshake_dir, cap_filename
         )
 
-        if Configuration.wpa_strip_handshake:
+        if self.cfg.wpa_strip_handshake:
             Color.p(
                 "{+} {C}stripping{W} non-handshake packets, saving to {G}%s{W}..."
                 % cap_filename
@@ -371,7 +373,7 @@ class AttackWPA(Attack):
         Args:
             target - The Target to deauth, including clients.
         """
-        if Configuration.no_deauth:
+        if self.cfg.no_deauth:
             return
 
         for index, client in enumerate([None] + self.clients):
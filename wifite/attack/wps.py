@@ -10,8 +10,10 @@ from ..tools.reaver import Reaver
 
 class AttackWPS(Attack):
 
-    @staticmethod
-    def can_attack_wps():
+    @classmethod
+    def can_attack_wps(cls):
+        # Dependency.exists() memoizes the PATH lookups (and forgets them
+        # after an auto-install), so there is nothing to cache here
         return Reaver.exists() or Bully.exists()
 
     def __init__(self, target, pixie_dust=False):
@@ -2,9 +2,10 @@
 # -*- coding: utf-8 -*-
 
 import os
+from collections import namedtuple
+from functools import lru_cache
 
 from .util.color import Color
-from .util.input import raw_input
 from .tools.iwconfig import Iwconfig
 from .tools.macchanger import Macchanger
 
@@ -14,6 +15,7 @@ class Configuration(object):
     
     initialized = False # Flag indicating config has been initialized
     temp_dir = None     # Temporary directory
+    cracked_file = 'cracked.txt' # File to save cracks to, in PWD
     interface = None
     verbose = 0
 
@@ -149,7 +151,7 @@ class Configuration(object):
                 else:
                     question += '1-%d' % len(ifaces)
                 question += '{W}): '
-                selection = raw_input(Color.s(question))
+                selection = input(Color.s(question))
 
                 if selection.strip() in ifaces:
                     selection = str(ifaces.index(selection.strip()) + 1)
@@ -423,6 +425,27 @@ class Configuration(object):
             result += Color.s("{G}%s {W} {C}%s{W}\n" % (key.ljust(max_len),val))
         return result
 
+    @classmethod
+    def snapshot(cls):
+        '''
+            Returns a frozen copy of the current configuration values.
+            AttackWPA and AttackPMKID read their settings from this, so a
+            test can hand an attack its own values (or a stand-in) without
+            patching the class. Everything else still reads Configuration.
+        '''
+        values = {}
+        for (key, val) in cls.__dict__.items():
+            if key.startswith('_') or isinstance(val, (classmethod, staticmethod)):
+                continue
+            values[key] = val
+        return _snapshot_type(tuple(sorted(values)))(**values)
+
+
+@lru_cache(maxsize=None)
+def _snapshot_type(fields):
+    ''' One namedtuple class per set of configuration keys '''
+    return namedtuple('ConfigurationSnapshot', fields)
+
 # Constants for backward compatibility
 VERSION = Configuration.version
 APP_NAME = 'wifite'
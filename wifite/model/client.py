@@ -8,6 +8,9 @@ class Client(object):
     that is associated with an Access Point (e.g. router)
     """
 
+    # Every Target holds a list of these, rebuilt on each scan refresh
+    __slots__ = ("station", "power", "packets", "bssid")
+
     def __init__(self, fields):
         """
         Initializes & stores client info based on fields.
@@ -30,8 +33,8 @@ class Client(object):
     def __str__(self):
         """String representation of a Client"""
         result = ""
-        for key, value in self.__dict__.items():
-            result += key + ": " + str(value)
+        for key in self.__slots__:
+            result += key + ": " + str(getattr(self, key))
             result += ", "
         return result
 
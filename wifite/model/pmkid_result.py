@@ -41,11 +41,11 @@ class CrackResultPMKID(CrackResult):
             Color.pl("{!} %s  {O}key unknown{W}" % "".rjust(19))
 
     def print_single_line(self, longest_essid):
-        self.print_single_line_prefix(longest_essid)
-        Color.p("{G}%s{W}" % "PMKID".ljust(5))
-        Color.p("  ")
-        Color.p("Key: {G}%s{W}" % self.key)
-        Color.pl("")
+        # One write per row
+        Color.pl(
+            self.single_line_prefix(longest_essid)
+            + "{G}PMKID{W}  Key: {G}%s{W}" % self.key
+        )
 
     def to_dict(self):
         return {
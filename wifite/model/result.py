@@ -11,10 +11,48 @@ and PMKID attacks. Compatible with Python 3.13.5.
 import json
 import os
 import time
+from functools import lru_cache
 
 from ..config import Configuration
 from ..util.color import Color
 
+try:
+    import orjson  # Optional speedup: pip install wifite[speedups]
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=4096)
+def _readable_date(timestamp):
+    """Formats an epoch timestamp as local 'YYYY-mm-dd HH:MM:SS'."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+def _json_loads(data):
+    """Parses JSON from str or bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(results):
+    """
+    Serializes a list of results to UTF-8 JSON bytes: one compact object per
+    line, so the file stays small but can still be read and grepped.
+    """
+    if orjson is not None:
+        rows = [orjson.dumps(entry) for entry in results]
+    else:
+        rows = [
+            json.dumps(entry, separators=(",", ":"), ensure_ascii=False).encode(
+                "utf-8"
+            )
+            for entry in results
+        ]
+    if not rows:
+        return b"[]\n"
+    return b"[\n" + b",\n".join(rows) + b"\n]\n"
+
 
 class CrackResult:
     """Abstract base class for crack session results.
@@ -26,12 +64,16 @@ class CrackResult:
 
     # File to save cracks to, in PWD
     cracked_file = Configuration.cracked_file
+    # ((path, (mtime_ns, size)), results, dedup keys) of the cracked file,
+    # so repeated saves don't re-read and re-scan it
+    _saved_cache = None
+    # "type" -> factory(json), built on first load() (the subclasses import
+    # this module, so they can't be imported at the top)
+    _loaders = None
 
     def __init__(self):
         self.date = int(time.time())
-        self.readable_date = time.strftime(
-            "%Y-%m-%d %H:%M:%S", time.localtime(self.date)
-        )
+        self.readable_date = _readable_date(self.date)
 
     def dump(self):
         raise Exception("Unimplemented method: dump()")
@@ -42,44 +84,87 @@ class CrackResult:
     def print_single_line(self, longest_essid):
         raise Exception("Unimplemented method: print_single_line()")
 
-    def print_single_line_prefix(self, longest_essid):
+    def single_line_prefix(self, longest_essid):
+        """Returns the ESSID/BSSID/DATE columns of a display() row (colored format)."""
         essid = self.essid if self.essid else "N/A"
-        Color.p("{W} ")
-        Color.p("{C}%s{W}" % essid.ljust(longest_essid))
-        Color.p("  ")
-        Color.p("{GR}%s{W}" % self.bssid.ljust(17))
-        Color.p("  ")
-        Color.p("{D}%s{W}" % self.readable_date.ljust(19))
-        Color.p("  ")
+        return "{W} {C}%s{W}  {GR}%s{W}  {D}%s{W}  " % (
+            essid.ljust(longest_essid),
+            self.bssid.ljust(17),
+            self.readable_date.ljust(19),
+        )
+
+    def print_single_line_prefix(self, longest_essid):
+        Color.p(self.single_line_prefix(longest_essid))
+
+    @staticmethod
+    def _dedup_key(entry):
+        """Identity of a saved result for duplicate checks: all fields but the date."""
+        return tuple(sorted((k, v) for k, v in entry.items() if k != "date"))
+
+    @classmethod
+    def _load_saved(cls, name):
+        """
+        Returns (results, dedup keys) for the cracked file, re-reading it only
+        when its size/mtime differ from what this process last read or wrote.
+        """
+        try:
+            st = os.stat(name)
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+
+        cache = CrackResult._saved_cache
+        if cache is not None and cache[0] == (name, signature):
+            return cache[1], cache[2]
 
-    def save(self):
-        """Adds this crack result to the cracked file and saves it."""
-        name = CrackResult.cracked_file
         saved_results = []
-        if os.path.exists(name):
-            with open(name, "r", encoding="utf-8") as fid:
-                text = fid.read()
+        if signature is not None:
+            with open(name, "rb") as fid:
+                data = fid.read()
             try:
-                saved_results = json.loads(text)
-            except json.JSONDecodeError as e:
+                saved_results = _json_loads(data)
+            except json.JSONDecodeError as e:  # orjson's error subclasses it
                 Color.pl(f"{{!}} error while loading {name}: {str(e)}")
 
+        keys = set()
+        for entry in saved_results:
+            try:
+                keys.add(cls._dedup_key(entry))
+            except (AttributeError, TypeError):
+                pass  # Malformed entry; it can't match a new result anyway
+        CrackResult._saved_cache = ((name, signature), saved_results, keys)
+        return saved_results, keys
+
+    def save(self):
+        """Adds this crack result to the cracked file and saves it."""
+        name = CrackResult.cracked_file
+        saved_results, keys = self._load_saved(name)
+
         # Check for duplicates
         this_dict = self.to_dict()
-        this_dict.pop("date")
-        for entry in saved_results:
-            this_dict["date"] = entry.get("date")
-            if entry == this_dict:
-                # Skip if we already saved this BSSID+ESSID+TYPE+KEY
-                Color.pl(
-                    "{+} {C}%s{O} already exists in {G}%s{O}, skipping."
-                    % (self.essid, Configuration.cracked_file)
-                )
-                return
-
-        saved_results.append(self.to_dict())
-        with open(name, "w", encoding="utf-8") as fid:
-            fid.write(json.dumps(saved_results, indent=2))
+        this_key = self._dedup_key(this_dict)
+        if this_key in keys:
+            # Skip if we already saved this BSSID+ESSID+TYPE+KEY
+            Color.pl(
+                "{+} {C}%s{O} already exists in {G}%s{O}, skipping."
+                % (self.essid, Configuration.cracked_file)
+            )
+            return
+
+        saved_results.append(this_dict)
+        keys.add(this_key)
+        # One write to a temp file, then an atomic rename: an interrupted
+        # save can't truncate the existing results
+        tmp = name + ".tmp"
+        with open(tmp, "wb") as fid:
+            fid.write(_json_dumps(saved_results))
+        os.replace(tmp, name)
+        st = os.stat(name)
+        CrackResult._saved_cache = (
+            (name, (st.st_mtime_ns, st.st_size)),
+            saved_results,
+            keys,
+        )
         Color.pl(
             f"{{+}} saved crack result to {{C}}{name}{{W}} "
             f"({{G}}{len(saved_results)} total{{W}})"
@@ -93,8 +178,8 @@ class CrackResult:
             Color.pl("{!} {O}file {C}%s{O} not found{W}" % name)
             return
 
-        with open(name, "r", encoding="utf-8") as fid:
-            cracked_targets = json.loads(fid.read())
+        with open(name, "rb") as fid:
+            cracked_targets = _json_loads(fid.read())
 
         if len(cracked_targets) == 0:
             Color.pl("{!} {R}no results found in {O}%s{W}" % name)
@@ -105,13 +190,11 @@ class CrackResult:
             % (len(cracked_targets), name)
         )
 
-        results = sorted(
-            [cls.load(item) for item in cracked_targets],
-            key=lambda x: x.date,
-            reverse=True,
-        )
+        # Sort and measure the raw entries; result objects are built one
+        # row at a time while printing instead of all up front.
+        cracked_targets.sort(key=lambda item: item["date"], reverse=True)
         longest_essid = max(
-            [len(result.essid or "ESSID") for result in results]
+            len(item.get("essid") or "ESSID") for item in cracked_targets
         )
 
         # Header
@@ -129,8 +212,8 @@ class CrackResult:
         Color.p(" " + "-" * (longest_essid + 17 + 19 + 5 + 11 + 12))
         Color.pl("{W}")
         # Results
-        for result in results:
-            result.print_single_line(longest_essid)
+        for item in cracked_targets:
+            cls.load(item).print_single_line(longest_essid)
         Color.pl("")
 
     @classmethod
@@ -138,49 +221,41 @@ class CrackResult:
         """Load all crack results from the cracked file."""
         if not os.path.exists(cls.cracked_file):
             return []
-        with open(cls.cracked_file, "r", encoding="utf-8") as json_file:
-            result_json = json.loads(json_file.read())
+        with open(cls.cracked_file, "rb") as json_file:
+            result_json = _json_loads(json_file.read())
         return result_json
 
+    @staticmethod
+    def _build_loaders():
+        """Returns the "type" -> factory(json) table used by load()."""
+        from .wpa_result import CrackResultWPA
+        from .wep_result import CrackResultWEP
+        from .wps_result import CrackResultWPS
+        from .pmkid_result import CrackResultPMKID
+
+        return {
+            "WPA": lambda j: CrackResultWPA(
+                j["bssid"], j["essid"], j["handshake_file"], j["key"]
+            ),
+            "WEP": lambda j: CrackResultWEP(
+                j["bssid"], j["essid"], j["hex_key"], j["ascii_key"]
+            ),
+            "WPS": lambda j: CrackResultWPS(
+                j["bssid"], j["essid"], j["pin"], j["psk"]
+            ),
+            "PMKID": lambda j: CrackResultPMKID(
+                j["bssid"], j["essid"], j["pmkid_file"], j["key"]
+            ),
+        }
+
     @staticmethod
     def load(json):
         """Returns an instance of the appropriate object given a json instance"""
-        if json["type"] == "WPA":
-            from .wpa_result import CrackResultWPA
-
-            result = CrackResultWPA(
-                json["bssid"],
-                json["essid"],
-                json["handshake_file"],
-                json["key"],
-            )
-        elif json["type"] == "WEP":
-            from .wep_result import CrackResultWEP
-
-            result = CrackResultWEP(
-                json["bssid"],
-                json["essid"],
-                json["hex_key"],
-                json["ascii_key"],
-            )
-
-        elif json["type"] == "WPS":
-            from .wps_result import CrackResultWPS
-
-            result = CrackResultWPS(
-                json["bssid"], json["essid"], json["pin"], json["psk"]
-            )
-
-        elif json["type"] == "PMKID":
-            from .pmkid_result import CrackResultPMKID
-
-            result = CrackResultPMKID(
-                json["bssid"], json["essid"], json["pmkid_file"], json["key"]
-            )
+        if CrackResult._loaders is None:
+            CrackResult._loaders = CrackResult._build_loaders()
+        result = CrackResult._loaders[json["type"]](json)
         result.date = json["date"]
-        result.readable_date = time.strftime(
-            "%Y-%m-%d %H:%M:%S", time.localtime(result.date)
-        )
+        result.readable_date = _readable_date(result.date)
         return result
 
 
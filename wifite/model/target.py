@@ -3,7 +3,40 @@
 
 from ..util.color import Color
 
-import re
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+
+# Lower bound (Mb/s, inclusive) of each inferred Wi-Fi standard
+_SPEED_BOUNDS = (1, 23, 55, 300, 1200, 6000)
+_WIFI_STANDARDS = (None, "b", "g", "n", "ac", "ax", "be")
+# str.translate table that drops every non-digit (Latin-1) character
+_KEEP_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(256) if not chr(c).isdigit())
+)
+
+# Target.encryption_family values, shared by all targets. WPA2/WPA3 include
+# "WPA" so `"WPA" in family` matches them, like the substring test did.
+_FAMILY_WPA3 = frozenset({"WPA", "WPA3"})
+_FAMILY_WPA2 = frozenset({"WPA", "WPA2"})
+_FAMILY_WPA = frozenset({"WPA"})
+_FAMILY_WEP = frozenset({"WEP"})
+_FAMILY_OWE = frozenset({"OWE"})
+_FAMILY_OPEN = frozenset({"OPEN"})
+_FAMILY_UNKNOWN = frozenset()
+# (Privacy token, family) in precedence order; the token is Target.encryption
+_ENCRYPTION_ORDER = (
+    ("WPA3", _FAMILY_WPA3),
+    ("OWE", _FAMILY_OWE),
+    ("WPA2", _FAMILY_WPA2),
+    ("WPA", _FAMILY_WPA),
+    ("WEP", _FAMILY_WEP),
+)
+
+# Broadcast BSSIDs and multicast BSSID prefixes (lowercase), filtered by
+# Target.validate()
+_BSSID_BCAST = frozenset({"ff:ff:ff:ff:ff:ff", "00:00:00:00:00:00"})
+_BSSID_MCAST = ("01:00:5e", "01:80:c2", "33:33")
 
 
 class WPSState:
@@ -15,6 +48,27 @@ class Target(object):
     Holds details for a 'Target' aka Access Point (e.g. router).
     """
 
+    # Scans create one Target per AP on every refresh; skip the per-instance __dict__
+    __slots__ = (
+        "bssid",
+        "channel",
+        "is_wpa3",
+        "is_owe",
+        "encryption",
+        "encryption_family",
+        "has_qos",
+        "wifi_standard",
+        "power",
+        "beacons",
+        "ivs",
+        "essid_known",
+        "essid_len",
+        "essid",
+        "wps",
+        "decloaked",
+        "clients",
+    )
+
     def __init__(self, fields):
         """
         Initializes & stores target info based on fields.
@@ -38,64 +92,19 @@ class Target(object):
                 14 Key            ()
         """
         self.bssid = fields[0].strip()
-        self.channel = fields[3].strip()
-
-        privacy_str = fields[5].strip()
-        self.is_wpa3 = 'WPA3' in privacy_str
-        # If WPA3 is present, treat network as WPA3 and ignore OWE flag
-        self.is_owe = 'OWE' in privacy_str and not self.is_wpa3
-
-        # Determine base encryption type
-        if self.is_wpa3:
-            self.encryption = "WPA3"
-        elif self.is_owe:
-            self.encryption = "OWE"
-        elif (
-            "WPA2" in privacy_str
-        ):  # WPA2 might be present with WPA3, WPA3 takes precedence
-            self.encryption = "WPA2"
-        elif "WPA" in privacy_str:  # Check for WPA (without 2 or 3)
-            self.encryption = "WPA"
-        elif "WEP" in privacy_str:
-            self.encryption = "WEP"
-        else:
-            # Fallback for open or unknown networks, ensure it's not too long
-            self.encryption = privacy_str.split(" ")[0]  # Take the first part
-            if len(self.encryption) > 4:
-                self.encryption = self.encryption[0:4].strip()
-
-        # Wi-Fi Standard inference based on speed
-        # Speed is at fields[4]
-        speed_str = fields[4].strip()
-        mb_val = 0
-        self.has_qos = "e" in speed_str  # Airodump appends 'e' for QoS (802.11e)
-        if speed_str:
-            # Remove 'e' and any other non-numeric parts for parsing
-            numeric_part = "".join(filter(str.isdigit, speed_str.split(".")[0]))
-            if numeric_part:
-                mb_val = int(numeric_part)
-
-        self.wifi_standard = None
-        if mb_val >= 6000:  # Theoretical speeds for Wi-Fi 7 (802.11be)
-            self.wifi_standard = "be"
-        elif mb_val >= 1200:  # Wi-Fi 6 (802.11ax) common rates
-            self.wifi_standard = "ax"
-        elif mb_val > 54:  # Speeds potentially indicating 802.11n or 802.11ac
-            if mb_val >= 300:  # Higher speeds are more likely ac
-                self.wifi_standard = "ac"
-            else:  # Lower end of "high speeds" could be n
-                self.wifi_standard = "n"
-        elif mb_val > 22:  # 802.11g
-            self.wifi_standard = "g"
-        elif mb_val > 0:  # 802.11b or b+
-            self.wifi_standard = "b"  # Simplified, could be b+ if speed > 11
-
-        # Refine based on QoS if 'e' was present and standard is not already advanced
-        if self.has_qos and self.wifi_standard in ["g", "b"]:
-            # If it's g/b but has QoS, it's likely n (or at least g with e).
-            # For simplicity, let's ensure 'n' if QoS is present and not already ac/ax/be
-            if self.wifi_standard == "g":  # g with QoS often implies n capabilities
-                self.wifi_standard = "n"
+        # Channels, encryption names & ESSIDs repeat across targets; intern
+        # them so every Target shares one string object per value.
+        self.channel = sys.intern(fields[3].strip())
+
+        # Privacy and speed strings take few distinct values across a scan;
+        # classify each distinct string once.
+        (
+            self.is_wpa3,
+            self.is_owe,
+            self.encryption,
+            self.encryption_family,
+        ) = _classify_privacy(fields[5].strip())
+        self.has_qos, self.wifi_standard = _classify_speed(fields[4].strip())
 
         self.power = int(fields[8].strip())
         if self.power < 0:
@@ -106,7 +115,7 @@ class Target(object):
 
         self.essid_known = True
         self.essid_len = int(fields[12].strip())
-        self.essid = fields[13]
+        self.essid = sys.intern(fields[13])
         if (
             self.essid == "\\x00" * self.essid_len
             or self.essid == "x00" * self.essid_len
@@ -130,14 +139,11 @@ class Target(object):
             raise Exception("Ignoring target with Negative-One (-1) channel")
 
         # Filter broadcast/multicast BSSIDs, see https://github.com/derv82/wifite2/issues/32
-        bssid_broadcast = re.compile(
-            r"^(ff:ff:ff:ff:ff:ff|00:00:00:00:00:00)$", re.IGNORECASE
-        )
-        if bssid_broadcast.match(self.bssid):
+        bssid = self.bssid.lower()
+        if bssid in _BSSID_BCAST:
             raise Exception("Ignoring target with Broadcast BSSID (%s)" % self.bssid)
 
-        bssid_multicast = re.compile(r"^(01:00:5e|01:80:c2|33:33)", re.IGNORECASE)
-        if bssid_multicast.match(self.bssid):
+        if bssid.startswith(_BSSID_MCAST):
             raise Exception("Ignoring target with Multicast BSSID (%s)" % self.bssid)
 
     def to_str(self, show_bssid=False):
@@ -145,92 +151,170 @@ class Target(object):
         *Colored* string representation of this Target.
         Specifically formatted for the 'scanning' table view.
         """
-
-        max_essid_len = 24
-        essid = self.essid if self.essid_known else "(%s)" % self.bssid
-        # Trim ESSID (router name) if needed
-        if len(essid) > max_essid_len:
-            essid = essid[0 : max_essid_len - 3] + "..."
-        else:
-            essid = essid.rjust(max_essid_len)
-
-        if self.essid_known:
-            # Known ESSID
-            essid = Color.s("{C}%s" % essid)
-        else:
-            # Unknown ESSID
-            essid = Color.s("{O}%s" % essid)
-
-        # Add a '*' if we decloaked the ESSID
-        decloaked_char = "*" if self.decloaked else " "
-        # essid += Color.s('{P}%s' % decloaked_char) # Decloak marker can be integrated or removed if too cluttered
-
-        # Display Wi-Fi standard if known
-        std_str = ""
-        if self.wifi_standard:
-            std_str = Color.s("{C}[%s]" % self.wifi_standard.upper())
-
-        essid_display = "%s%s %s" % (
-            essid,
-            Color.s("{P}%s" % decloaked_char),
-            std_str,
+        # The scanner redraws every target each refresh; only re-format
+        # when something that is displayed has changed.
+        return _format_target(
+            self.essid,
+            self.essid_known,
+            self.bssid,
+            self.decloaked,
+            self.wifi_standard,
+            show_bssid,
+            self.channel,
+            self.encryption,
+            self.power,
+            self.wps,
+            len(self.clients),
         )
 
-        if show_bssid:
-            bssid = Color.s("{O}%s  " % self.bssid)
-        else:
-            bssid = ""
-
-        channel_color = "{G}"
-        if int(self.channel) > 14:
-            channel_color = "{C}"
-        channel = Color.s("%s%s" % (channel_color, str(self.channel).rjust(3)))
-
-        encryption = self.encryption.rjust(4)
-        if "WEP" in encryption:
-            encryption = Color.s("{G}%s" % encryption)
-        elif "WPA3" in encryption:
-            encryption = Color.s("{R}%s" % encryption)  # Red for WPA3
-        elif "OWE" in encryption:
-            encryption = Color.s("{M}%s" % encryption)  # Magenta for OWE
-        elif "WPA2" in encryption:  # Keep WPA2 as Orange
-            encryption = Color.s("{O}%s" % encryption)
-        elif "WPA" in encryption:  # Original WPA also Orange
-            encryption = Color.s("{O}%s" % encryption)
-
-        power = "%sdb" % str(self.power).rjust(3)
-        if self.power > 50:
-            color = "G"
-        elif self.power > 35:
-            color = "O"
-        else:
-            color = "R"
-        power = Color.s("{%s}%s" % (color, power))
-
-        if self.wps == WPSState.UNLOCKED:
-            wps = Color.s("{G} yes")
-        elif self.wps == WPSState.NONE:
-            wps = Color.s("{O}  no")
-        elif self.wps == WPSState.LOCKED:
-            wps = Color.s("{R}lock")
-        elif self.wps == WPSState.UNKNOWN:
-            wps = Color.s("{O} n/a")
-
-        clients = "       "
-        if len(self.clients) > 0:
-            clients = Color.s("{G}  " + str(len(self.clients)))
-
-        result = "%s  %s%s  %s  %s  %s  %s" % (
-            essid_display.ljust(max_essid_len + 8),  # Adjusted ljust for new std_str
-            bssid,
-            channel,
-            encryption,
-            power,
-            wps,
-            clients,
-        )
-        result += Color.s("{W}")
-        return result
+
+@lru_cache(maxsize=256)
+def _classify_privacy(privacy_str):
+    """
+    Returns (is_wpa3, is_owe, encryption, encryption_family) for an
+    airodump Privacy string.
+    """
+    is_wpa3 = "WPA3" in privacy_str
+    # If WPA3 is present, treat network as WPA3 and ignore OWE flag
+    is_owe = "OWE" in privacy_str and not is_wpa3
+
+    # First matching token wins: WPA3 > OWE > WPA2 > WPA > WEP
+    for token, family in _ENCRYPTION_ORDER:
+        if token in privacy_str:
+            return is_wpa3, is_owe, token, family
+
+    # Fallback for open or unknown networks, ensure it's not too long
+    encryption = privacy_str.split(" ")[0]  # Take the first part
+    if len(encryption) > 4:
+        encryption = encryption[0:4].strip()
+    encryption = sys.intern(encryption)
+    family = _FAMILY_OPEN if encryption == "OPN" else _FAMILY_UNKNOWN
+    return is_wpa3, is_owe, encryption, family
+
+
+@lru_cache(maxsize=256)
+def _classify_speed(speed_str):
+    """Returns (has_qos, wifi_standard) for an airodump Speed string."""
+    mb_val = 0
+    has_qos = "e" in speed_str  # Airodump appends 'e' for QoS (802.11e)
+    if speed_str:
+        # Remove 'e' and any other non-numeric parts for parsing
+        numeric_part = speed_str.split(".", 1)[0].translate(_KEEP_DIGITS)
+        if numeric_part:
+            mb_val = int(numeric_part)
+
+    # be: theoretical Wi-Fi 7 speeds, ax: Wi-Fi 6, ac: higher 11n/ac speeds,
+    # n: lower "high speeds", g: 802.11g, b: 802.11b (or b+)
+    wifi_standard = _WIFI_STANDARDS[bisect_right(_SPEED_BOUNDS, mb_val)]
+
+    # Refine based on QoS if 'e' was present: g with QoS often implies n
+    # capabilities
+    if has_qos and wifi_standard == "g":
+        wifi_standard = "n"
+    return has_qos, wifi_standard
+
+
+@lru_cache(maxsize=4096)
+def _format_target(
+    essid,
+    essid_known,
+    bssid,
+    decloaked,
+    wifi_standard,
+    show_bssid,
+    channel,
+    encryption,
+    power,
+    wps,
+    num_clients,
+):
+    """Formats Target.to_str() from its displayed fields (memoized)"""
+
+    max_essid_len = 24
+    essid = essid if essid_known else "(%s)" % bssid
+    # Trim ESSID (router name) if needed
+    if len(essid) > max_essid_len:
+        essid = essid[0 : max_essid_len - 3] + "..."
+    else:
+        essid = essid.rjust(max_essid_len)
+
+    if essid_known:
+        # Known ESSID
+        essid = Color.s("{C}%s" % essid)
+    else:
+        # Unknown ESSID
+        essid = Color.s("{O}%s" % essid)
+
+    # Add a '*' if we decloaked the ESSID
+    decloaked_char = "*" if decloaked else " "
+    # essid += Color.s('{P}%s' % decloaked_char) # Decloak marker can be integrated or removed if too cluttered
+
+    # Display Wi-Fi standard if known
+    std_str = ""
+    if wifi_standard:
+        std_str = Color.s("{C}[%s]" % wifi_standard.upper())
+
+    essid_display = "%s%s %s" % (
+        essid,
+        Color.s("{P}%s" % decloaked_char),
+        std_str,
+    )
+
+    if show_bssid:
+        bssid = Color.s("{O}%s  " % bssid)
+    else:
+        bssid = ""
+
+    channel_color = "{G}"
+    if int(channel) > 14:
+        channel_color = "{C}"
+    channel = Color.s("%s%s" % (channel_color, str(channel).rjust(3)))
+
+    encryption = encryption.rjust(4)
+    if "WEP" in encryption:
+        encryption = Color.s("{G}%s" % encryption)
+    elif "WPA3" in encryption:
+        encryption = Color.s("{R}%s" % encryption)  # Red for WPA3
+    elif "OWE" in encryption:
+        encryption = Color.s("{M}%s" % encryption)  # Magenta for OWE
+    elif "WPA2" in encryption:  # Keep WPA2 as Orange
+        encryption = Color.s("{O}%s" % encryption)
+    elif "WPA" in encryption:  # Original WPA also Orange
+        encryption = Color.s("{O}%s" % encryption)
+
+    power_str = "%sdb" % str(power).rjust(3)
+    if power > 50:
+        color = "G"
+    elif power > 35:
+        color = "O"
+    else:
+        color = "R"
+    power_str = Color.s("{%s}%s" % (color, power_str))
+
+    if wps == WPSState.UNLOCKED:
+        wps = Color.s("{G} yes")
+    elif wps == WPSState.NONE:
+        wps = Color.s("{O}  no")
+    elif wps == WPSState.LOCKED:
+        wps = Color.s("{R}lock")
+    elif wps == WPSState.UNKNOWN:
+        wps = Color.s("{O} n/a")
+
+    clients = "       "
+    if num_clients > 0:
+        clients = Color.s("{G}  " + str(num_clients))
+
+    result = "%s  %s%s  %s  %s  %s  %s" % (
+        essid_display.ljust(max_essid_len + 8),  # Adjusted ljust for new std_str
+        bssid,
+        channel,
+        encryption,
+        power_str,
+        wps,
+        clients,
+    )
+    result += Color.s("{W}")
+    return result
 
 
 if __name__ == "__main__":
@@ -24,13 +24,12 @@ class CrackResultWEP(CrackResult):
             Color.pl("{+}  Ascii Key: {G}%s{W}" % self.ascii_key)
 
     def print_single_line(self, longest_essid):
-        self.print_single_line_prefix(longest_essid)
-        Color.p("{G}%s{W}" % "WEP".ljust(5))
-        Color.p("  ")
-        Color.p("Hex: {G}%s{W}" % self.hex_key.replace(":", ""))
+        # One write per row
+        line = self.single_line_prefix(longest_essid)
+        line += "{G}WEP  {W}  Hex: {G}%s{W}" % self.hex_key.replace(":", "")
         if self.ascii_key:
-            Color.p(" (ASCII: {G}%s{W})" % self.ascii_key)
-        Color.pl("")
+            line += " (ASCII: {G}%s{W})" % self.ascii_key
+        Color.pl(line)
 
     def to_dict(self):
         return {
@@ -27,13 +27,11 @@ class CrackResultWPS(CrackResult):
         Color.pl("{+} %s: {G}%s{W}" % ("PSK/Password".rjust(12), psk))
 
     def print_single_line(self, longest_essid):
-        self.print_single_line_prefix(longest_essid)
-        Color.p("{G}%s{W}" % "WPS".ljust(5))
-        Color.p("  ")
+        # One write per row
+        line = self.single_line_prefix(longest_essid) + "{G}WPS  {W}  "
         if self.psk:
-            Color.p("Key: {G}%s{W} " % self.psk)
-        Color.p("PIN: {G}%s{W}" % self.pin)
-        Color.pl("")
+            line += "Key: {G}%s{W} " % self.psk
+        Color.pl(line + "PIN: {G}%s{W}" % self.pin)
 
     def to_dict(self):
         return {
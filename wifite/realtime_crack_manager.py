@@ -8,7 +8,11 @@ for WPA/WPA2 and PMKID attacks. It manages wordlist queues, crack sessions,
 and provides status updates for ongoing attacks.
 """
 
+import json
 import os
+import re
+import time
+from collections import deque
 
 from .config import Configuration
 from .model.wpa_result import CrackResultWPA
@@ -18,17 +22,65 @@ from .util.color import Color
 # Color shortcuts for consistent usage
 W = ""  # White/reset color
 
+# Hashcat/wifite by-products that may sit next to wordlists
+_NON_WORDLIST_SUFFIXES = frozenset(
+    {".potfile", ".out", ".log", ".session", ".restore"}
+)
+_WORDLIST_SNIFF_BYTES = 4096
+_GZIP_MAGIC = b"\x1f\x8b"
+# Hashcat status lines worth echoing (all lines are shown with -vvv)
+_STATUS_LINE_RE = re.compile(
+    r"STATUS|SPEED|PROGRESS|RECOVERED|REJECTED|EXHAUSTED", re.IGNORECASE
+)
+# Directories with at least this many candidates are probed concurrently
+_PARALLEL_PROBE_MIN = 8
+_PARALLEL_PROBE_WORKERS = 16
+# Per-file sniff results, kept across runs: {path: [mtime_ns, size, valid]}
+_META_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "wifite", "wordlist_meta.json"
+)
+# Most recently sniffed entries kept in _META_CACHE_FILE
+_META_CACHE_MAX = 4096
+
 
 class RealtimeCrackManager:
+    # Minimum seconds between Hashcat status polls (see update_status)
+    STATUS_POLL_INTERVAL = 0.5
+
+    # Attributes are read on every status poll; slots avoid the instance
+    # __dict__ (and still show up on autospec'd mocks, which AttackAll's
+    # active_session checks rely on)
+    __slots__ = (
+        "config",
+        "active_session",
+        "current_target_bssid",
+        "current_target_essid",
+        "current_hash_file_path",
+        "current_hash_type",
+        "wordlist_queue",
+        "current_wordlist_path",
+        "consecutive_hashcat_errors",
+        "max_hashcat_errors",
+        "realtime_cracked_passwords",
+        "_last_status_poll",
+        "_cached_status",
+    )
+
+    # Validated wordlist paths per directory: {dir: (dir mtime, [paths])}
+    _dir_scan_cache = {}
+    # Loaded lazily from _META_CACHE_FILE
+    _meta_cache = None
+
     def __init__(self, config):
         self.config = config  # Should be an instance of Configuration
         self.active_session: RealtimeHashcatSession = None
         self.current_target_bssid = None
+        self.current_target_essid = None
         self.current_hash_file_path = (
             None  # Path to the file Hashcat is currently working on
         )
         self.current_hash_type = None
-        self.wordlist_queue = []
+        self.wordlist_queue = deque()
         self.current_wordlist_path = None
         self.consecutive_hashcat_errors = 0
         self.max_hashcat_errors = (
@@ -36,9 +88,11 @@ class RealtimeCrackManager:
         )
         # Stores BSSID:password for already cracked targets in this Wifite session by real-time cracker
         self.realtime_cracked_passwords = {}
+        self._last_status_poll = None  # time.monotonic() of the last poll
+        self._cached_status = None  # What the last real poll returned
 
     def _load_wordlists(self):
-        self.wordlist_queue = []
+        self.wordlist_queue = deque()
         if Configuration.hashcat_realtime_wordlist_file:
             if (
                 os.path.exists(Configuration.hashcat_realtime_wordlist_file)
@@ -50,26 +104,11 @@ class RealtimeCrackManager:
         elif Configuration.hashcat_realtime_wordlist_dir:
             if os.path.isdir(Configuration.hashcat_realtime_wordlist_dir):
                 try:
-                    for filename in sorted(
-                        os.listdir(Configuration.hashcat_realtime_wordlist_dir)
-                    ):
-                        filepath = os.path.join(
-                            Configuration.hashcat_realtime_wordlist_dir,
-                            filename,
+                    self.wordlist_queue.extend(
+                        self._scan_wordlist_dir(
+                            Configuration.hashcat_realtime_wordlist_dir
                         )
-                        if os.path.isfile(filepath) and os.path.getsize(filepath) > 0:
-                            # Basic check: avoid adding .potfile, .out, .log etc.
-                            if not any(
-                                ext in filename.lower()
-                                for ext in [
-                                    ".potfile",
-                                    ".out",
-                                    ".log",
-                                    ".session",
-                                    ".restore",
-                                ]
-                            ):
-                                self.wordlist_queue.append(filepath)
+                    )
                 except OSError as e:
                     Color.pl(f"{{R}}Real-time: Error reading wordlist directory {{O}}{Configuration.hashcat_realtime_wordlist_dir}{{R}}: {e}{{W}}")
             else:
@@ -78,6 +117,138 @@ class RealtimeCrackManager:
         if not self.wordlist_queue:
             Color.pl(f"{{R}}Real-time: No valid wordlists found. Real-time cracking disabled for this target.{{W}}")
 
+    @staticmethod
+    def _dir_mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def _scan_wordlist_dir(cls, wordlist_dir):
+        """
+        Returns the sorted list of usable wordlists in wordlist_dir.
+        Results are cached per directory until its mtime changes, since
+        AttackAll reloads the wordlists for every target.
+        """
+        mtime = cls._dir_mtime(wordlist_dir)
+        cached = cls._dir_scan_cache.get(wordlist_dir)
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+        meta = cls._load_meta_cache()
+        meta_changed = False
+        wordlists = []
+        # One readdir pass; DirEntry caches the file type
+        with os.scandir(wordlist_dir) as entries:
+            candidates = [
+                entry
+                for entry in sorted(entries, key=lambda e: e.name)
+                # Basic check: avoid adding .potfile, .out, .log etc.
+                if os.path.splitext(entry.name)[1].lower() not in _NON_WORDLIST_SUFFIXES
+                and entry.is_file()
+            ]
+
+        def probe(entry):
+            return cls._probe_wordlist(entry, meta.get(entry.path))
+
+        if len(candidates) >= _PARALLEL_PROBE_MIN:
+            # stat() and the sniff read block on I/O (NFS/SMB, spinning
+            # disks) with the GIL released, so overlap them.
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(
+                max_workers=min(_PARALLEL_PROBE_WORKERS, len(candidates))
+            ) as pool:
+                records = list(pool.map(probe, candidates))
+        else:
+            records = [probe(entry) for entry in candidates]
+
+        for entry, record in zip(candidates, records):
+            if record is None:
+                continue  # Empty file
+            if meta.get(entry.path) is not record:
+                # Re-insert so the dict stays ordered oldest-first
+                meta.pop(entry.path, None)
+                meta[entry.path] = record
+                meta_changed = True
+            if record[2]:
+                wordlists.append(entry.path)
+
+        if meta_changed:
+            cls._save_meta_cache()
+        if mtime is not None:
+            cls._dir_scan_cache[wordlist_dir] = (mtime, wordlists)
+        return list(wordlists)
+
+    @classmethod
+    def _probe_wordlist(cls, entry, record):
+        """
+        Returns [mtime_ns, size, valid] for a DirEntry, reusing `record` if
+        the file is unchanged, or None for an empty file.
+        Called from worker threads, so it must not touch shared state.
+        """
+        st = entry.stat()
+        if st.st_size == 0:
+            return None
+        if record is not None and record[:2] == [st.st_mtime_ns, st.st_size]:
+            return record
+        return [st.st_mtime_ns, st.st_size, cls._looks_like_wordlist(entry.path)]
+
+    @classmethod
+    def _load_meta_cache(cls):
+        """
+        Returns the on-disk wordlist metadata cache, reading it once.
+        A missing or corrupt file just means every wordlist is re-sniffed.
+        """
+        if cls._meta_cache is None:
+            try:
+                with open(_META_CACHE_FILE, "r") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("not a dict")
+                cls._meta_cache = data
+            except (OSError, ValueError):
+                cls._meta_cache = {}
+        return cls._meta_cache
+
+    @classmethod
+    def _save_meta_cache(cls):
+        """
+        Writes the metadata cache atomically; failures are ignored.
+        Entries for deleted files are dropped and only the newest
+        _META_CACHE_MAX are kept, so the file can't grow without bound.
+        """
+        meta = cls._meta_cache
+        for path in [path for path in meta if not os.path.exists(path)]:
+            del meta[path]
+        for path in list(meta)[:-_META_CACHE_MAX]:
+            del meta[path]
+        tmp = _META_CACHE_FILE + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(_META_CACHE_FILE), exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump(cls._meta_cache, f)
+            os.replace(tmp, _META_CACHE_FILE)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    @staticmethod
+    def _looks_like_wordlist(path):
+        """
+        False for binary files (captures, archives hashcat can't read, ...).
+        Only the first 4 KiB are read, however large the file is; starting
+        Hashcat on a bogus wordlist costs far more than this check.
+        """
+        try:
+            with open(path, "rb") as f:
+                head = f.read(_WORDLIST_SNIFF_BYTES)
+        except OSError:
+            return True  # Can't tell; let Hashcat decide
+        if head.startswith(_GZIP_MAGIC):
+            return True  # Hashcat reads .gz wordlists natively
+        return b"\0" not in head
+
     def start_target_crack_session(
         self,
         target_bssid: str,
@@ -101,6 +272,7 @@ class RealtimeCrackManager:
         self.current_target_essid = essid  # Store ESSID for saving results
         self.current_hash_file_path = hash_file_path
         self.current_hash_type = hash_type
+        self._cached_status = None  # Belongs to the previous session
 
         self._load_wordlists()
         self.consecutive_hashcat_errors = 0
@@ -111,20 +283,6 @@ class RealtimeCrackManager:
             Color.pl(f"{{R}}Real-time: _try_next_wordlist called while a session is active. This is a bug.{{W}}")
             self.stop_current_crack_attempt(cleanup_hash_file=False) # Don't clean main hash, but stop session
 
-        if not self.wordlist_queue:
-            Color.pl(f"{{G}}Real-time: All wordlists exhausted for {{C}}{self.current_target_bssid}{{W}}")
-            self.stop_current_crack_attempt(cleanup_hash_file=True)
-            return
-
-        if self.consecutive_hashcat_errors >= self.max_hashcat_errors:
-            Color.pl(f"{{R}}Real-time: Exceeded max Hashcat start errors ({self.max_hashcat_errors}) for {{C}}{self.current_target_bssid}{{W}}. Aborting real-time crack for this target.{{W}}")
-            cleanup_main_hash = self.current_hash_file_path and self.current_hash_file_path.startswith(Configuration.temp())
-            self.stop_current_crack_attempt(cleanup_hash_file=cleanup_main_hash)
-            return
-
-        self.current_wordlist_path = self.wordlist_queue.pop(0)
-        Color.pl(f"{{G}}Real-time: Trying wordlist {{C}}{os.path.basename(self.current_wordlist_path)}{{W}} for {{C}}{self.current_target_bssid}{{W}} ({len(self.wordlist_queue)} remaining)")
-
         user_prefs = {}
         if Configuration.hashcat_realtime_force_cpu:
             user_prefs["force"] = True
@@ -139,48 +297,80 @@ class RealtimeCrackManager:
             else []
         )
 
-        self.active_session = Hashcat.start_realtime_crack(
-            self.current_target_bssid,
-            self.current_hash_file_path,
-            self.current_hash_type,
-            self.current_wordlist_path,
-            user_hashcat_options=custom_options,
-            user_preferences=user_prefs,
-        )
+        # Move on to the next wordlist until Hashcat starts (iteratively, so a
+        # long run of failures can't grow the stack)
+        while True:
+            if not self.wordlist_queue:
+                Color.pl(f"{{G}}Real-time: All wordlists exhausted for {{C}}{self.current_target_bssid}{{W}}")
+                self.stop_current_crack_attempt(cleanup_hash_file=True)
+                return
+
+            if self.consecutive_hashcat_errors >= self.max_hashcat_errors:
+                Color.pl(f"{{R}}Real-time: Exceeded max Hashcat start errors ({self.max_hashcat_errors}) for {{C}}{self.current_target_bssid}{{W}}. Aborting real-time crack for this target.{{W}}")
+                cleanup_main_hash = self.current_hash_file_path and self.current_hash_file_path.startswith(Configuration.temp())
+                self.stop_current_crack_attempt(cleanup_hash_file=cleanup_main_hash)
+                return
+
+            self.current_wordlist_path = self.wordlist_queue.popleft()
+            wl_name = os.path.basename(self.current_wordlist_path)
+            Color.pl(f"{{G}}Real-time: Trying wordlist {{C}}{wl_name}{{W}} for {{C}}{self.current_target_bssid}{{W}} ({len(self.wordlist_queue)} remaining)")
+
+            self.active_session = Hashcat.start_realtime_crack(
+                self.current_target_bssid,
+                self.current_hash_file_path,
+                self.current_hash_type,
+                self.current_wordlist_path,
+                user_hashcat_options=custom_options,
+                user_preferences=user_prefs,
+            )
+            if self.active_session is not None:
+                return
 
-        if self.active_session is None:
             self.consecutive_hashcat_errors += 1
-            Color.pl(f"{{R}}Real-time: Failed to start Hashcat with wordlist {{O}}{os.path.basename(self.current_wordlist_path)}{{R}} for {{C}}{self.current_target_bssid}{{W}}")
-            return
-
-
-    def update_status(self):
+            Color.pl(f"{{R}}Real-time: Failed to start Hashcat with wordlist {{O}}{wl_name}{{R}} for {{C}}{self.current_target_bssid}{{W}}")
+
+    def update_status(self, force=False):
+        """
+        Polls the active Hashcat session, at most once per
+        STATUS_POLL_INTERVAL unless force is set. AttackAll polls before
+        every target; skipped polls return what the last real poll did.
+        Callers that act on a crack right away should pass force=True.
+        """
         if not self.active_session or not Configuration.hashcat_realtime:
             return None
 
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_status_poll is not None
+            and now - self._last_status_poll < self.STATUS_POLL_INTERVAL
+        ):
+            return self._cached_status
+        self._last_status_poll = now
+        self._cached_status = self._poll_status()
+        return self._cached_status
+
+    def _poll_status(self):
+        """One real poll of the active session, see update_status()."""
         status_info = Hashcat.check_realtime_crack_status(self.active_session)
 
+        # Computed once per poll; also used by the "exhausted" message below
+        wl_name = os.path.basename(self.current_wordlist_path) if self.current_wordlist_path else "N/A"
+        # Hashcat emits several status lines per poll; print them in one write
+        output = []
+        show_all = Configuration.verbose > 2
         for line in status_info["status_lines"]:
             # Filter out common verbose lines unless very high verbosity is set
-            if (
-                "STATUS" in line.upper()
-                or "SPEED" in line.upper()
-                or "PROGRESS" in line.upper()
-                or "RECOVERED" in line.upper()
-                or "REJECTED" in line.upper()
-                or "EXHAUSTED" in line.upper()
-                or Configuration.verbose > 2
-            ):
-                wl_name = os.path.basename(self.current_wordlist_path) if self.current_wordlist_path else "N/A"
-                Color.pl(
+            if show_all or _STATUS_LINE_RE.search(line):
+                output.append(
                     f"{{G}}Real-time Hashcat ({wl_name}): {{W}}{line.strip()}{{W}}"
                 )
 
         for line in status_info["error_lines"]:
-            wl_name = os.path.basename(self.current_wordlist_path) if self.current_wordlist_path else "N/A"
-            Color.pl(
+            output.append(
                 f"{{R}}Real-time Hashcat ERROR ({wl_name}): {{O}}{line.strip()}{{W}}"
             )
+        Color.pl_many(output)
 
         if status_info["cracked_password"]:
             password = status_info["cracked_password"]
@@ -207,7 +397,6 @@ class RealtimeCrackManager:
             return self.current_target_bssid, password  # Signal success
 
         elif status_info["is_process_complete"]:
-            wl_name = os.path.basename(self.current_wordlist_path) if self.current_wordlist_path else "N/A"
             Color.pl(
                 f"{{G}}Real-time: Wordlist {{C}}{wl_name}{{W}} exhausted for {{C}}{self.current_target_bssid}{{W}}."
             )
@@ -254,6 +443,10 @@ class RealtimeCrackManager:
     def get_cracked_password(self, bssid: str):
         return self.realtime_cracked_passwords.get(bssid)
 
+    def cracked_bssids(self, bssids):
+        """Returns the set of `bssids` already cracked in this session."""
+        return self.realtime_cracked_passwords.keys() & bssids
+
     def is_actively_cracking(self, bssid: str = None):
         if bssid is None:
             return self.active_session is not None
@@ -3,7 +3,6 @@
 
 from .dependency import Dependency
 from ..util.process import Process
-from ..util.input import xrange
 from ..config import Configuration
 
 import os
@@ -63,7 +62,7 @@ class Aircrack(Dependency):
     def _hex_and_ascii_key(hex_raw):
         hex_chars = []
         ascii_key = ""
-        for index in xrange(0, len(hex_raw), 2):
+        for index in range(0, len(hex_raw), 2):
             byt = hex_raw[index : index + 2]
             hex_chars.append(byt)
             byt_int = int(byt, 16)
@@ -6,7 +6,6 @@ from .ifconfig import Ifconfig
 from .iwconfig import Iwconfig
 from ..util.process import Process
 from ..util.color import Color
-from ..util.input import raw_input
 from ..config import Configuration
 
 import re
@@ -318,7 +317,7 @@ class Airmon(Dependency):
         else:
             # Multiple interfaces found
             question = Color.s("{+} select interface ({G}1-%d{W}): " % (count))
-            choice = raw_input(question)
+            choice = input(question)
 
         iface = a.get(choice)
 
@@ -11,6 +11,53 @@ from ..model.client import Client
 
 import os
 import time
+from functools import lru_cache
+from operator import attrgetter
+
+
+@lru_cache(maxsize=16)
+def _read_csv_rows(csv_filename, mtime_ns, size):
+    """
+    Splits an airodump CSV into (target rows, client rows), as tuples of tuples.
+    Keyed on mtime and size so a rewritten file is re-read, even within one
+    tick of a coarse filesystem clock.
+    """
+    import csv
+
+    target_rows = []
+    client_rows = []
+    with open(csv_filename, "r") as csvopen:
+        # Strip NULs lazily instead of buffering the whole file
+        lines = (line.replace("\0", "") for line in csvopen)
+        csv_reader = csv.reader(
+            lines,
+            delimiter=",",
+            quoting=csv.QUOTE_ALL,
+            skipinitialspace=True,
+            escapechar="\\",
+        )
+
+        rows = target_rows
+        for row in csv_reader:
+            # Each 'row' is a list of fields for a target/client
+
+            if len(row) == 0:
+                continue
+
+            first = row[0].strip()
+            if first == "BSSID":
+                # This is the 'header' for the list of Targets
+                rows = target_rows
+                continue
+
+            elif first == "Station MAC":
+                # This is the 'header' for the list of Clients
+                rows = client_rows
+                continue
+
+            rows.append(tuple(row))
+
+    return tuple(target_rows), tuple(client_rows)
 
 
 class Airodump(Dependency):
@@ -128,13 +175,16 @@ class Airodump(Dependency):
     def find_files_by_output_prefix(cls, output_file_prefix, endswith=None):
         """Finds all files in the temp directory that start with the output_file_prefix"""
         result = []
-        temp = Configuration.temp()
-        for fil in os.listdir(temp):
-            if not fil.startswith(output_file_prefix):
-                continue
+        # Polled every second while scanning; DirEntry.path is prebuilt by
+        # scandir, so no per-file os.path.join
+        with os.scandir(Configuration.temp()) as entries:
+            for entry in entries:
+                fil = entry.name
+                if not fil.startswith(output_file_prefix):
+                    continue
 
-            if endswith is None or fil.endswith(endswith):
-                result.append(os.path.join(temp, fil))
+                if endswith is None or fil.endswith(endswith):
+                    result.append(entry.path)
 
         return result
 
@@ -180,10 +230,11 @@ class Airodump(Dependency):
             return self.targets  # No file found
 
         targets = Airodump.get_targets_from_csv(csv_filename)
-        for old_target in old_targets:
-            for target in targets:
-                if old_target.bssid == target.bssid:
-                    target.wps = old_target.wps
+        # Carry WPS state over by BSSID (last old entry wins, as before)
+        old_wps = {t.bssid: t.wps for t in old_targets}
+        for target in targets:
+            if target.bssid in old_wps:
+                target.wps = old_wps[target.bssid]
 
         # Check targets for WPS
         if not self.skip_wps:
@@ -201,15 +252,13 @@ class Airodump(Dependency):
             )
 
         # Sort by power
-        targets.sort(key=lambda x: x.power, reverse=True)
+        targets.sort(key=attrgetter("power"), reverse=True)
 
         # Identify decloaked targets
-        for old_target in self.targets:
+        hidden_bssids = {t.bssid for t in self.targets if not t.essid_known}
+        if hidden_bssids:
             for new_target in targets:
-                if old_target.bssid != new_target.bssid:
-                    continue
-
-                if new_target.essid_known and not old_target.essid_known:
+                if new_target.essid_known and new_target.bssid in hidden_bssids:
                     # We decloaked a target!
                     new_target.decloaked = True
                     self.decloaked_bssids.add(new_target.bssid)
@@ -223,63 +272,42 @@ class Airodump(Dependency):
     def get_targets_from_csv(csv_filename):
         """Returns list of Target objects parsed from CSV file."""
         targets = []
-        import csv
-
-        with open(csv_filename, "r") as csvopen:
-            lines = []
-            for line in csvopen:
-                line = line.replace("\0", "")
-                lines.append(line)
-            csv_reader = csv.reader(
-                lines,
-                delimiter=",",
-                quoting=csv.QUOTE_ALL,
-                skipinitialspace=True,
-                escapechar="\\",
-            )
-
-            hit_clients = False
-            for row in csv_reader:
-                # Each 'row' is a list of fields for a target/client
+        # BSSID -> Target, so clients are attached without rescanning targets
+        targets_by_bssid = {}
+
+        # Targets are mutable (wps, clients, ...), so only the parsed rows are
+        # cached; fresh objects are built on every call.
+        st = os.stat(csv_filename)
+        target_rows, client_rows = _read_csv_rows(
+            csv_filename, st.st_mtime_ns, st.st_size
+        )
 
-                if len(row) == 0:
-                    continue
+        for row in target_rows:
+            # The current row corresponds to a 'Target' (router)
+            try:
+                target = Target(row)
+                targets.append(target)
+                # First occurrence wins, as with the linear scan
+                targets_by_bssid.setdefault(target.bssid, target)
+            except Exception:
+                continue
 
-                if row[0].strip() == "BSSID":
-                    # This is the 'header' for the list of Targets
-                    hit_clients = False
-                    continue
+        for row in client_rows:
+            # The current row corresponds to a 'Client' (computer)
+            try:
+                client = Client(row)
+            except (IndexError, ValueError):
+                # Skip if we can't parse the client row
+                continue
 
-                elif row[0].strip() == "Station MAC":
-                    # This is the 'header' for the list of Clients
-                    hit_clients = True
-                    continue
+            if "not associated" in client.bssid:
+                # Ignore unassociated clients
+                continue
 
-                if hit_clients:
-                    # The current row corresponds to a 'Client' (computer)
-                    try:
-                        client = Client(row)
-                    except (IndexError, ValueError):
-                        # Skip if we can't parse the client row
-                        continue
-
-                    if "not associated" in client.bssid:
-                        # Ignore unassociated clients
-                        continue
-
-                    # Add this client to the appropriate Target
-                    for t in targets:
-                        if t.bssid == client.bssid:
-                            t.clients.append(client)
-                            break
-
-                else:
-                    # The current row corresponds to a 'Target' (router)
-                    try:
-                        target = Target(row)
-                        targets.append(target)
-                    except Exception:
-                        continue
+            # Add this client to the appropriate Target
+            t = targets_by_bssid.get(client.bssid)
+            if t is not None:
+                t.clients.append(client)
 
         return targets
 
@@ -310,28 +338,25 @@ class Airodump(Dependency):
                 result.append(target)
 
         # Filter based on BSSID/ESSID
+        # (one pass; lowercase the configured values once, not per target)
         bssid = Configuration.target_bssid
         essid = Configuration.target_essid
-        i = 0
-        while i < len(result):
-            if (
-                result[i].essid is not None
-                and Configuration.ignore_essid is not None
-                and Configuration.ignore_essid.lower()
-                in result[i].essid.lower()
-            ):
-                result.pop(i)
-            elif bssid and result[i].bssid.lower() != bssid.lower():
-                result.pop(i)
-            elif (
-                essid
-                and result[i].essid
-                and result[i].essid.lower() != essid.lower()
-            ):
-                result.pop(i)
-            else:
-                i += 1
-        return result
+        bssid = bssid.lower() if bssid else None
+        essid = essid.lower() if essid else None
+        ignore_essid = Configuration.ignore_essid
+        if ignore_essid is not None:
+            ignore_essid = ignore_essid.lower()
+        return [
+            t
+            for t in result
+            if not (
+                t.essid is not None
+                and ignore_essid is not None
+                and ignore_essid in t.essid.lower()
+            )
+            and not (bssid and t.bssid.lower() != bssid)
+            and not (essid and t.essid and t.essid.lower() != essid)
+        ]
 
     def deauth_hidden_targets(self):
         """
@@ -1,34 +1,92 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+# Color is a leaf module; Process stays a lazy import below, since it
+# imports config, which imports tools that import this module
+from ..util.color import Color
+
+# Keeps apt/dpkg/debconf from prompting or paging during auto-install
+_APT_ENV = [
+    "DEBIAN_FRONTEND=noninteractive",
+    "DEBCONF_NONINTERACTIVE_SEEN=true",
+    "APT_LISTCHANGES_FRONTEND=none",
+    "LC_ALL=C",
+]
+
+_APT_LISTS_DIR = "/var/lib/apt/lists"
+# Touched by `apt-get update`: the periodic stamp exists only with the
+# APT::Periodic hooks installed; the lists directory changes whenever an
+# update fetches a new index
+_APT_UPDATE_STAMPS = (
+    "/var/lib/apt/periodic/update-success-stamp",
+    _APT_LISTS_DIR,
+)
+
+# Dependency name -> apt package, for auto-installation (apps not listed
+# are installed by their own name)
+_APT_PACKAGES = {
+    "aircrack-ng": "aircrack-ng",
+    "airodump-ng": "aircrack-ng",
+    "airmon-ng": "aircrack-ng",
+    "aireplay-ng": "aircrack-ng",
+    "iwconfig": "wireless-tools",
+    "ifconfig": "net-tools",
+    "reaver": "reaver",
+    "bully": "bully",
+    "tshark": "wireshark-cli",
+    "macchanger": "macchanger",
+    "hashcat": "hashcat",
+    "hcxdumptool": "hcxtools",
+    "hcxpcaptool": "hcxtools",
+    "mpirun": "openmpi-bin",
+}
+
+# Dependency name -> Dependency installer method, for apps that need custom
+# handling instead of apt
+_SPECIAL_INSTALLS = {
+    "pyrit": "_install_pyrit",
+    "hcxpcaptool": "_install_hcxtools_compat",
+    "git-credential-manager": "_install_git_credential_manager",
+}
+
 
 class Dependency(object):
-    required_attr_names = [
-        "dependency_name",
-        "dependency_url",
-        "dependency_required",
-    ]
+    required_attr_names = frozenset(
+        {
+            "dependency_name",
+            "dependency_url",
+            "dependency_required",
+        }
+    )
 
     # https://stackoverflow.com/a/49024227
     def __init_subclass__(cls):
-        for attr_name in cls.required_attr_names:
-            if attr_name not in cls.__dict__:
-                raise NotImplementedError(
-                    'Attribute "{}" has not been overridden in class "{}"'.format(
-                        attr_name, cls.__name__
-                    )
+        missing = cls.required_attr_names - vars(cls).keys()
+        if missing:
+            raise NotImplementedError(
+                'Attribute "{}" has not been overridden in class "{}"'.format(
+                    '", "'.join(sorted(missing)), cls.__name__
                 )
+            )
+
+    # dependency_name -> installed?, shared by every subclass. Some tools are
+    # checked on every scan refresh; each check walks PATH.
+    _exists_cache = {}
+    # Result of _is_git_credential_manager_configured(), once known
+    _gcm_configured = None
 
     @classmethod
     def exists(cls):
-        from ..util.process import Process
+        cache = Dependency._exists_cache
+        name = cls.dependency_name
+        if name not in cache:
+            from ..util.process import Process
 
-        return Process.exists(cls.dependency_name)
+            cache[name] = Process.exists(name)
+        return cache[name]
 
     @classmethod
     def run_dependency_check(cls):
-        from ..util.color import Color
-
         from .aircrack import Aircrack
         from .ifconfig import Ifconfig
         from .iwconfig import Iwconfig
@@ -74,10 +132,12 @@ class Dependency(object):
                 "{!} {O}Continuing with manual dependency checking...{W}"
             )
 
-        # Re-check dependencies after auto-install
-        missing_required = any(
-            [app.fails_dependency_check() for app in apps]
-        )
+        # Re-check dependencies after auto-install (only the apps it tried
+        # to install are probed again)
+        missing = [app for app in apps if not app.exists()]
+        for app in missing:
+            app.fails_dependency_check()  # Reports every missing app
+        missing_required = any(app.dependency_required for app in missing)
 
         if missing_required:
             Color.pl(
@@ -89,10 +149,7 @@ class Dependency(object):
 
     @classmethod
     def fails_dependency_check(cls):
-        from ..util.color import Color
-        from ..util.process import Process
-
-        if Process.exists(cls.dependency_name):
+        if cls.exists():
             return False
 
         if cls.dependency_required:
@@ -114,43 +171,17 @@ class Dependency(object):
     @classmethod
     def auto_install_dependencies(cls, apps):
         """Automatically installs missing dependencies"""
-        from ..util.color import Color
-        from ..util.process import Process
-        import subprocess
-        import time
-
-        # Define package mappings for auto-installation
-        package_map = {
-            "aircrack-ng": "aircrack-ng",
-            "airodump-ng": "aircrack-ng",
-            "airmon-ng": "aircrack-ng",
-            "aireplay-ng": "aircrack-ng",
-            "iwconfig": "wireless-tools",
-            "ifconfig": "net-tools",
-            "reaver": "reaver",
-            "bully": "bully",
-            "tshark": "wireshark-cli",
-            "macchanger": "macchanger",
-            "hashcat": "hashcat",
-            "hcxdumptool": "hcxtools",
-            "hcxpcaptool": "hcxtools",
-            "mpirun": "openmpi-bin",
-        }
-
-        # Special installations that need custom handling
-        special_installs = {
-            "pyrit": cls._install_pyrit,
-            "hcxpcaptool": cls._install_hcxtools_compat,
-            "git-credential-manager": cls._install_git_credential_manager,
-        }
-
         # Always check and install Git Credential Manager first
         cls._ensure_git_credential_manager()
 
-        missing_apps = []
-        for app in apps:
-            if not Process.exists(app.dependency_name):
-                missing_apps.append(app)
+        missing_apps = [app for app in apps if not app.exists()]
+
+        cls._install_missing(missing_apps)
+
+    @classmethod
+    def _install_missing(cls, missing_apps):
+        """Installs the given (missing) apps via apt and special installers"""
+        import subprocess
 
         if not missing_apps:
             Color.pl("{+} {G}All dependencies are already installed!{W}")
@@ -161,60 +192,45 @@ class Dependency(object):
             % len(missing_apps)
         )
 
-        # Update package lists
-        Color.pl("{+} {G}Updating package lists...{W}")
-        try:
-            subprocess.run(
-                ["sudo", "apt", "update", "-qq"],
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        except subprocess.CalledProcessError:
-            Color.pl("{!} {R}Failed to update package lists{W}")
-
-        # Install standard packages
-        packages_to_install = set()
+        # Handle special installations
         for app in missing_apps:
             app_name = app.dependency_name
-
-            if app_name in special_installs:
-                # Handle special installations
+            if app_name not in _SPECIAL_INSTALLS:
+                continue
+            Color.pl("{+} {C}Installing {G}%s{C} (special)...{W}" % app_name)
+            try:
+                getattr(cls, _SPECIAL_INSTALLS[app_name])()
+                Color.pl("{+} {G}Successfully installed %s{W}" % app_name)
+            except Exception as e:
                 Color.pl(
-                    "{+} {C}Installing {G}%s{C} (special)...{W}" % app_name
+                    "{!} {R}Failed to install %s: %s{W}" % (app_name, str(e))
                 )
-                try:
-                    special_installs[app_name]()
-                    Color.pl(
-                        "{+} {G}Successfully installed %s{W}" % app_name
-                    )
-                except Exception as e:
-                    Color.pl(
-                        "{!} {R}Failed to install %s: %s{W}"
-                        % (app_name, str(e))
-                    )
-
-            elif app_name in package_map:
-                packages_to_install.add(package_map[app_name])
-            else:
-                # Try to install using the same name
-                packages_to_install.add(app_name)
+
+        # Install standard packages (several apps can share a package)
+        packages_to_install = {
+            _APT_PACKAGES.get(app.dependency_name, app.dependency_name)
+            for app in missing_apps
+            if app.dependency_name not in _SPECIAL_INSTALLS
+        }
+        # A binary can be missing from PATH while its package is installed;
+        # apt can't fix that, so don't pay for an apt run
+        installed = cls._installed_packages(packages_to_install)
+        if installed:
+            Color.pl(
+                "{!} {O}Already installed, but not found on PATH: {R}%s{W}"
+                % ", ".join(sorted(installed))
+            )
+            packages_to_install -= installed
 
         # Install regular packages in batch
         if packages_to_install:
-            package_list = list(packages_to_install)
+            package_list = sorted(packages_to_install)
             Color.pl(
-                "{+} {C}Installing packages: {G}%s{W}"
+                "{+} {C}Updating package lists and installing packages: {G}%s{W}"
                 % ", ".join(package_list)
             )
             try:
-                cmd = ["sudo", "apt", "install", "-y"] + package_list
-                subprocess.run(
-                    cmd,
-                    check=True,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE,
-                )
+                cls._apt_install(package_list)
                 Color.pl(
                     "{+} {G}Successfully installed standard packages{W}"
                 )
@@ -224,8 +240,99 @@ class Dependency(object):
                     % e.stderr.decode().strip()
                 )
 
+        # Re-check what was just installed on the next exists()
+        for app in missing_apps:
+            Dependency._exists_cache.pop(app.dependency_name, None)
+
         Color.pl("{+} {G}🥷 NINJA AUTO-INSTALL: Complete!{W}")
-        time.sleep(1)  # Give time for installations to settle
+
+    @staticmethod
+    def _installed_packages(packages):
+        """Returns the subset of `packages` dpkg reports as installed."""
+        import subprocess
+
+        if not packages:
+            return set()
+        try:
+            result = subprocess.run(
+                ["dpkg-query", "-W", "-f=${Package} ${db:Status-Abbrev}\n"]
+                + sorted(packages),
+                capture_output=True,
+                text=True,
+            )
+        except OSError:
+            return set()  # No dpkg; let apt (or its absence) decide
+        installed = set()
+        for line in result.stdout.splitlines():
+            name, _, status = line.partition(" ")
+            if status.startswith("ii"):
+                installed.add(name)
+        return installed & packages
+
+    @staticmethod
+    def _apt_install(packages):
+        """
+        Refreshes the package lists (unless updated within the last hour)
+        and installs `packages` with a single sudo/apt invocation. A failed
+        update does not stop the install (it may still succeed from the
+        existing lists).
+        Runs noninteractively and quietly; dpkg skips its per-file fsync()s,
+        which dominate install time on SD cards and VMs, and eatmydata (if
+        installed) drops the remaining ones.
+        Raises subprocess.CalledProcessError if the install fails.
+        """
+        import shlex
+        import subprocess
+        from ..util.process import Process
+
+        install = ["eatmydata"] if Process.exists("eatmydata") else []
+        install += [
+            "apt-get",
+            "-q=2",
+            "-o",
+            "Dpkg::Options::=--force-unsafe-io",
+            # No pty: dpkg would otherwise draw progress on the terminal
+            "-o",
+            "Dpkg::Use-Pty=0",
+            "install",
+            "-y",
+        ]
+        script = shlex.join(install + packages)
+        if Dependency._apt_lists_stale():
+            script = "apt-get update -qq; " + script
+        # Passed through env(1), since sudo resets the caller's environment
+        subprocess.run(
+            ["sudo", "env"] + _APT_ENV + ["sh", "-c", script],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+    @staticmethod
+    def _apt_lists_stale(max_age=3600):
+        """
+        True unless `apt-get update` succeeded within `max_age` seconds.
+        Also True when no package index is present: `rm -rf
+        /var/lib/apt/lists/*` (common in Docker images) leaves a fresh
+        directory mtime behind.
+        """
+        import os
+        import time
+
+        try:
+            with os.scandir(_APT_LISTS_DIR) as entries:
+                if not any("_Packages" in entry.name for entry in entries):
+                    return True
+        except OSError:
+            return True
+
+        newest = 0
+        for stamp in _APT_UPDATE_STAMPS:
+            try:
+                newest = max(newest, os.stat(stamp).st_mtime)
+            except OSError:
+                pass
+        return time.time() - newest > max_age
 
     @classmethod
     def _install_pyrit(cls):
@@ -233,22 +340,24 @@ class Dependency(object):
         import subprocess
 
         # Create dummy pyrit if real installation fails
-        pyrit_script = """
-#!/bin/bash
+        pyrit_script = """#!/bin/bash
 echo "Pyrit v0.5.0 (ninja-compatibility)"
 echo "This is a compatibility pyrit for wifite ninja mode"
 """
 
         try:
-            with open("/tmp/pyrit_dummy", "w") as f:
-                f.write(pyrit_script)
+            # Write and mark executable in one privileged call, fed on stdin
+            # (no temp file left behind if this fails)
             subprocess.run(
-                ["sudo", "mv", "/tmp/pyrit_dummy", "/usr/local/bin/pyrit"],
+                [
+                    "sudo",
+                    "sh",
+                    "-c",
+                    "cat > /usr/local/bin/pyrit && chmod +x /usr/local/bin/pyrit",
+                ],
+                input=pyrit_script.encode(),
                 check=True,
             )
-            subprocess.run(
-                ["sudo", "chmod", "+x", "/usr/local/bin/pyrit"], check=True
-            )
         except Exception as e:
             raise Exception(f"Failed to create pyrit compatibility: {e}")
 
@@ -280,7 +389,6 @@ echo "This is a compatibility pyrit for wifite ninja mode"
     @classmethod
     def _ensure_git_credential_manager(cls):
         """Ensure Git Credential Manager is installed and configured"""
-        from ..util.color import Color
         from ..util.process import Process
 
         # Check if git-credential-manager is already installed
@@ -322,22 +430,17 @@ echo "This is a compatibility pyrit for wifite ninja mode"
         """Download and install Git Credential Manager"""
         import subprocess
         import json
-        import os
+        import tarfile
         import tempfile
+        import urllib.request
 
         try:
-            # Get latest release info using curl
-            result = subprocess.run(
-                [
-                    "curl",
-                    "-s",
-                    "https://api.github.com/repos/git-ecosystem/git-credential-manager/releases/latest",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            release_data = json.loads(result.stdout)
+            # Get latest release info
+            with urllib.request.urlopen(
+                "https://api.github.com/repos/git-ecosystem/git-credential-manager/releases/latest",
+                timeout=15,
+            ) as resp:
+                release_data = json.load(resp)
 
             # Find the Linux amd64 asset
             download_url = None
@@ -355,37 +458,28 @@ echo "This is a compatibility pyrit for wifite ninja mode"
                     "Could not find suitable Git Credential Manager release"
                 )
 
-            # Download and install
-            with tempfile.NamedTemporaryFile(
-                suffix=".tar.gz", delete=False
-            ) as tmp_file:
+            # Download and unpack in one stream (no temp tarball), then copy
+            # into place with a single privileged command
+            extract_args = {}
+            if hasattr(tarfile, "data_filter"):
+                extract_args["filter"] = "data"
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                with urllib.request.urlopen(download_url, timeout=60) as resp:
+                    with tarfile.open(fileobj=resp, mode="r|gz") as tar:
+                        tar.extractall(tmp_dir, **extract_args)
                 subprocess.run(
-                    ["curl", "-L", download_url, "-o", tmp_file.name],
+                    ["sudo", "cp", "-R", tmp_dir + "/.", "/usr/local/bin/"],
                     check=True,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
                 )
-                subprocess.run(
-                    [
-                        "sudo",
-                        "tar",
-                        "-xzf",
-                        tmp_file.name,
-                        "-C",
-                        "/usr/local/bin/",
-                    ],
-                    check=True,
-                )
-                subprocess.run(
-                    [
-                        "sudo",
-                        "chmod",
-                        "+x",
-                        "/usr/local/bin/git-credential-manager",
-                    ],
-                    check=True,
-                )
-                os.unlink(tmp_file.name)
+            subprocess.run(
+                [
+                    "sudo",
+                    "chmod",
+                    "+x",
+                    "/usr/local/bin/git-credential-manager",
+                ],
+                check=True,
+            )
 
         except Exception as e:
             raise Exception(f"Failed to install Git Credential Manager: {e}")
@@ -393,21 +487,10 @@ echo "This is a compatibility pyrit for wifite ninja mode"
     @classmethod
     def _configure_git_credential_manager(cls):
         """Configure Git Credential Manager for browser authentication and permanent storage"""
+        import shlex
         import subprocess
 
         try:
-            # Clear existing credential helpers
-            subprocess.run(
-                [
-                    "git",
-                    "config",
-                    "--global",
-                    "--unset-all",
-                    "credential.helper",
-                ],
-                check=False,
-            )
-
             # Configure Git Credential Manager
             configs = [
                 ("credential.helper", "manager"),
@@ -418,10 +501,18 @@ echo "This is a compatibility pyrit for wifite ninja mode"
                 ("credential.https://github.com.provider", "github"),
             ]
 
-            for key, value in configs:
-                subprocess.run(
-                    ["git", "config", "--global", key, value], check=True
-                )
+            # One shell for all the git calls. Clearing existing credential
+            # helpers may fail (none set); every setting after it must not.
+            script = [
+                "git config --global --unset-all credential.helper",
+                "set -e",
+            ]
+            script += [
+                shlex.join(["git", "config", "--global", key, value])
+                for key, value in configs
+            ]
+            subprocess.run(["sh", "-c", "\n".join(script)], check=True)
+            Dependency._gcm_configured = True
 
         except Exception as e:
             raise Exception(
@@ -430,30 +521,35 @@ echo "This is a compatibility pyrit for wifite ninja mode"
 
     @classmethod
     def _is_git_credential_manager_configured(cls):
-        """Check if Git Credential Manager is properly configured"""
+        """
+        Check if Git Credential Manager is properly configured.
+        The answer is kept for the rest of the run.
+        """
         import subprocess
 
+        if Dependency._gcm_configured is not None:
+            return Dependency._gcm_configured
+
         try:
-            # Check if credential helper is set to manager
+            # Read every credential.* setting with one git call; the last
+            # value of a key wins, as with `git config <key>`
             result = subprocess.run(
-                ["git", "config", "--global", "credential.helper"],
+                ["git", "config", "--global", "--get-regexp", r"^credential\."],
                 capture_output=True,
                 text=True,
                 check=False,
             )
-            if "manager" not in result.stdout:
-                return False
-
-            # Check if GitHub auth modes is set to browser
-            result = subprocess.run(
-                ["git", "config", "--global", "credential.gitHubAuthModes"],
-                capture_output=True,
-                text=True,
-                check=False,
+            settings = {}
+            for line in result.stdout.splitlines():
+                key, _, value = line.partition(" ")
+                settings[key.lower()] = value
+
+            Dependency._gcm_configured = (
+                # Credential helper is set to manager
+                "manager" in settings.get("credential.helper", "")
+                # GitHub auth modes is set to browser
+                and "browser" in settings.get("credential.githubauthmodes", "")
             )
-            if "browser" not in result.stdout:
-                return False
-
-            return True
+            return Dependency._gcm_configured
         except Exception:
             return False
@@ -8,14 +8,94 @@ from ..util.color import Color
 
 import os
 import subprocess
-import select
+import queue
 import signal
-import time  # For sleep in stop_realtime_crack
+import threading
+from collections import namedtuple
+from itertools import count
+
+# One line of hcxpcaptool -z output: hash*bssid*station*essid
+PMKIDRecord = namedtuple("PMKIDRecord", "line pmkid bssid station essid")
+
+
+def _drain_pipe(pipe, lines):
+    """
+    Reader thread body: moves each line of `pipe` into queue `lines` as soon
+    as hashcat writes it, so a full pipe never stalls hashcat between polls.
+    """
+    try:
+        for line in iter(pipe.readline, b""):
+            lines.put(line)
+    except (OSError, ValueError):
+        pass  # Pipe closed by stop_realtime_crack()
+
+
+def _start_pipe_reader(pipe):
+    """Starts a daemon _drain_pipe() thread for `pipe`; returns its queue."""
+    lines = queue.SimpleQueue()
+    threading.Thread(target=_drain_pipe, args=(pipe, lines), daemon=True).start()
+    return lines
+
+
+def _queued_lines(lines):
+    """Returns (without blocking) the lines queued since the last call, decoded."""
+    result = []
+    while True:
+        try:
+            result.append(lines.get_nowait().decode("utf-8", "replace").strip())
+        except queue.Empty:
+            return result
+
+
+def _prefetch_file(path):
+    """
+    Asks the kernel to start reading `path` into the page cache, so hashcat
+    finds its wordlist/hash file warm. Best effort; no-op where unsupported.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# Fixed part of every real-time hashcat command line
+_REALTIME_HASHCAT_ARGS = (
+    "--status",
+    "--status-timer",
+    "5",  # Update status every 5 seconds
+)
+# Sequence numbers for real-time session names
+_session_ids = count(1)
+# stop_realtime_crack(): signals to send, and seconds to wait after each
+_STOP_SIGNALS = ((signal.SIGTERM, 1.0), (signal.SIGKILL, 1.0))
 
 
 class RealtimeHashcatSession:
     """Holds information about an active real-time Hashcat cracking session."""
 
+    __slots__ = (
+        "popen_object",
+        "target_bssid",
+        "hash_type",
+        "hash_file_path",
+        "wordlist_path",
+        "outfile_path",
+        "potfile_path",
+        "user_hashcat_options",
+        "stdout_lines",
+        "stderr_lines",
+        "outfile_pos",
+        "outfile_mtime_ns",
+    )
+
     def __init__(
         self,
         popen_object,
@@ -35,6 +115,12 @@ class RealtimeHashcatSession:
         self.outfile_path = outfile_path
         self.potfile_path = potfile_path
         self.user_hashcat_options = user_hashcat_options if user_hashcat_options else []
+        # Queues fed by the pipe reader threads (see start_realtime_crack)
+        self.stdout_lines = None
+        self.stderr_lines = None
+        # Bytes of the outfile already parsed, and its mtime at that point
+        self.outfile_pos = 0
+        self.outfile_mtime_ns = 0
 
 
 class Hashcat(Dependency):
@@ -42,11 +128,17 @@ class Hashcat(Dependency):
     dependency_name = "hashcat"
     dependency_url = "https://hashcat.net/hashcat/"
 
-    @staticmethod
-    def should_use_force():
-        command = ["hashcat", "-I"]
-        stderr = Process(command).stderr()
-        return "No devices found/left" in stderr
+    # Cached result of should_use_force(); `hashcat -I` enumerates the
+    # OpenCL devices, which can take seconds, and was run per wordlist
+    _use_force = None
+
+    @classmethod
+    def should_use_force(cls):
+        if cls._use_force is None:
+            command = ["hashcat", "-I"]
+            stderr = Process(command).stderr()
+            cls._use_force = "No devices found/left" in stderr
+        return cls._use_force
 
     @staticmethod
     def crack_handshake(handshake, show_command=False):
@@ -56,8 +148,11 @@ class Hashcat(Dependency):
         )
 
         key = None
-        # Crack hccapx
-        for additional_arg in ([], ["--show"]):
+        # Crack hccapx. Check the pot file with --show first: it doesn't
+        # initialize the OpenCL devices, so a handshake that was already
+        # cracked costs no full hashcat run. If --show finds nothing, the
+        # real run's output is final and no second --show is needed.
+        for additional_arg in (["--show"], []):
             command = [
                 "hashcat",
                 "--quiet",
@@ -79,9 +174,9 @@ class Hashcat(Dependency):
                 key = stdout.split(":", 5)[-1].strip()
                 break
 
-        if os.path.exists(hccapx_file):
-            os.remove(hccapx_file)
-
+        # generated.hccapx is left in the temp dir (removed on exit): a
+        # real-time session may be reading the same conversion, and
+        # generate_hccapx_file() reuses it while the capture is unchanged
         return key
 
     # Placeholder realtime helpers for testing; real implementations reside in
@@ -116,9 +211,10 @@ class Hashcat(Dependency):
             Key (str) if found; `None` if not found.
         """
 
-        # Run hashcat once normally, then with --show if it failed
-        # To catch cases where the password is already in the pot file.
-        for additional_arg in ([], ["--show"]):
+        # Run hashcat with --show first, to catch cases where the password is
+        # already in the pot file without a full (device-initializing) run.
+        # Then run it once normally if that found nothing.
+        for additional_arg in (["--show"], []):
             command = [
                 "hashcat",
                 "--quiet",  # Only output the password if found.
@@ -197,9 +293,32 @@ class HcxPcapTool(Dependency):
         self.bssid = self.target.bssid.lower().replace(":", "")
         self.pmkid_file = Configuration.temp("pmkid-%s.16800" % self.bssid)
 
+    # (capfile, size, mtime) of the capture last converted to .hccapx
+    _hccapx_source = None
+
+    @staticmethod
+    def _capfile_signature(capfile):
+        try:
+            st = os.stat(capfile)
+        except OSError:
+            return None
+        return (capfile, st.st_size, st.st_mtime_ns)
+
     @staticmethod
     def generate_hccapx_file(handshake, show_command=False):
         hccapx_file = Configuration.temp("generated.hccapx")
+
+        # The real-time cracker and the regular crack step convert the same
+        # capture; reuse the existing conversion if the capture is unchanged.
+        source = HcxPcapTool._capfile_signature(handshake.capfile)
+        if (
+            source is not None
+            and source == HcxPcapTool._hccapx_source
+            and os.path.exists(hccapx_file)
+        ):
+            return hccapx_file
+
+        HcxPcapTool._hccapx_source = None
         if os.path.exists(hccapx_file):
             os.remove(hccapx_file)
 
@@ -215,6 +334,7 @@ class HcxPcapTool(Dependency):
                 "Failed to generate .hccapx file, output: \n%s\n%s" % (stdout, stderr)
             )
 
+        HcxPcapTool._hccapx_source = source
         return hccapx_file
 
     @staticmethod
@@ -237,7 +357,8 @@ class HcxPcapTool(Dependency):
 
         return john_file
 
-    def get_pmkid_hash(self, pcapng_file):
+    def _extract_pmkids(self, pcapng_file):
+        """Runs hcxpcaptool on pcapng_file, returns its raw -z output (bytes) or None"""
         if os.path.exists(self.pmkid_file):
             os.remove(self.pmkid_file)
 
@@ -248,23 +369,61 @@ class HcxPcapTool(Dependency):
         if not os.path.exists(self.pmkid_file):
             return None
 
-        with open(self.pmkid_file, "r") as f:
+        with open(self.pmkid_file, "rb") as f:
             output = f.read()
-            # Each line looks like:
-            # hash*bssid*station*essid
+        os.remove(self.pmkid_file)
+        return output
+
+    @staticmethod
+    def _iter_pmkid_lines(output):
+        """Yields (line, fields) for each line of -z output with at least hash*bssid*station"""
+        for line in output.split(b"\n"):
+            fields = line.split(b"*", 3)
+            if len(fields) >= 3:
+                yield line, fields
+
+    def get_all_pmkid_hashes(self, pcapng_file):
+        """Returns every PMKID found in pcapng_file as a list of PMKIDRecord"""
+        output = self._extract_pmkids(pcapng_file)
+        if output is None:
+            return []
+
+        records = []
+        for line, fields in self._iter_pmkid_lines(output):
+            if len(fields) < 4:
+                fields.append(b"")
+            records.append(
+                PMKIDRecord(
+                    line.decode("utf-8", "replace"),
+                    *(f.decode("utf-8", "replace") for f in fields)
+                )
+            )
+        return records
+
+    def get_pmkid_hash(self, pcapng_file):
+        output = self._extract_pmkids(pcapng_file)
+        if output is None:
+            return None
 
         # Note: The dumptool will record *anything* it finds, ignoring the filterlist.
-        # Check that we got the right target (filter by BSSID)
-        matching_pmkid_hash = None
-        for line in output.split("\n"):
-            fields = line.split("*")
-            if len(fields) >= 3 and fields[1].lower() == self.bssid:
+        # Check that we got the right target (filter by BSSID).
+        # Jump between occurrences of "*bssid*" with find() rather than
+        # splitting every line; only a hit's own line is split to check that
+        # the match is the AP field (the station field looks the same).
+        bssid = self.bssid.encode()
+        needle = b"*" + bssid + b"*"
+        haystack = output.lower()
+        pos = haystack.find(needle)
+        while pos != -1:
+            start = output.rfind(b"\n", 0, pos) + 1
+            end = output.find(b"\n", pos)
+            line = output[start:] if end == -1 else output[start:end]
+            fields = line.split(b"*", 3)
+            if len(fields) >= 3 and fields[1].lower() == bssid:
                 # Found it
-                matching_pmkid_hash = line
-                break
-
-        os.remove(self.pmkid_file)
-        return matching_pmkid_hash
+                return line.decode("utf-8", "replace")
+            pos = haystack.find(needle, pos + 1)
+        return None
 
     @staticmethod
     def start_realtime_crack(
@@ -302,10 +461,17 @@ class HcxPcapTool(Dependency):
             )
             return None
 
+        # Warm the page cache while hashcat initializes its devices
+        _prefetch_file(wordlist_path)
+        _prefetch_file(hash_file_path)
+
         temp_dir = Configuration.temp()
         # Ensure BSSID is filesystem-safe for session name and temp files
         safe_bssid = target_bssid.replace(":", "").lower()
-        session_name = f'wifite_realtime_{safe_bssid}_{time.strftime("%Y%m%d%H%M%S")}'
+        # Unique per process and start, even for two starts within a second
+        session_name = (
+            f"wifite_realtime_{safe_bssid}_{os.getpid()}_{next(_session_ids)}"
+        )
 
         temp_outfile_path = os.path.join(temp_dir, f"{session_name}.out")
         temp_potfile_path = os.path.join(temp_dir, f"{session_name}.pot")
@@ -320,16 +486,12 @@ class HcxPcapTool(Dependency):
             temp_outfile_path,
             "--potfile-path",
             temp_potfile_path,
-            "--status",
-            "--status-timer",
-            "5",  # Update status every 5 seconds
             "--session",
             session_name,
+            *_REALTIME_HASHCAT_ARGS,
+            *(user_hashcat_options or ()),
         ]
 
-        if user_hashcat_options:
-            hashcat_cmd.extend(user_hashcat_options)
-
         if user_preferences:
             if user_preferences.get("force", False) or Hashcat.should_use_force():
                 hashcat_cmd.append("--force")
@@ -343,7 +505,7 @@ class HcxPcapTool(Dependency):
             # Add other preferences like --cpu-affinity if needed
 
         try:
-            # Using os.setpgrp to allow killing the entire process group
+            # Own process group, to allow killing the entire process group
             Color.pl(
                 "{+} {C}Starting Hashcat session {O}%s{C} for {O}%s{W}"
                 % (session_name, target_bssid)
@@ -354,11 +516,12 @@ class HcxPcapTool(Dependency):
             popen_object = subprocess.Popen(
                 hashcat_cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                preexec_fn=os.setpgrp,  # Creates a new process group
+                stderr=subprocess.PIPE,  # Binary; only queued lines get decoded
+                # New process group (setpgid(0, 0)), without a preexec_fn,
+                # so subprocess can still use vfork/posix_spawn
+                process_group=0,
             )
-            return RealtimeHashcatSession(
+            session = RealtimeHashcatSession(
                 popen_object=popen_object,
                 target_bssid=target_bssid,
                 hash_type=hash_type,
@@ -368,6 +531,9 @@ class HcxPcapTool(Dependency):
                 potfile_path=temp_potfile_path,
                 user_hashcat_options=user_hashcat_options,
             )
+            session.stdout_lines = _start_pipe_reader(popen_object.stdout)
+            session.stderr_lines = _start_pipe_reader(popen_object.stderr)
+            return session
         except FileNotFoundError:
             Color.pl(
                 "{!} {R}Hashcat executable not found at {O}%s{W}"
@@ -396,63 +562,44 @@ class HcxPcapTool(Dependency):
         error_lines = []
         cracked_password = None
 
-        # Non-blocking read from stdout
-        while (
-            session.popen_object.stdout
-            and select.select([session.popen_object.stdout], [], [], 0)[0]
-        ):
-            line = session.popen_object.stdout.readline()
-            if line:
-                status_lines.append(line.strip())
-            else:  # End of stream
-                break
-
-        # Non-blocking read from stderr
-        while (
-            session.popen_object.stderr
-            and select.select([session.popen_object.stderr], [], [], 0)[0]
-        ):
-            line = session.popen_object.stderr.readline()
-            if line:
-                error_lines.append(line.strip())
-            else:  # End of stream
-                break
+        # Output collected by the reader threads since the last poll
+        if session.stdout_lines is not None:
+            status_lines = _queued_lines(session.stdout_lines)
+        if session.stderr_lines is not None:
+            error_lines = _queued_lines(session.stderr_lines)
 
-        # Check outfile for cracked password
-        if (
-            os.path.exists(session.outfile_path)
-            and os.path.getsize(session.outfile_path) > 0
+        # Check outfile for cracked password. One stat() per poll; the file
+        # is only read when it changed, and then only from where the last
+        # read stopped.
+        try:
+            st = os.stat(session.outfile_path)
+        except OSError:
+            st = None
+        if st is not None and (
+            st.st_size != session.outfile_pos
+            or st.st_mtime_ns != session.outfile_mtime_ns
         ):
+            if st.st_size < session.outfile_pos:
+                session.outfile_pos = 0  # Truncated or replaced; start over
             try:
-                with open(session.outfile_path, "r") as f:
-                    # Hashcat outfile format: hash[:salt]:plain
-                    # For PMKID (16800) and HCCAPX (2500), it's usually hash:plain or hash:salt:plain
-                    # We are interested in the plain part.
-                    line = f.readline().strip()
-                    if line:
-                        parts = line.split(":")
-                        if len(parts) >= 2:  # At least hash:plain
-                            # The last part is the password, but if there are colons in password, join them back
-                            cracked_password = (
-                                ":".join(parts[1:])
-                                if session.hash_type != 2500
-                                else ":".join(parts[2:])
-                            )
-                            # For HCCAPX (2500), the format is often HCCAPX_HASH:ESSID:MAC_AP:MAC_STA:KEYMIC:EAPOL:PASSWORD
-                            # A simpler split might be needed depending on exact output.
-                            # A common output for -m 2500 is ESSID:hash:salt:password
-                            # Let's assume for now the password is the last field after splitting by colon for simplicity.
-                            # A more robust parsing might be needed depending on specific hashcat output variations.
-                            if (
-                                session.hash_type == 2500 and len(parts) > 1
-                            ):  # HCCAPX often has ESSID as first part
-                                cracked_password = parts[
-                                    -1
-                                ]  # Assume password is last part
-                            elif (
-                                session.hash_type != 2500 and len(parts) > 0
-                            ):  # For PMKID etc.
-                                cracked_password = parts[-1]
+                with open(session.outfile_path, "rb") as f:
+                    f.seek(session.outfile_pos)
+                    new_data = f.read()
+                # Leave a line hashcat is still writing for the next poll
+                complete = new_data.rfind(b"\n") + 1
+                session.outfile_pos += complete
+                session.outfile_mtime_ns = st.st_mtime_ns
+                lines = new_data[:complete].decode("utf-8", "replace").split("\n")
+                # Hashcat outfile format: hash[:salt]:plain
+                # For PMKID (16800) and HCCAPX (2500), it's usually hash:plain or hash:salt:plain
+                # We are interested in the plain part.
+                line = next((l.strip() for l in lines if l.strip()), "")
+                # The field layout before the password varies by hash type and
+                # hashcat version (HCCAPX lines also carry ESSID/MACs), so the
+                # password is taken as the last field, for every hash type.
+                _, sep, password = line.rpartition(":")
+                if sep:  # At least hash:plain
+                    cracked_password = password
 
             except Exception as e:
                 error_lines.append(f"Error reading outfile: {str(e)}")
@@ -470,47 +617,53 @@ class HcxPcapTool(Dependency):
     def stop_realtime_crack(session: RealtimeHashcatSession, cleanup_hash_file=False):
         """Stops the Hashcat process and cleans up temporary files."""
         if session and session.popen_object:
-            if session.popen_object.poll() is None:  # Process is still running
-                try:
-                    # Send SIGTERM to the entire process group
-                    os.killpg(os.getpgid(session.popen_object.pid), signal.SIGTERM)
+            proc = session.popen_object
+            # SIGTERM first, escalating to SIGKILL; stops as soon as the
+            # process is gone, so an exited hashcat costs no wait at all
+            for sig, wait_secs in _STOP_SIGNALS:
+                if proc.poll() is not None:
+                    break
+                if sig == signal.SIGKILL:
                     Color.pl(
-                        "{+} {O}Sent SIGTERM to Hashcat session for {C}%s{W}"
+                        "{!} {O}Hashcat session for {C}%s{O} did not terminate gracefully, sending SIGKILL...{W}"
                         % session.target_bssid
                     )
-                    session.popen_object.wait(
-                        timeout=3
-                    )  # Wait for graceful termination
+                try:
+                    # Signal the entire process group
+                    os.killpg(os.getpgid(proc.pid), sig)
                 except ProcessLookupError:
                     Color.pl(
                         "{!} {O}Hashcat process group for {C}%s{O} already gone.{W}"
                         % session.target_bssid
                     )
-                except subprocess.TimeoutExpired:
+                    break
+                except Exception as e:
+                    Color.pl("{!} {R}Error terminating Hashcat: {O}%s{W}" % str(e))
+                    break
+                if sig == signal.SIGTERM:
                     Color.pl(
-                        "{!} {O}Hashcat session for {C}%s{O} did not terminate gracefully, sending SIGKILL...{W}"
+                        "{+} {O}Sent SIGTERM to Hashcat session for {C}%s{W}"
                         % session.target_bssid
                     )
-                    try:
-                        os.killpg(
-                            os.getpgid(session.popen_object.pid),
-                            signal.SIGKILL,
-                        )
-                        session.popen_object.wait(timeout=1)  # Wait for kill
-                    except Exception as e:
-                        Color.pl(
-                            "{!} {R}Error sending SIGKILL to Hashcat: {O}%s{W}" % str(e)
-                        )
-                except (
-                    Exception
-                ) as e:  # Catch other errors like process already terminated
-                    Color.pl("{!} {R}Error terminating Hashcat: {O}%s{W}" % str(e))
+                try:
+                    proc.wait(timeout=wait_secs)
+                except subprocess.TimeoutExpired:
+                    pass
 
-            # Close pipes
-            if session.popen_object.stdout:
-                session.popen_object.stdout.close()
-            if session.popen_object.stderr:
-                session.popen_object.stderr.close()
+            if proc.poll() is None:
+                # The _drain_pipe() threads hold the pipe locks inside a
+                # blocked readline(), so close() would hang until hashcat
+                # exits; leave the pipes to them (they stop at EOF)
+                Color.pl(
+                    "{!} {R}Hashcat (pid {O}%d{R}) for {C}%s{R} is still running{W}"
+                    % (proc.pid, session.target_bssid)
+                )
+            else:
+                # Close pipes
+                if proc.stdout:
+                    proc.stdout.close()
+                if proc.stderr:
+                    proc.stderr.close()
 
         # Clean up temporary files
         if session.outfile_path and os.path.exists(session.outfile_path):
@@ -4,6 +4,157 @@
 from .dependency import Dependency
 from ..util.process import Process
 
+import re
+from collections import Counter
+from functools import lru_cache
+
+# Per-rank scanner run by mpirun through `sh -c`; its parameters come in via
+# `mpirun -x`. Channels are dealt round-robin (rank r takes channels r,
+# r+size, ...), so rank loads differ by at most one channel, and each rank
+# runs airodump-ng on its channels one after another.
+_MPI_SCANNER_SCRIPT = r"""
+rank=${OMPI_COMM_WORLD_RANK:-0}
+size=${OMPI_COMM_WORLD_SIZE:-1}
+set -- $WIFITE_MPI_CHANNELS
+mine=$((($# - rank + size - 1) / size))
+[ "$mine" -ge 0 ] || mine=0
+echo "[Rank $rank/$size] Ninja scanning $mine channel(s)"
+[ "$mine" -gt 0 ] || exit 0
+t=$((WIFITE_MPI_DURATION / mine))
+[ "$t" -ge 1 ] || t=1
+i=0
+for channel; do
+    if [ $((i % size)) -eq "$rank" ]; then
+        echo "[Rank $rank] Channel $channel -> ${t}s"
+        timeout "$t" airodump-ng --channel "$channel" \
+            --write "$WIFITE_MPI_DIR/ninja_rank${rank}_ch$channel" \
+            --output-format csv "$WIFITE_MPI_IFACE" >/dev/null 2>&1
+    fi
+    i=$((i + 1))
+done
+echo "[Rank $rank] Ninja scan complete for $mine channels"
+"""
+
+# Common vendor OUI prefixes (upper-case, without separators)
+VENDOR_OUIS = {
+    "001B63": "Apple",
+    "00236C": "Apple",
+    "002608": "Apple",
+    "3C0754": "Apple",
+    "0050F2": "Microsoft",
+    "00155D": "Microsoft",
+    "001DD8": "Microsoft",
+    "0016EA": "Samsung",
+    "0012FB": "Samsung",
+    "342387": "Samsung",
+    "000FDE": "Intel",
+    "001500": "Intel",
+    "00216A": "Intel",
+    "000420": "Cisco",
+    "001BD4": "Cisco",
+    "0026CA": "Cisco",
+    "002304": "Huawei",
+    "00E0FC": "Huawei",
+    "346BD3": "Huawei",
+    "001E10": "Google",
+    "001A11": "Google",
+}
+
+
+def _is_mac(field):
+    """True for a colon-separated MAC ("AA:BB:CC:DD:EE:FF")"""
+    return len(field) == 17 and field[2::3] == ":::::"
+
+
+# Keyword banks, in priority order, as one case-insensitive regex each, so
+# every bank is a single scan of the string
+_ESSID_NETWORK_TYPES = (
+    (re.compile("guest|public|free|open", re.IGNORECASE), "Guest"),
+    (re.compile("iot|smart|cam|ring|nest|alexa", re.IGNORECASE), "IoT"),
+)
+_MOBILE_PROBE_RE = re.compile("iphone|android", re.IGNORECASE)
+_COMPUTER_PROBE_RE = re.compile("laptop|windows", re.IGNORECASE)
+_PROBE_DEVICE_TYPES = (
+    (re.compile("cam|iot|smart|ring|nest", re.IGNORECASE), "IoT"),
+    (re.compile("print|canon|hp|epson", re.IGNORECASE), "Printer"),
+    (re.compile("xbox|playstation|nintendo", re.IGNORECASE), "Gaming"),
+)
+
+
+# A scan has only a handful of distinct (privacy, cipher, auth) profiles,
+# so the classifications below are memoized per profile rather than
+# re-run for every network.
+@lru_cache(maxsize=256)
+def _security_network_type(privacy, cipher, auth):
+    """Network type implied by the security fields, or None if only the ESSID can tell"""
+    privacy = privacy.lower() if privacy else ""
+    cipher = cipher.lower() if cipher else ""
+    auth = auth.lower() if auth else ""
+
+    # Enterprise networks
+    if "eap" in auth or "enterprise" in auth or "802.1x" in auth:
+        return "Enterprise"
+
+    # WPA3 detection
+    if "sae" in auth or "wpa3" in privacy or "owe" in auth:
+        return "WPA3"
+
+    # WPA2 detection
+    if "wpa2" in privacy or "ccmp" in cipher or "psk" in auth:
+        return "WPA2"
+
+    # WPA detection
+    if "wpa" in privacy and "wpa2" not in privacy:
+        return "WPA"
+
+    # WEP detection
+    if "wep" in privacy or "wep" in cipher:
+        return "WEP"
+
+    # Open networks
+    if not privacy or "none" in privacy:
+        return "Open"
+
+    return None
+
+
+@lru_cache(maxsize=256)
+def _security_stat_counter(privacy, cipher, auth):
+    """network_stats counter to bump for the security fields, or None"""
+    privacy = privacy.lower() if privacy else ""
+    cipher = cipher.lower() if cipher else ""
+    auth = auth.lower() if auth else ""
+
+    if "eap" in auth or "enterprise" in auth:
+        return "enterprise_networks"
+    elif "sae" in auth or "wpa3" in privacy:
+        return "wpa3_networks"
+    elif "wpa2" in privacy or "ccmp" in cipher:
+        return "wpa2_networks"
+    elif "wpa" in privacy and "wpa2" not in privacy:
+        return "wpa_networks"
+    elif "wep" in privacy or "wep" in cipher:
+        return "wep_networks"
+    elif not privacy or "none" in privacy:
+        return "open_networks"
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _vendor_from_oui(oui):
+    """Maps a 6-character OUI to a vendor name"""
+    vendor = VENDOR_OUIS.get(oui)
+    if vendor is not None:
+        return vendor
+
+    # Generic detection based on patterns
+    if oui.startswith("00"):
+        return "Legacy"
+    elif oui.startswith(("AC", "BC", "CC")):
+        return "Modern"
+    else:
+        return "Unknown"
+
 
 class OpenMPI(Dependency):
     """Wrapper for OpenMPI parallel processing"""
@@ -30,6 +181,7 @@ class OpenMPI(Dependency):
     def run_parallel_scan(interface, channels, scan_duration=137):
         """Run parallel airodump scan across multiple channels using MPI"""
         from ..util.color import Color
+        import os
         import subprocess
         import tempfile
         import time
@@ -46,15 +198,15 @@ class OpenMPI(Dependency):
             % (cpu_count(), scan_duration)
         )
 
-        # Create temporary directory for parallel scan results
-        temp_dir = tempfile.mkdtemp(prefix="wifite_mpi_")
+        # Create temporary directory for parallel scan results; on tmpfs
+        # (RAM) when available, since the CSVs are read back once and deleted
+        shm = "/dev/shm"
+        temp_dir = tempfile.mkdtemp(
+            prefix="wifite_mpi_",
+            dir=shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else None,
+        )
 
         try:
-            # Create MPI scanner script
-            scanner_script = OpenMPI._create_mpi_scanner_script(
-                interface, channels, scan_duration, temp_dir
-            )
-
             # Run parallel scan using MPI
             num_processes = min(len(channels), cpu_count())
             Color.pl(
@@ -71,8 +223,17 @@ class OpenMPI(Dependency):
                 str(num_processes),
                 "--allow-run-as-root",
                 "--oversubscribe",
-                "python3",
-                scanner_script,
+                "-x",
+                "WIFITE_MPI_CHANNELS=%s" % " ".join(str(c) for c in channels),
+                "-x",
+                "WIFITE_MPI_DURATION=%d" % scan_duration,
+                "-x",
+                "WIFITE_MPI_IFACE=%s" % interface,
+                "-x",
+                "WIFITE_MPI_DIR=%s" % temp_dir,
+                "sh",
+                "-c",
+                _MPI_SCANNER_SCRIPT,
             ]
 
             result = subprocess.run(
@@ -90,16 +251,24 @@ class OpenMPI(Dependency):
 
             # Show any MPI output for debugging
             if result.stdout.strip():
-                Color.pl("{+} {C}MPI Output:{W}")
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        Color.pl("    {D}%s{W}" % line)
+                Color.pl_many(
+                    ["{+} {C}MPI Output:{W}"]
+                    + [
+                        "    {D}%s{W}" % line
+                        for line in result.stdout.strip().split("\n")
+                        if line.strip()
+                    ]
+                )
 
             if result.stderr.strip():
-                Color.pl("{!} {O}MPI Warnings:{W}")
-                for line in result.stderr.strip().split("\n"):
-                    if line.strip() and "WARNING" not in line.upper():
-                        Color.pl("    {O}%s{W}" % line)
+                Color.pl_many(
+                    ["{!} {O}MPI Warnings:{W}"]
+                    + [
+                        "    {O}%s{W}" % line
+                        for line in result.stderr.strip().split("\n")
+                        if line.strip() and "WARNING" not in line.upper()
+                    ]
+                )
 
             # Aggregate results from all processes
             return OpenMPI._aggregate_scan_results(temp_dir)
@@ -115,89 +284,21 @@ class OpenMPI(Dependency):
             return None
 
         finally:
-            # Cleanup temporary files
-            import shutil
-
+            # Cleanup temporary files (the ranks only write flat CSV files)
             try:
-                shutil.rmtree(temp_dir)
-            except:
+                with os.scandir(temp_dir) as entries:
+                    for entry in entries:
+                        os.unlink(entry.path)
+                os.rmdir(temp_dir)
+            except OSError:
                 pass
 
-    @staticmethod
-    def _create_mpi_scanner_script(
-        interface, channels, scan_duration, temp_dir
-    ):
-        """Create MPI scanner script for parallel execution"""
-        import tempfile
-        import os
-
-        scanner_script_content = f"""
-#!/usr/bin/env python3
-import os
-import sys
-import subprocess
-import time
-
-# Simple rank-based parallelization without mpi4py dependency
-rank = int(os.environ.get('OMPI_COMM_WORLD_RANK', '0'))
-size = int(os.environ.get('OMPI_COMM_WORLD_SIZE', '1'))
-
-# Channel assignment for this process
-channels = {channels}
-channels_per_process = len(channels) // size
-start_idx = rank * channels_per_process
-end_idx = start_idx + channels_per_process if rank < size - 1 else len(channels)
-my_channels = channels[start_idx:end_idx]
-
-# Scan parameters
-interface = "{interface}"
-scan_duration = {scan_duration}
-temp_dir = "{temp_dir}"
-
-print(f"[Rank {{rank}}/{{size}}] Ninja scanning channels {{my_channels}}")
-
-try:
-    for channel in my_channels:
-        # Calculate time per channel
-        time_per_channel = max(1, scan_duration // len(my_channels)) if my_channels else scan_duration
-        
-        print(f"[Rank {{rank}}] Channel {{channel}} -> {{time_per_channel}}s")
-        
-        # Run airodump for this channel
-        output_prefix = f"{{temp_dir}}/ninja_rank{{rank}}_ch{{channel}}"
-        cmd = [
-            'timeout', str(time_per_channel),
-            'airodump-ng', 
-            '--channel', str(channel),
-            '--write', output_prefix,
-            '--output-format', 'csv',
-            interface
-        ]
-        
-        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        
-except Exception as e:
-    print(f"[Rank {{rank}}] Error: {{e}}")
-
-print(f"[Rank {{rank}}] Ninja scan complete for {{len(my_channels)}} channels")
-"""
-
-        # Write script to temporary file
-        script_fd, script_path = tempfile.mkstemp(
-            suffix=".py", prefix="mpi_scanner_"
-        )
-        with os.fdopen(script_fd, "w") as f:
-            f.write(scanner_script_content)
-
-        os.chmod(script_path, 0o755)
-        return script_path
-
     @staticmethod
     def _aggregate_scan_results(temp_dir):
         """Aggregate scan results from all MPI processes with comprehensive analysis"""
         from ..util.color import Color
+        from concurrent.futures import ThreadPoolExecutor
         import os
-        import glob
 
         all_targets = {}
         all_clients = {}
@@ -212,55 +313,57 @@ print(f"[Rank {{rank}}] Ninja scan complete for {{len(my_channels)}} channels")
             "hidden_networks": 0,
             "total_clients": 0,
             "unique_vendors": set(),
-            "channel_usage": {},
-            "network_types": {},
+            "channel_usage": Counter(),
+            "network_types": Counter(),
         }
 
         # Look for airodump CSV files (they end with -01.csv)
-        csv_files = glob.glob(os.path.join(temp_dir, "*-01.csv"))
+        # One readdir pass; DirEntry.stat() is cached, and empty files (ranks
+        # that never got to write) are skipped without being opened
+        with os.scandir(temp_dir) as entries:
+            csv_files = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.endswith("-01.csv") and entry.stat().st_size > 0
+            )
 
         Color.pl(
             "{+} {C}🥷 NINJA ANALYSIS:{W} Processing {G}%d{C} scan files...{W}"
             % len(csv_files)
         )
 
-        for csv_file in csv_files:
+        # A network is usually heard on several (overlapping) channels, so
+        # rows are keyed by MAC, the last file seen winning, and stats are
+        # computed once per unique network/client rather than once per row
+        ap_rows = {}
+        station_rows = {}
+        # Files are read on a small thread pool so their I/O overlaps; results
+        # are consumed in name order so "last file wins" stays deterministic
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(32, len(csv_files)))
+        ) as executor:
+            futures = [
+                (csv_file, executor.submit(OpenMPI._parse_scan_file, csv_file))
+                for csv_file in csv_files
+            ]
+        for csv_file, future in futures:
             try:
-                with open(
-                    csv_file, "r", encoding="utf-8", errors="ignore"
-                ) as f:
-                    content = f.read()
-
-                    # Split content into AP and Station sections
-                    if "Station MAC" in content:
-                        parts = content.split("Station MAC")
-                        ap_section = parts[0]
-                        station_section = (
-                            "Station MAC" + parts[1]
-                            if len(parts) > 1
-                            else ""
-                        )
-                    else:
-                        ap_section = content
-                        station_section = ""
-
-                    # Parse Access Points
-                    OpenMPI._parse_access_points(
-                        ap_section, all_targets, network_stats
-                    )
-
-                    # Parse Client Stations
-                    if station_section:
-                        OpenMPI._parse_client_stations(
-                            station_section, all_clients, network_stats
-                        )
-
+                aps, stations = future.result()
             except Exception as e:
                 Color.pl(
                     "{!} {O}Warning: Failed to parse %s: %s{W}"
                     % (csv_file, str(e))
                 )
                 continue
+            for parts in aps:
+                ap_rows[parts[0].upper()] = parts
+            for parts in stations:
+                station_rows[parts[0].upper()] = parts
+
+        OpenMPI._parse_access_points(ap_rows, all_targets, network_stats)
+        OpenMPI._parse_client_stations(
+            station_rows, all_clients, network_stats
+        )
 
         # Display comprehensive analysis
         OpenMPI._display_network_intelligence(
@@ -331,156 +434,124 @@ print(f"[Rank {{rank}}] Ninja scan complete for {{len(my_channels)}} channels")
         return OpenMPI.run_parallel_scan(interface, all_channels, scan_time)
 
     @staticmethod
-    def _parse_access_points(ap_section, all_targets, network_stats):
-        """Parse access points from airodump CSV output"""
-
-        lines = ap_section.strip().split("\n")
+    def _split_rows(section, min_fields):
+        """
+        Splits one section of an airodump CSV into rows of stripped fields,
+        keeping only rows whose first field is a MAC (which drops headers).
+        The MAC is checked on the raw line, before the row is split.
+        """
+        rows = []
+        lines = section.strip().split("\n")
         for line in lines[1:]:  # Skip header
-            if line.strip() and "BSSID" not in line:
-                parts = [p.strip() for p in line.split(", ")]
-                if len(parts) >= 14 and parts[0] and ":" in parts[0]:
-                    bssid = parts[0].upper()
-                    if bssid and bssid != "BSSID":
-                        # Extract network information
-                        privacy = parts[5] if len(parts) > 5 else ""
-                        cipher = parts[6] if len(parts) > 6 else ""
-                        auth = parts[7] if len(parts) > 7 else ""
-                        power = parts[8] if len(parts) > 8 else ""
-                        beacons = parts[9] if len(parts) > 9 else ""
-                        iv = parts[10] if len(parts) > 10 else ""
-                        lan_ip = parts[11] if len(parts) > 11 else ""
-                        id_length = parts[12] if len(parts) > 12 else ""
-                        essid = parts[13] if len(parts) > 13 else ""
-                        key = parts[14] if len(parts) > 14 else ""
-
-                        # Detect network type and security
-                        network_type = OpenMPI._detect_network_type(
-                            privacy, cipher, auth, essid
-                        )
-                        vendor = OpenMPI._detect_vendor_from_mac(bssid)
-
-                        # Store enhanced network info
-                        enhanced_parts = parts + [network_type, vendor]
-                        all_targets[bssid] = enhanced_parts
-
-                        # Update statistics
-                        network_stats["total_networks"] += 1
-                        OpenMPI._update_security_stats(
-                            network_stats, privacy, cipher, auth
-                        )
-
-                        if not essid or essid == "":
-                            network_stats["hidden_networks"] += 1
-
-                        # Track channel usage
-                        try:
-                            channel = (
-                                int(parts[3])
-                                if len(parts) > 3 and parts[3].isdigit()
-                                else 0
-                            )
-                            if channel > 0:
-                                network_stats["channel_usage"][channel] = (
-                                    network_stats["channel_usage"].get(
-                                        channel, 0
-                                    )
-                                    + 1
-                                )
-                        except:
-                            pass
-
-                        # Track network types
-                        network_stats["network_types"][network_type] = (
-                            network_stats["network_types"].get(
-                                network_type, 0
-                            )
-                            + 1
-                        )
-                        network_stats["unique_vendors"].add(vendor)
+            comma = line.find(",")
+            if comma == -1 or not _is_mac(line[:comma].strip()):
+                continue
+            parts = [p.strip() for p in line.split(", ")]
+            if len(parts) >= min_fields:
+                rows.append(parts)
+        return rows
 
     @staticmethod
-    def _parse_client_stations(station_section, all_clients, network_stats):
-        """Parse client stations from airodump CSV output"""
-        lines = station_section.strip().split("\n")
-        for line in lines[1:]:  # Skip header
-            if line.strip() and "Station MAC" not in line:
-                parts = [p.strip() for p in line.split(", ")]
-                if len(parts) >= 6 and parts[0] and ":" in parts[0]:
-                    station_mac = parts[0].upper()
-                    first_time = parts[1] if len(parts) > 1 else ""
-                    last_time = parts[2] if len(parts) > 2 else ""
-                    power = parts[3] if len(parts) > 3 else ""
-                    packets = parts[4] if len(parts) > 4 else ""
-                    bssid = parts[5] if len(parts) > 5 else ""
-                    probed_essids = parts[6] if len(parts) > 6 else ""
-
-                    # Analyze client information
-                    vendor = OpenMPI._detect_vendor_from_mac(station_mac)
-                    device_type = OpenMPI._detect_device_type(
-                        station_mac, probed_essids
-                    )
-
-                    client_info = {
-                        "mac": station_mac,
-                        "first_seen": first_time,
-                        "last_seen": last_time,
-                        "power": power,
-                        "packets": packets,
-                        "associated_bssid": bssid,
-                        "probed_essids": probed_essids,
-                        "vendor": vendor,
-                        "device_type": device_type,
-                    }
-
-                    all_clients[station_mac] = client_info
-                    network_stats["total_clients"] += 1
-                    network_stats["unique_vendors"].add(vendor)
+    def _parse_scan_file(csv_file):
+        """Returns (AP rows, station rows) of one airodump CSV file"""
+        with open(csv_file, "rb") as f:
+            content = f.read().decode("utf-8", "ignore")
+
+        # Split content into AP and Station sections
+        split_at = content.find("Station MAC")
+        if split_at == -1:
+            ap_section, station_section = content, ""
+        else:
+            ap_section = content[:split_at]
+            station_section = content[split_at:]
+
+        return (
+            OpenMPI._split_rows(ap_section, 14),
+            OpenMPI._split_rows(station_section, 6),
+        )
+
+    @staticmethod
+    def _parse_access_points(ap_rows, all_targets, network_stats):
+        """Adds access points (dict of BSSID -> CSV row) to the scan results"""
+        channels = []
+        network_types = []
+        for bssid, parts in ap_rows.items():
+            # Extract network information (_split_rows guarantees 14 fields)
+            privacy, cipher, auth = parts[5:8]
+            essid = parts[13]
+
+            # Detect network type and security
+            network_type = OpenMPI._detect_network_type(
+                privacy, cipher, auth, essid
+            )
+            vendor = OpenMPI._detect_vendor_from_mac(bssid)
+
+            # Store enhanced network info
+            enhanced_parts = parts + [network_type, vendor]
+            all_targets[bssid] = enhanced_parts
+
+            # Update statistics
+            network_stats["total_networks"] += 1
+            OpenMPI._update_security_stats(network_stats, privacy, cipher, auth)
+
+            if not essid:
+                network_stats["hidden_networks"] += 1
+
+            # Track channel usage and network types (tallied below)
+            channel = parts[3]
+            if channel.isdecimal() and int(channel) > 0:
+                channels.append(int(channel))
+            network_types.append(network_type)
+            network_stats["unique_vendors"].add(vendor)
+
+        # One C-level count per statistic instead of a dict update per row
+        network_stats["channel_usage"].update(channels)
+        network_stats["network_types"].update(network_types)
+
+    @staticmethod
+    def _parse_client_stations(station_rows, all_clients, network_stats):
+        """Adds client stations (dict of MAC -> CSV row) to the scan results"""
+        for station_mac, parts in station_rows.items():
+            first_time = parts[1] if len(parts) > 1 else ""
+            last_time = parts[2] if len(parts) > 2 else ""
+            power = parts[3] if len(parts) > 3 else ""
+            packets = parts[4] if len(parts) > 4 else ""
+            bssid = parts[5] if len(parts) > 5 else ""
+            probed_essids = parts[6] if len(parts) > 6 else ""
+
+            # Analyze client information
+            vendor = OpenMPI._detect_vendor_from_mac(station_mac)
+            device_type = OpenMPI._detect_device_type(
+                station_mac, probed_essids
+            )
+
+            client_info = {
+                "mac": station_mac,
+                "first_seen": first_time,
+                "last_seen": last_time,
+                "power": power,
+                "packets": packets,
+                "associated_bssid": bssid,
+                "probed_essids": probed_essids,
+                "vendor": vendor,
+                "device_type": device_type,
+            }
+
+            all_clients[station_mac] = client_info
+            network_stats["total_clients"] += 1
+            network_stats["unique_vendors"].add(vendor)
 
     @staticmethod
     def _detect_network_type(privacy, cipher, auth, essid):
         """Detect network type based on security parameters"""
-        privacy = privacy.lower() if privacy else ""
-        cipher = cipher.lower() if cipher else ""
-        auth = auth.lower() if auth else ""
-        essid = essid.lower() if essid else ""
-
-        # Enterprise networks
-        if "eap" in auth or "enterprise" in auth or "802.1x" in auth:
-            return "Enterprise"
-
-        # WPA3 detection
-        if "sae" in auth or "wpa3" in privacy or "owe" in auth:
-            return "WPA3"
-
-        # WPA2 detection
-        if "wpa2" in privacy or "ccmp" in cipher or "psk" in auth:
-            return "WPA2"
-
-        # WPA detection
-        if "wpa" in privacy and "wpa2" not in privacy:
-            return "WPA"
-
-        # WEP detection
-        if "wep" in privacy or "wep" in cipher:
-            return "WEP"
-
-        # Open networks
-        if not privacy or privacy == "" or "none" in privacy:
-            return "Open"
-
-        # Guest networks
-        if any(
-            keyword in essid
-            for keyword in ["guest", "public", "free", "open"]
-        ):
-            return "Guest"
-
-        # IoT/Smart devices
-        if any(
-            keyword in essid
-            for keyword in ["iot", "smart", "cam", "ring", "nest", "alexa"]
-        ):
-            return "IoT"
+        network_type = _security_network_type(privacy, cipher, auth)
+        if network_type is not None:
+            return network_type
+
+        essid = essid or ""
+        for pattern, network_type in _ESSID_NETWORK_TYPES:
+            if pattern.search(essid):
+                return network_type
 
         return "Unknown"
 
@@ -490,110 +561,41 @@ print(f"[Rank {{rank}}] Ninja scan complete for {{len(my_channels)}} channels")
         if not mac_address or len(mac_address) < 8:
             return "Unknown"
 
-        oui = mac_address[:8].upper().replace(":", "")
-
-        # Common vendor OUI prefixes
-        vendor_ouis = {
-            "00:1B:63": "Apple",
-            "00:23:6C": "Apple",
-            "00:26:08": "Apple",
-            "3C:07:54": "Apple",
-            "00:50:F2": "Microsoft",
-            "00:15:5D": "Microsoft",
-            "00:1D:D8": "Microsoft",
-            "00:16:EA": "Samsung",
-            "00:12:FB": "Samsung",
-            "34:23:87": "Samsung",
-            "00:0F:DE": "Intel",
-            "00:15:00": "Intel",
-            "00:21:6A": "Intel",
-            "00:04:20": "Cisco",
-            "00:1B:D4": "Cisco",
-            "00:26:CA": "Cisco",
-            "00:23:04": "Huawei",
-            "00:E0:FC": "Huawei",
-            "34:6B:D3": "Huawei",
-            "00:1E:10": "Google",
-            "00:1A:11": "Google",
-        }
-
-        # Check exact OUI match first
-        for vendor_oui, vendor_name in vendor_ouis.items():
-            if oui.startswith(vendor_oui.replace(":", "")):
-                return vendor_name
+        return _vendor_from_oui(mac_address[:8].replace(":", "")[:6].upper())
 
-        # Generic detection based on patterns
-        if oui.startswith("00"):
-            return "Legacy"
-        elif oui.startswith(("AC", "BC", "CC")):
-            return "Modern"
-        else:
-            return "Unknown"
+    @staticmethod
+    def precompute_vendors(mac_addresses):
+        """Resolve vendors for many MACs in one pass. Returns dict of MAC -> vendor"""
+        detect = OpenMPI._detect_vendor_from_mac
+        return {mac: detect(mac) for mac in mac_addresses}
 
     @staticmethod
     def _detect_device_type(mac_address, probed_essids):
         """Detect device type based on MAC and probed networks"""
         vendor = OpenMPI._detect_vendor_from_mac(mac_address)
-        probed = probed_essids.lower() if probed_essids else ""
+        probed = probed_essids or ""
 
         # Mobile devices
-        if (
-            vendor in ["Apple", "Samsung"]
-            or "iphone" in probed
-            or "android" in probed
-        ):
+        if vendor in ("Apple", "Samsung") or _MOBILE_PROBE_RE.search(probed):
             return "Mobile"
 
         # Laptops/Computers
-        if (
-            vendor in ["Intel", "Microsoft"]
-            or "laptop" in probed
-            or "windows" in probed
-        ):
+        if vendor in ("Intel", "Microsoft") or _COMPUTER_PROBE_RE.search(probed):
             return "Computer"
 
-        # IoT devices
-        if any(
-            iot_term in probed
-            for iot_term in ["cam", "iot", "smart", "ring", "nest"]
-        ):
-            return "IoT"
-
-        # Printers
-        if any(
-            printer_term in probed
-            for printer_term in ["print", "canon", "hp", "epson"]
-        ):
-            return "Printer"
-
-        # Gaming devices
-        if any(
-            gaming_term in probed
-            for gaming_term in ["xbox", "playstation", "nintendo"]
-        ):
-            return "Gaming"
+        # IoT devices, printers, gaming devices
+        for pattern, device_type in _PROBE_DEVICE_TYPES:
+            if pattern.search(probed):
+                return device_type
 
         return "Unknown"
 
     @staticmethod
     def _update_security_stats(network_stats, privacy, cipher, auth):
         """Update security statistics based on network parameters"""
-        privacy = privacy.lower() if privacy else ""
-        cipher = cipher.lower() if cipher else ""
-        auth = auth.lower() if auth else ""
-
-        if "eap" in auth or "enterprise" in auth:
-            network_stats["enterprise_networks"] += 1
-        elif "sae" in auth or "wpa3" in privacy:
-            network_stats["wpa3_networks"] += 1
-        elif "wpa2" in privacy or "ccmp" in cipher:
-            network_stats["wpa2_networks"] += 1
-        elif "wpa" in privacy and "wpa2" not in privacy:
-            network_stats["wpa_networks"] += 1
-        elif "wep" in privacy or "wep" in cipher:
-            network_stats["wep_networks"] += 1
-        elif not privacy or privacy == "" or "none" in privacy:
-            network_stats["open_networks"] += 1
+        counter = _security_stat_counter(privacy, cipher, auth)
+        if counter is not None:
+            network_stats[counter] += 1
 
     @staticmethod
     def _display_network_intelligence(
@@ -602,92 +604,90 @@ print(f"[Rank {{rank}}] Ninja scan complete for {{len(my_channels)}} channels")
         """Display comprehensive network intelligence analysis"""
         from ..util.color import Color
 
-        Color.pl("")
-        Color.pl("{+} {R}🥷 NINJA NETWORK INTELLIGENCE REPORT{W}")
-        Color.pl("{+} {G}=" * 60 + "{W}")
+        if not network_stats["total_networks"] and not network_stats["total_clients"]:
+            # Nothing heard (dead band, failed capture); skip the all-zero report
+            Color.pl("{+} {O}No networks observed.{W}")
+            return
+
+        # The report is ~40 lines; collect it and print it with one write
+        out = []
+        out.append("")
+        out.append("{+} {R}🥷 NINJA NETWORK INTELLIGENCE REPORT{W}")
+        out.append("{+} {G}=" * 60 + "{W}")
 
         # Network overview
-        Color.pl("{+} {C}📡 NETWORK OVERVIEW:{W}")
-        Color.pl(
+        out.append("{+} {C}📡 NETWORK OVERVIEW:{W}")
+        out.append(
             "  {G}Total Networks:{W} {C}%d{W}"
             % network_stats["total_networks"]
         )
-        Color.pl(
+        out.append(
             "  {G}Total Clients:{W} {C}%d{W}"
             % network_stats["total_clients"]
         )
-        Color.pl(
+        out.append(
             "  {G}Hidden Networks:{W} {C}%d{W}"
             % network_stats["hidden_networks"]
         )
-        Color.pl(
+        out.append(
             "  {G}Unique Vendors:{W} {C}%d{W}"
             % len(network_stats["unique_vendors"])
         )
 
         # Security analysis
-        Color.pl("")
-        Color.pl("{+} {C}🔒 SECURITY ANALYSIS:{W}")
-        Color.pl(
+        out.append("")
+        out.append("{+} {C}🔒 SECURITY ANALYSIS:{W}")
+        out.append(
             "  {R}Open Networks:{W} {C}%d{W}"
             % network_stats["open_networks"]
         )
-        Color.pl(
+        out.append(
             "  {O}WEP Networks:{W} {C}%d{W}" % network_stats["wep_networks"]
         )
-        Color.pl(
+        out.append(
             "  {Y}WPA Networks:{W} {C}%d{W}" % network_stats["wpa_networks"]
         )
-        Color.pl(
+        out.append(
             "  {G}WPA2 Networks:{W} {C}%d{W}"
             % network_stats["wpa2_networks"]
         )
-        Color.pl(
+        out.append(
             "  {G}WPA3 Networks:{W} {C}%d{W}"
             % network_stats["wpa3_networks"]
         )
-        Color.pl(
+        out.append(
             "  {B}Enterprise:{W} {C}%d{W}"
             % network_stats["enterprise_networks"]
         )
 
         # Network types
         if network_stats["network_types"]:
-            Color.pl("")
-            Color.pl("{+} {C}🏷️  NETWORK TYPES:{W}")
-            for net_type, count in sorted(
-                network_stats["network_types"].items(),
-                key=lambda x: x[1],
-                reverse=True,
-            ):
-                Color.pl("  {G}%s:{W} {C}%d{W}" % (net_type, count))
+            out.append("")
+            out.append("{+} {C}🏷️  NETWORK TYPES:{W}")
+            for net_type, count in network_stats["network_types"].most_common():
+                out.append("  {G}%s:{W} {C}%d{W}" % (net_type, count))
 
         # Channel usage
         if network_stats["channel_usage"]:
-            Color.pl("")
-            Color.pl("{+} {C}📶 CHANNEL USAGE:{W}")
-            sorted_channels = sorted(
-                network_stats["channel_usage"].items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )[:10]
-            for channel, count in sorted_channels:
+            out.append("")
+            out.append("{+} {C}📶 CHANNEL USAGE:{W}")
+            for channel, count in network_stats["channel_usage"].most_common(10):
                 band = "2.4GHz" if channel <= 14 else "5GHz"
-                Color.pl(
+                out.append(
                     "  {G}Ch %d (%s):{W} {C}%d networks{W}"
                     % (channel, band, count)
                 )
 
         # Top vendors
         if network_stats["unique_vendors"]:
-            Color.pl("")
-            Color.pl("{+} {C}🏭 DETECTED VENDORS:{W}")
+            out.append("")
+            out.append("{+} {C}🏭 DETECTED VENDORS:{W}")
             vendor_list = list(network_stats["unique_vendors"])[:10]
-            Color.pl("  {G}%s{W}" % ", ".join(vendor_list))
+            out.append("  {G}%s{W}" % ", ".join(vendor_list))
 
         # Risk assessment
-        Color.pl("")
-        Color.pl("{+} {C}⚠️  RISK ASSESSMENT:{W}")
+        out.append("")
+        out.append("{+} {C}⚠️  RISK ASSESSMENT:{W}")
         total = network_stats["total_networks"]
         if total > 0:
             risk_score = (
@@ -704,10 +704,11 @@ print(f"[Rank {{rank}}] Ninja scan complete for {{len(my_channels)}} channels")
             else:
                 risk_level = "{G}LOW{W}"
 
-            Color.pl(
+            out.append(
                 "  {G}Environment Risk Level:{W} %s {C}(%.1f){W}"
                 % (risk_level, risk_score)
             )
 
-        Color.pl("")
-        Color.pl("{+} {G}🥷 Ninja analysis complete!{W}")
+        out.append("")
+        out.append("{+} {G}🥷 Ninja analysis complete!{W}")
+        Color.pl_many(out)
@@ -1,7 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import re
+import shutil
 import sys
+from functools import lru_cache
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_ANSI_RE_BYTES = re.compile(rb"\x1b\[[0-9;]*m")
 
 
 class Color(object):
@@ -50,6 +56,23 @@ class Color(object):
         Color.p("%s\n" % text)
         Color.last_sameline_length = 0
 
+    @staticmethod
+    def pl_many(lines):
+        """Prints several lines (colored format) with a single write."""
+        if not lines:
+            return
+        sys.stdout.write(Color.s("\n".join(lines) + "\n"))
+        sys.stdout.flush()
+        Color.last_sameline_length = 0
+
+    @staticmethod
+    def debug(text):
+        """Prints text like pl(), but only in verbose mode (-v)."""
+        from ..config import Configuration
+
+        if Configuration.verbose:
+            Color.pl(text)
+
     @staticmethod
     def pe(text):
         """Prints text using colored format with leading and trailing new line to STDERR."""
@@ -59,18 +82,34 @@ class Color(object):
     @staticmethod
     def s(text):
         """Returns colored string"""
-        output = text
-        for key, value in Color.replacements.items():
-            output = output.replace(key, value)
-        for key, value in Color.colors.items():
-            output = output.replace("{%s}" % key, value)
-        return output
+        if "{" not in text:
+            return text  # No tags to expand
+        return _colorize(text)
 
     @staticmethod
     def strip(text):
-        '''Remove ANSI color codes from a string.'''
-        import re
-        return re.sub(r'\x1b\[[0-9;]*m', '', text)
+        '''Remove ANSI color codes from a string (or bytes).'''
+        if isinstance(text, bytes):
+            return _ANSI_RE_BYTES.sub(b'', text)
+        return _ANSI_RE.sub('', text)
+
+    @staticmethod
+    def contains(text, needle):
+        '''
+        True if `needle` appears in the visible (color-stripped) `text`.
+        Searches the colored text first and only strips it as a fallback.
+        '''
+        if "\x1b" not in needle:
+            start = text.find(needle)
+            while start != -1:
+                # The match itself has no ESC, so only an escape code opened
+                # before it could overlap it.
+                esc = text.rfind("\x1b", 0, start)
+                code = _ANSI_RE.match(text, esc) if esc != -1 else None
+                if code is None or code.end() <= start:
+                    return True
+                start = text.find(needle, start + 1)
+        return needle in Color.strip(text)
 
     @staticmethod
     def clear_line():
@@ -81,10 +120,9 @@ class Color(object):
 
     @staticmethod
     def clear_entire_line():
-        import os
-
-        (rows, columns) = os.popen("stty size", "r").read().split()
-        Color.p("\r" + (" " * int(columns)) + "\r")
+        # Falls back to 80 columns when stdout is not a terminal
+        columns = shutil.get_terminal_size().columns
+        Color.p("\r" + (" " * columns) + "\r")
 
     @staticmethod
     def pattack(attack_type, target, attack_name, progress):
@@ -127,6 +165,20 @@ class Color(object):
             Color.pl(err)
 
 
+@lru_cache(maxsize=512)
+def _colorize(text):
+    """
+    Expands Color's {X} tags. Memoized: most messages are fixed strings
+    printed over and over (banners, prompts, status prefixes).
+    """
+    output = text
+    for key, value in Color.replacements.items():
+        output = output.replace(key, value)
+    for key, value in Color.colors.items():
+        output = output.replace("{%s}" % key, value)
+    return output
+
+
 if __name__ == "__main__":
     Color.pl("{R}Testing{G}One{C}Two{P}Three{W}Done")
     print(Color.s("{C}Testing{P}String{W}"))
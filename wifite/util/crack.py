@@ -7,7 +7,6 @@ from ..model.wpa_result import CrackResultWPA
 from ..model.pmkid_result import CrackResultPMKID
 from ..util.process import Process
 from ..util.color import Color
-from ..util.input import raw_input
 from ..tools.aircrack import Aircrack
 from ..tools.cowpatty import Cowpatty
 from ..tools.hashcat import Hashcat, HcxPcapTool
@@ -35,7 +34,7 @@ class CrackHelper:
         # Get wordlist
         if not Configuration.wordlist:
             Color.p("\n{+} Enter wordlist file to use for cracking: {G}")
-            Configuration.wordlist = raw_input()
+            Configuration.wordlist = input()
             if not os.path.exists(Configuration.wordlist):
                 Color.pl(
                     "{!} {R}Wordlist {O}%s{R} not found. Exiting."
@@ -88,7 +87,7 @@ class CrackHelper:
                 "\n{+} Enter the {C}cracking tool{W} to use ({C}%s{W}): {G}"
                 % ("{W}, {C}".join(available_tools.keys()))
             )
-            tool_name = raw_input()
+            tool_name = input()
             if tool_name not in available_tools:
                 Color.pl(
                     '{!} {R}"%s"{O} tool not found, defaulting to {C}aircrack{W}'
@@ -111,7 +110,7 @@ class CrackHelper:
     def is_cracked(cls, file):
         if not os.path.exists(Configuration.cracked_file):
             return False
-        with open(Configuration.cracked_file) as f:
+        with open(Configuration.cracked_file, "rb") as f:
             json = loads(f.read())
         if json is None:
             return False
@@ -229,7 +228,7 @@ class CrackHelper:
             "{+} Select handshake(s) to crack ({G}%d{W}-{G}%d{W}, select multiple with {C},{W} or {C}-{W} or {C}all{W}): {G}"
             % (1, len(handshakes))
         )
-        choices = raw_input()
+        choices = input()
 
         selection = []
         for choice in choices.split(","):
@@ -4,6 +4,7 @@
 import time
 import signal
 import os
+import shutil
 
 from subprocess import Popen, PIPE
 
@@ -71,14 +72,8 @@ class Process(object):
     @staticmethod
     def exists(program):
         """Checks if program is installed on this system"""
-        p = Process(["which", program])
-        stdout = p.stdout().strip()
-        stderr = p.stderr().strip()
-
-        if stdout == "" and stderr == "":
-            return False
-
-        return True
+        # Same PATH lookup as `which`, without spawning it
+        return shutil.which(program) is not None
 
     def __init__(
         self,
@@ -10,7 +10,6 @@ from .util.scanner import Scanner
 from .util.process import Process
 from .util.color import Color
 from .util.crack import CrackHandshake
-from .util.input import raw_input
 from .attack.wep import AttackWEP
 from .attack.wpa import AttackWPA
 from .attack.wps import AttackWPS
@@ -18,7 +17,6 @@ from .attack.eviltwin import EvilTwinAttack
 from .model.result import CrackResult
 from .model.handshake import Handshake
 
-import json
 import os
 import sys
 
@@ -101,8 +99,7 @@ class Wifite(object):
             Color.pl('{!} {O}file {C}%s{O} not found{W}' % name)
             return
 
-        with open(name, 'r') as fid:
-            cracked_targets = json.loads(fid.read())
+        cracked_targets = CrackResult.load_all()
 
         if len(cracked_targets) == 0:
             Color.pl('{!} {R}no results found in {O}%s{W}' % name)
@@ -257,7 +254,7 @@ class Wifite(object):
         prompt = Color.s('{+} type {G}c{W} to {G}continue{W}' +
                          ' or {R}s{W} to {R}stop{W}: ')
 
-        if raw_input(prompt).lower().startswith('s'):
+        if input(prompt).lower().startswith('s'):
             return False
         else:
             return True